@@ -10,6 +10,7 @@ from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 
+from app.middleware import RequestDecompressionMiddleware
 from config import config
 
 # Initialize extensions
@@ -37,6 +38,13 @@ def create_app(config_name='default'):
     db.init_app(app)
     migrate.init_app(app, db)
 
+    # Accept gzip/deflate request bodies (imports and other large uploads)
+    app.wsgi_app = RequestDecompressionMiddleware(app.wsgi_app, app.config)
+
+    # Compress large buffered responses (gzip, or zstd when available)
+    from app import compression
+    compression.init_app(app)
+
     # Configure CORS with environment-specific origins
     CORS(app, origins=app.config.get('CORS_ORIGINS', []))
 
@@ -1,10 +1,11 @@
 """
 Health check API endpoint.
 
-Provides a simple health check endpoint to verify the backend is running.
+Provides a simple health check endpoint to verify the backend is running,
+and per-worker cache counters for monitoring.
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
 
 health_bp = Blueprint('health', __name__)
 
@@ -21,3 +22,27 @@ def health_check():
         'status': 'ok',
         'message': 'Flask backend is running'
     }), 200
+
+
+# Reported cache name -> app.extensions key
+CACHES = {
+    'list_results': 'projects_results',
+    'project_fragments': 'projects_fragments',
+    'compressed_bodies': 'response_compression',
+}
+
+
+@health_bp.route('/health/caches', methods=['GET'])
+def cache_stats():
+    """
+    Report the counters of this worker's caches.
+
+    Returns:
+        JSON object of cache name -> stats (entries, hits, misses, ...), or
+        null for a cache that has not been used yet
+    """
+    stats = {}
+    for name, key in CACHES.items():
+        cache = current_app.extensions.get(key)
+        stats[name] = cache.stats() if cache is not None else None
+    return jsonify(stats), 200
@@ -4,19 +4,77 @@ Projects API endpoints.
 Provides REST API for managing projects including list, get, and create operations.
 """
 
-from flask import Blueprint, jsonify, request, current_app
-from app.models.project import Project
+import base64
+import hashlib
+import json
+import operator
+from datetime import datetime, timezone
+from itertools import islice
+
+from flask import Blueprint, jsonify, request, current_app, stream_with_context
+from app.models.project import (
+    Project, FTS_COLUMNS, SERIALIZED_FIELDS, VALID_CLASSIFICATIONS, VALID_PROJECT_TYPES,
+    VALID_STATUSES, fts_supported, row_serializer, serialized_columns
+)
+from app.services.change_counter import bump_projects_generation, projects_generation
+from app.services.project_bulk import BULK_MODES, bulk_create
+from app.services.project_fragments import encode_rows
+from app.services.result_cache import list_result_cache, result_cache_key
+from app.services.project_index import INDEXED_COLUMNS, schedule_rebuild, warm_index
+from app.services.project_import import (
+    CONFLICT_KEYS, CONFLICT_MODES, DUPLICATE_PATH_ERROR, ProjectImporter, RejectedItem,
+    supports_conflict_mode
+)
 from app import db
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import or_
+import sqlalchemy as sa
+from sqlalchemy import and_, func, inspect, literal_column, or_
+from werkzeug.exceptions import HTTPException, RequestEntityTooLarge
 
 projects_bp = Blueprint('projects', __name__)
 
 
-# Validation constants
-VALID_CLASSIFICATIONS = ['primary', 'secondary', 'archive', 'maintenance']
-VALID_STATUSES = ['active', 'paused', 'completed', 'cancelled']
-VALID_PROJECT_TYPES = ['Work', 'Personal', 'Learning', 'Inactive']
+# External-content FTS5 index over projects (see app.models.project)
+projects_fts = sa.table('projects_fts', sa.column('rowid'))
+
+# Trigram tokenizer cannot match terms shorter than three characters
+FTS_MIN_TERM_LENGTH = 3
+
+# Streamed line-delimited JSON media type for GET /api/projects
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+# Fields PATCH /api/projects/<id> may change
+UPDATABLE_FIELDS = (
+    'name', 'path', 'organization', 'classification', 'status', 'description', 'remote_url'
+)
+
+# Timestamp range filters for GET /api/projects: parameter -> (column, comparison)
+RANGE_FILTERS = {
+    'created_after': ('created_at', operator.gt),
+    'created_before': ('created_at', operator.lt),
+    'updated_after': ('updated_at', operator.gt),
+    'updated_before': ('updated_at', operator.lt),
+}
+
+# Values PUT /api/projects/<id>/archive (and PUT /api/projects/archive) write
+ARCHIVED_VALUES = {'classification': 'archive', 'status': 'completed'}
+
+# List filters a bulk write may select projects by (see _bulk_condition)
+BULK_FILTERS = ('status', 'organization', 'classification', 'project_type', 'search',
+                *RANGE_FILTERS)
+
+# Fields PATCH /api/projects may set on many projects at once (path is unique per project)
+BULK_UPDATABLE_FIELDS = tuple(field for field in UPDATABLE_FIELDS if field != 'path')
+
+# Range of a signed 64-bit SQL INTEGER; larger Python ints cannot be bound as parameters
+SQL_INTEGER_RANGE = (-2 ** 63, 2 ** 63 - 1)
+
+# Keyset pagination order: (column, descending) pairs, always ending with the unique id
+LIST_SORT_KEYS = [(Project.id, False)]
+
+# Columns GET /api/projects can sort by (sort=name,-updated_at). Nullable columns
+# are left out: keyset pagination cannot seek past NULLs.
+SORTABLE_COLUMNS = ('id', 'name', 'status', 'created_at', 'updated_at')
 
 
 def validate_project_data(data):
@@ -53,21 +111,27 @@ def validate_project_data(data):
     return None, None
 
 
-@projects_bp.route('/projects', methods=['GET', 'POST'])
+@projects_bp.route('/projects', methods=['GET', 'POST', 'PATCH', 'DELETE'])
 def projects():
     """
-    Handle GET and POST requests for projects collection.
+    Handle GET, POST, PATCH and DELETE requests for projects collection.
 
-    GET: List all projects
+    GET: List all projects (HEAD: headers only)
     POST: Create a new project
+    PATCH: Update every project selected by IDs or list filters
+    DELETE: Permanently delete every project selected by IDs or list filters
     """
-    if request.method == 'GET':
+    if request.method in ('GET', 'HEAD'):
         return list_projects()
     elif request.method == 'POST':
         return create_project()
+    elif request.method == 'PATCH':
+        return bulk_update_projects()
+    elif request.method == 'DELETE':
+        return bulk_delete_projects()
 
 
-def list_projects():
+def list_projects(serve_stale=True):
     """
     List all projects with optional filtering.
 
@@ -76,53 +140,810 @@ def list_projects():
         - organization: Filter by organization name
         - classification: Filter by classification (primary, secondary, archive, maintenance)
         - project_type: Filter by project type (Work, Personal, Learning, Inactive)
+          (status, organization, classification and project_type each accept a
+          comma-separated list of values, matched with IN)
+        - created_after, created_before, updated_after, updated_before: ISO 8601
+          date or datetime bounds (exclusive) on created_at / updated_at
+        - search: Substring search in name, description, organization and path
+        - sort: 'relevance' to order search matches by BM25 score, or a
+          comma-separated list of SORTABLE_COLUMNS, each optionally prefixed
+          with '-' for descending order (default: id)
+        - limit: Page size; enables keyset pagination
+        - cursor: Opaque cursor from a previous page's next_cursor
+        - stream: When true, stream the JSON array incrementally
+        - fields: Comma-separated subset of project fields to load and return
+        - count: When true, report the number of matching projects (across all
+          pages) in an X-Total-Count header
+
+    Args:
+        serve_stale: Allow a stale cached response (stale-while-revalidate);
+            False when refreshing that response
+
+    Returns:
+        JSON array of projects ordered by ID, filtered by query parameters.
+        When limit or cursor is given, a page object with projects and next_cursor.
+        With Accept: application/x-ndjson, one streamed JSON object per line.
+        304 (empty) when If-None-Match matches the current ETag of the result.
+        HEAD returns the ETag (and X-Total-Count) without loading any rows.
+
+    Buffered and paginated responses are cached per worker until the next write
+    (see app.services.result_cache), and concurrent identical requests that miss
+    the cache share one build; streamed responses are never cached. With
+    PROJECTS_STALE_WHILE_REVALIDATE set, a recently invalidated response is
+    served (with Age and Warning headers) and refreshed after it is sent.
+    """
+    sort_keys, error = _requested_sort(request.args)
+    if error:
+        return error
+
+    fields, error = _requested_fields(request.args)
+    if error:
+        return error
+
+    query, error = _filtered_projects_query(request.args, rank_by_relevance=sort_keys is None)
+    if error:
+        return error
+
+    ndjson = _prefers_ndjson()
+    counted = request.args.get('count', '').lower() in ('1', 'true')
+    if request.method == 'HEAD':
+        generation = projects_generation()
+        total = _list_total(query, generation) if counted else None
+        mimetype = NDJSON_MIMETYPE if ndjson else 'application/json'
+        return _cached_list_response(b'', mimetype, _list_etag(generation, ndjson), total)
+
+    streamed = ndjson or request.args.get('stream', '').lower() in ('1', 'true')
+    cache_key = None if streamed else result_cache_key(request.args, 'json')
+    if cache_key is None:
+        generation = projects_generation()
+        etag = _list_etag(generation, ndjson)
+        if etag and request.if_none_match.contains_weak(etag):
+            return _not_modified(etag)
+        response = _list_response(query, sort_keys, ndjson, fields, generation)
+        response = _with_etag(response, etag)
+        if counted and response.status_code == 200:
+            response = _with_total(response, _list_total(query, generation))
+        return response
+
+    if serve_stale:
+        stale = list_result_cache().get_stale(*cache_key)
+        if stale is not None:
+            return _stale_list_response(cache_key[1], *stale)
+
+    def build():
+        # Always build the body, even for a matching If-None-Match: concurrent
+        # identical requests may be waiting to share it
+        # The generation the cache entry is keyed by tags the response and decides
+        # whether the bitmap index is warm, so an indexed answer reads no rows
+        generation = cache_key[0]
+        etag = _list_etag(generation, ndjson)
+        response = _with_etag(_list_response(query, sort_keys, ndjson, fields, generation), etag)
+        if response.status_code != 200:
+            return response, None
+        total = _list_total(query, generation) if counted else None
+        return _with_total(response, total), (response.get_data(), response.mimetype, etag, total)
+
+    response, cached = list_result_cache().get_or_build(
+        *cache_key, build, current_app.config['PROJECTS_COALESCE_TIMEOUT']
+    )
+    if response is None:
+        return _cached_list_response(*cached)
+    etag = cached[2] if cached else None
+    if etag and request.if_none_match.contains_weak(etag):
+        return _not_modified(etag)
+    return response
+
+
+def _stale_list_response(key, cached, age, refresh):
+    """Serve a stale cached list, refreshing it after the response when refresh is set."""
+    response = _cached_list_response(*cached)
+    response.age = int(age)
+    response.headers['Warning'] = '110 - "Response is Stale"'
+    if refresh:
+        app = current_app._get_current_object()
+        environ = request.environ
+        cache = list_result_cache()
+
+        def revalidate():
+            try:
+                with app.request_context(environ):
+                    list_projects(serve_stale=False)
+            except Exception as e:
+                app.logger.error(f"Error refreshing stale project list: {e}", exc_info=True)
+            finally:
+                cache.refresh_done(key)
+
+        response.call_on_close(revalidate)
+    return response
+
+
+def _cached_list_response(body, mimetype, etag, total=None):
+    """Rebuild a list response from the result cache, honouring If-None-Match."""
+    if etag and request.if_none_match.contains_weak(etag):
+        return _not_modified(etag)
+    response = current_app.response_class(body, mimetype=mimetype)
+    if etag:
+        response.set_etag(etag)
+    return _with_total(response, total)
+
+
+def _with_total(response, total):
+    """Attach the X-Total-Count header to a successful list response when total is set."""
+    if total is not None and response.status_code == 200:
+        response.headers['X-Total-Count'] = str(total)
+    return response
+
+
+def _requested_sort(args):
+    """
+    Parse the sort parameter into keyset sort keys.
+
+    The id column is appended as the tie-breaker, in the direction of the last
+    key, so an index ending in id (or SQLite's implicit rowid) can serve the
+    whole ORDER BY in a single forward or backward scan.
+
+    Returns:
+        tuple: (sort_keys, error) where sort_keys is a list of (column,
+        descending) pairs ending with Project.id, or None for sort=relevance
+    """
+    sort = args.get('sort')
+    if not sort:
+        return LIST_SORT_KEYS, None
+    if sort == 'relevance':
+        return None, None
+
+    sort_keys, seen = [], set()
+    for key in sort.split(','):
+        descending = key.startswith('-')
+        name = key[1:] if descending else key
+        if name not in SORTABLE_COLUMNS or name in seen:
+            return None, (jsonify({
+                'error': (
+                    "Invalid sort. Must be relevance or a comma-separated list of: "
+                    f"{', '.join(SORTABLE_COLUMNS)} (prefix '-' for descending)"
+                )
+            }), 400)
+        seen.add(name)
+        sort_keys.append((_sort_column(name), descending))
+        if name == 'id':
+            break  # Unique: later keys could never apply
+    else:
+        sort_keys.append((Project.id, sort_keys[-1][1]))
+    return sort_keys, None
+
+
+def _sort_column(name):
+    """
+    Return the expression to order and seek on for a sortable column.
+
+    SQLite stores datetimes as text, with or without microseconds depending on
+    whether the database or SQLAlchemy wrote them, so the same instant can have
+    two spellings. ORDER BY compares the stored text; cursor values are kept and
+    compared as that text too, so seeks line up with the order exactly.
+    """
+    column = getattr(Project, name)
+    if isinstance(column.type, sa.DateTime) and db.engine.dialect.name == 'sqlite':
+        return sa.type_coerce(column, sa.String)
+    return column
+
+
+def _order_by(sort_keys):
+    """ORDER BY clauses for sort keys; None (relevance) only breaks BM25 ties by id."""
+    if sort_keys is None:
+        return [Project.id]
+    return [column.desc() if descending else column.asc() for column, descending in sort_keys]
+
+
+def _requested_fields(args):
+    """
+    Parse the fields parameter into a tuple of serialized field names.
 
     Returns:
-        JSON array of projects ordered by ID, filtered by query parameters
+        tuple: (fields, error) where fields is None when every field is wanted
+        and error is an (error_response, error_code) tuple or None
     """
+    requested = args.get('fields')
+    if not requested:
+        return None, None
+    fields = tuple(dict.fromkeys(field.strip() for field in requested.split(',') if field.strip()))
+    invalid = [field for field in fields if field not in SERIALIZED_FIELDS]
+    if invalid or not fields:
+        return None, (jsonify({
+            'error': f"Invalid fields. Must be any of: {', '.join(SERIALIZED_FIELDS)}"
+        }), 400)
+    return fields, None
+
+
+def _list_response(query, sort_keys, ndjson, fields, generation=None):
+    """
+    Build the list response in the representation the request asked for.
+
+    generation is the write generation already read for this request, if any;
+    the bitmap index answers only when it was built at that generation.
+    """
+    if 'limit' in request.args or 'cursor' in request.args:
+        if sort_keys is None:
+            return jsonify({
+                'error': 'sort=relevance cannot be combined with limit/cursor pagination'
+            }), 400
+        return _paginated_projects(query, sort_keys, fields)
+
+    if ndjson:
+        return _streamed_projects(query, ndjson=True, fields=fields, sort_keys=sort_keys)
+    if request.args.get('stream', '').lower() in ('1', 'true'):
+        return _streamed_projects(query, ndjson=False, fields=fields, sort_keys=sort_keys)
+
+    # The index holds rows in id order only
+    indexable = _index_answers(request.args) and not request.args.get('sort')
+    if indexable:
+        index = warm_index(generation)
+        if index is not None:
+            filters, _ = _equality_filters(request.args)
+            return jsonify(index.rows(index.match(filters), fields)), 200
+
+    # Execute query and return results (plain rows; no Project instances are built)
+    rows = query.with_entities(*serialized_columns(fields)).order_by(*_order_by(sort_keys)).all()
+    fragments = encode_rows(rows, row_serializer(fields), fields)
+    response = _json_response('[' + ','.join(fragments) + ']')
+    if indexable:
+        # The index is cold: answer from SQL now, rebuild after the response is sent
+        schedule_rebuild(response)
+    return response, 200
+
+
+def _list_etag(generation, ndjson):
+    """
+    Compute the ETag for a filtered project list from the projects write generation.
+
+    Every write path bumps the generation in its own transaction (see
+    app.services.change_counter), so the tag changes with any insert, update or
+    delete, and costs one primary-key read however many rows match. The request
+    arguments and representation are folded in so each distinct response gets
+    its own tag.
+
+    Args:
+        generation: Write generation read before the response body
+        ndjson: True for the NDJSON representation
+
+    Returns:
+        str or None: None when the counter row is missing
+    """
+    if generation is None:
+        return None
+    return _make_etag('list', generation, sorted(request.args.items(multi=True)), ndjson)
+
+
+def _list_total(query, generation=None):
+    """Count the projects matching the list filters across all pages, from the index when warm."""
+    if _index_answers(request.args):
+        index = warm_index(generation)
+        if index is not None:
+            filters, _ = _equality_filters(request.args)
+            return index.match(filters).bit_count()
+    return query.order_by(None).with_entities(func.count(Project.id)).scalar()
+
+
+def _index_answers(args):
+    """Return True if the bitmap index is enabled and can evaluate every filter in args."""
+    return (current_app.config['PROJECTS_BITMAP_INDEX'] and not args.get('search')
+            and not any(args.get(name) for name in RANGE_FILTERS))
+
+
+def _make_etag(*parts):
+    """Hash version-signal parts into an opaque ETag value."""
+    encoded = json.dumps(parts, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _not_modified(etag):
+    """Build an empty 304 response carrying the current ETag."""
+    response = current_app.response_class(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def _with_etag(result, etag):
+    """Attach etag to a successful view result."""
+    response = current_app.make_response(result)
+    if etag and response.status_code == 200:
+        response.set_etag(etag)
+    return response
+
+
+def _filtered_projects_query(args, rank_by_relevance=False):
+    """
+    Build the project query for the list filters in the request arguments.
+
+    Args:
+        args: Request query arguments (status, organization, classification,
+            project_type, the RANGE_FILTERS timestamps, search)
+        rank_by_relevance: Order full-text matches by BM25 score before any
+            ordering the caller adds
+
+    Returns:
+        tuple: (query, error) where error is an (error_response, error_code)
+        tuple or None if the filters are valid
+    """
+    filters, error = _equality_filters(args)
+    if error:
+        return None, error
+    ranges, error = _range_filters(args)
+    if error:
+        return None, error
+
     query = Project.query
+    for column, values in filters.items():
+        attribute = getattr(Project, column)
+        query = query.filter(attribute == values[0] if len(values) == 1 else attribute.in_(values))
+    if ranges:
+        query = query.filter(*ranges)
+
+    # Text search in name, description, organization and path
+    if 'search' in args:
+        search_term = args['search']
+        if search_term:  # Non-empty search term
+            query = _search_projects(query, search_term, rank_by_relevance)
+
+    return query, None
+
+
+def _equality_filters(args):
+    """
+    Collect the exact-match list filters from the request arguments.
+
+    Shared by the SQL query builder and the in-process bitmap index so both apply
+    the same rules. Each filter takes one value or a comma-separated list; a
+    project matches if its column equals any of them.
+
+    Returns:
+        tuple: (filters, error) where filters maps column name to a tuple of
+        accepted values and error is an (error_response, error_code) tuple or None
+    """
+    filters = {}
 
     # Filter by status
-    if 'status' in request.args and (status := request.args['status']) in VALID_STATUSES:
-        query = query.filter_by(status=status)
-        # If invalid status, ignore filter (return all projects)
+    statuses = [status for status in _list_arg(args, 'status') if status in VALID_STATUSES]
+    if statuses:
+        filters['status'] = tuple(statuses)
+        # Invalid statuses are ignored (none valid: return all projects)
 
     # Filter by organization
-    if 'organization' in request.args:
-        organization = request.args['organization']
-        if organization:  # Non-empty string
-            query = query.filter_by(organization=organization)
+    organizations = _list_arg(args, 'organization')
+    if organizations:
+        filters['organization'] = tuple(organizations)
 
     # Filter by classification
-    if ('classification' in request.args
-            and (classification := request.args['classification']) in VALID_CLASSIFICATIONS):
-        query = query.filter_by(classification=classification)
-        # If invalid classification, ignore filter (return all projects)
+    classifications = [classification for classification in _list_arg(args, 'classification')
+                       if classification in VALID_CLASSIFICATIONS]
+    if classifications:
+        filters['classification'] = tuple(classifications)
+        # Invalid classifications are ignored (none valid: return all projects)
 
     # Filter by project_type
-    project_type = request.args.get('project_type')
-    if project_type:
-        if project_type not in VALID_PROJECT_TYPES:
-            return jsonify({
-                'error': f"Invalid project_type. Must be one of: {VALID_PROJECT_TYPES}"
-            }), 400
-        query = query.filter(Project.project_type == project_type)
+    project_types = _list_arg(args, 'project_type')
+    if any(project_type not in VALID_PROJECT_TYPES for project_type in project_types):
+        return None, (jsonify({
+            'error': f"Invalid project_type. Must be one of: {VALID_PROJECT_TYPES}"
+        }), 400)
+    if project_types:
+        filters['project_type'] = tuple(project_types)
 
-    # Text search in name and description
-    if 'search' in request.args:
-        search_term = request.args['search']
-        if search_term:  # Non-empty search term
-            search_pattern = f"%{search_term}%"
-            query = query.filter(
-                or_(
-                    Project.name.ilike(search_pattern),
-                    Project.description.ilike(search_pattern)
-                )
-            )
+    return filters, None
+
+
+def _list_arg(args, name):
+    """Split a comma-separated argument into its distinct non-empty values, in order."""
+    values = (value.strip() for value in args.get(name, '').split(','))
+    return list(dict.fromkeys(value for value in values if value))
+
+
+def _range_filters(args):
+    """
+    Build the timestamp range conditions (see RANGE_FILTERS) from the request arguments.
+
+    Bounds are ISO 8601 dates or datetimes; aware values are converted to UTC,
+    the timezone timestamps are stored in.
+
+    Returns:
+        tuple: (conditions, error) where conditions is a list of SQL expressions
+        and error is an (error_response, error_code) tuple or None
+    """
+    conditions = []
+    for name, (column, compare) in RANGE_FILTERS.items():
+        value = args.get(name)
+        if not value:
+            continue
+        try:
+            bound = datetime.fromisoformat(value)
+            if bound.tzinfo is not None:
+                bound = bound.astimezone(timezone.utc).replace(tzinfo=None)
+        except (ValueError, OverflowError):
+            # OverflowError: an offset that carries the instant past year 1 or 9999
+            return None, (jsonify({
+                'error': f"Invalid {name}. Must be an ISO 8601 date or datetime"
+            }), 400)
+        conditions.append(_range_condition(getattr(Project, column), compare, bound))
+    return conditions, None
+
+
+def _range_condition(column, compare, bound):
+    """
+    Compare a timestamp column with an exclusive bound.
+
+    On SQLite the stored text is compared, as for sort keys (see _sort_column).
+    An instant written by the database clock is stored as 'YYYY-MM-DD HH:MM:SS'
+    and one written by SQLAlchemy with '.ffffff' appended, so the bound is
+    spelled for both to compare correctly: with microseconds for a lower bound
+    (a row at the bound's second without them sorts before it), and without
+    them for an upper bound that has none (a row at the bound with '.000000'
+    sorts after it).
+    """
+    if db.engine.dialect.name != 'sqlite':
+        return compare(column, bound)
+    if compare is operator.lt and not bound.microsecond:
+        stored = bound.isoformat(' ', 'seconds')
+    else:
+        stored = bound.isoformat(' ', 'microseconds')
+    return compare(sa.type_coerce(column, sa.String), stored)
+
+
+def _search_projects(query, search_term, rank_by_relevance=False):
+    """
+    Filter a project query by a case-insensitive substring search.
 
-    # Execute query and return results
-    projects = query.order_by(Project.id).all()
-    return jsonify([project.to_dict() for project in projects]), 200
+    Uses the projects_fts trigram index when it exists, which answers substring
+    matches from the index instead of scanning every row. Terms shorter than a
+    trigram, and databases without the index, fall back to ILIKE.
+
+    Args:
+        query: Project query to filter
+        search_term: Non-empty search string
+        rank_by_relevance: Order matches by BM25 score (FTS only)
+
+    Returns:
+        Filtered query
+    """
+    if len(search_term) >= FTS_MIN_TERM_LENGTH and _fts_available():
+        # Quote as a single FTS5 phrase so operators in the term are literal
+        phrase = '"' + search_term.replace('"', '""') + '"'
+        query = query.join(projects_fts, projects_fts.c.rowid == Project.id).filter(
+            literal_column('projects_fts').op('MATCH')(phrase)
+        )
+        if rank_by_relevance:
+            query = query.order_by(func.bm25(literal_column('projects_fts')))
+        return query
+
+    search_pattern = f"%{search_term}%"
+    return query.filter(
+        or_(*(getattr(Project, column).ilike(search_pattern) for column in FTS_COLUMNS))
+    )
+
+
+def _fts_available():
+    """Return True if the projects_fts index exists (checked once per app)."""
+    available = current_app.extensions.get('projects_fts')
+    if available is None:
+        available = (fts_supported(db.engine.dialect.name)
+                     and inspect(db.engine).has_table('projects_fts'))
+        current_app.extensions['projects_fts'] = available
+    return available
+
+
+def _paginated_projects(query, sort_keys, fields=None):
+    """
+    Return one keyset-paginated page of projects.
+
+    Instead of OFFSET, the page seeks past the sort-key values of the last row of
+    the previous page (carried in the opaque cursor). When an index matches the
+    sort order, a page reads only its own rows no matter how deep it is; see
+    _keyset_after for orders no index matches.
+
+    Args:
+        query: Filtered project query
+        sort_keys: List of (column, descending) tuples ending with Project.id
+            (see _requested_sort)
+        fields: Optional subset of fields to serialize (see Project.to_dict)
+
+    Returns:
+        JSON object with 'projects' and 'next_cursor' (None on the last page)
+    """
+    limit = request.args.get('limit', current_app.config['PROJECTS_DEFAULT_PAGE_SIZE'])
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'limit must be a positive integer'}), 400
+    if limit < 1:
+        return jsonify({'error': 'limit must be a positive integer'}), 400
+    limit = min(limit, current_app.config['PROJECTS_MAX_PAGE_SIZE'])
+
+    cursor = request.args.get('cursor')
+    if cursor:
+        values = _decode_cursor(cursor, sort_keys)
+        if values is None:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        query = query.filter(_keyset_after(sort_keys, values))
+
+    # Select the sort keys too (after the serialized fields) so the cursor can be
+    # built; serialized columns are reused, so rows match the unpaginated ones
+    columns = serialized_columns(fields)
+    key_positions = []
+    for column, _ in sort_keys:
+        names = [selected.key for selected in columns]
+        key = getattr(column, 'key', None)  # None for SQLite datetime text keys
+        if key is None or key not in names:
+            columns.append(column)
+            key_positions.append(len(columns) - 1)
+        else:
+            key_positions.append(names.index(key))
+
+    # Fetch one extra row to learn whether another page exists
+    rows = query.with_entities(*columns).order_by(*_order_by(sort_keys)).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = _encode_cursor([last[position] for position in key_positions])
+
+    fragments = encode_rows(rows, row_serializer(fields), fields)
+    # Same body as jsonify({'next_cursor': ..., 'projects': [...]}), keys sorted
+    return _json_response(
+        '{"next_cursor":' + current_app.json.dumps(next_cursor)
+        + ',"projects":[' + ','.join(fragments) + ']}'
+    ), 200
+
+
+def _json_response(body):
+    """Wrap pre-encoded JSON text in a response, as jsonify would."""
+    return current_app.response_class(body + '\n', mimetype='application/json')
+
+
+def _prefers_ndjson():
+    """Return True if the Accept header ranks NDJSON strictly above JSON."""
+    accept = request.accept_mimetypes
+    return accept.quality(NDJSON_MIMETYPE) > accept.quality('application/json')
+
+
+def _streamed_projects(query, ndjson, fields=None, sort_keys=LIST_SORT_KEYS):
+    """
+    Stream the filtered projects as a chunked JSON array or NDJSON.
+
+    Rows are pulled from the database in batches with yield_per and encoded one
+    batch at a time (through the fragment cache), so neither the rows nor the
+    encoded body for the whole result set are ever held in memory at once.
+
+    Args:
+        query: Filtered project query
+        ndjson: True for application/x-ndjson, False for a JSON array
+        fields: Optional subset of fields to serialize (see Project.to_dict)
+        sort_keys: Order as returned by _requested_sort (None: relevance)
+
+    Returns:
+        Streamed response in the requested order
+    """
+    batch_size = current_app.config['PROJECTS_STREAM_BATCH_SIZE']
+    serialize = row_serializer(fields)
+
+    def generate():
+        rows = iter(
+            query.with_entities(*serialized_columns(fields))
+            .order_by(*_order_by(sort_keys)).yield_per(batch_size)
+        )
+        opening = '['
+        while batch := list(islice(rows, batch_size)):
+            fragments = encode_rows(batch, serialize, fields)
+            if ndjson:
+                yield ''.join(fragment + '\n' for fragment in fragments)
+            else:
+                yield opening + ','.join(fragments)
+                opening = ','
+        if not ndjson:
+            # An empty result never emitted the opening bracket
+            yield ('[' if opening == '[' else '') + ']\n'
+
+    mimetype = NDJSON_MIMETYPE if ndjson else 'application/json'
+    return current_app.response_class(stream_with_context(generate()), mimetype=mimetype), 200
+
+
+def _keyset_after(sort_keys, values):
+    """
+    Build the seek predicate selecting rows strictly after the cursor position.
+
+    When every key sorts the same way this is a row-value comparison,
+    (k1, k2, ...) > (v1, v2, ...) (< when descending), which SQLite and
+    PostgreSQL answer with an index range starting at the cursor.
+
+    Mixed directions cannot be written as one row value, so they expand to
+    (k1 > v1) OR (k1 = v1 AND k2 < v2) OR ..., behind a leading k1 >= v1 the
+    planner can seek on. No index matches a mixed order, so the rows past the
+    cursor are still sorted for each page.
+    """
+    columns = [column for column, _ in sort_keys]
+    directions = {descending for _, descending in sort_keys}
+    if len(directions) == 1:
+        position, cursor = sa.tuple_(*columns), sa.tuple_(*values)
+        return position < cursor if directions.pop() else position > cursor
+
+    clauses = []
+    for i, ((column, descending), value) in enumerate(zip(sort_keys, values)):
+        equal_prefix = [prior == prior_value for prior, prior_value in zip(columns, values[:i])]
+        beyond = column < value if descending else column > value
+        clauses.append(and_(*equal_prefix, beyond))
+    (first, descending), start = sort_keys[0], values[0]
+    return and_(first <= start if descending else first >= start, or_(*clauses))
+
+
+def _encode_cursor(values):
+    """Encode sort-key values as an opaque URL-safe cursor string."""
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    payload = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def _decode_cursor(cursor, sort_keys):
+    """
+    Decode a cursor produced by _encode_cursor for the given sort keys.
+
+    Returns:
+        list: Sort-key values coerced to the column types, or None if the cursor
+        is malformed or was issued for a different sort order
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        raw_values = json.loads(payload)
+    except ValueError:
+        return None
+
+    if not isinstance(raw_values, list) or len(raw_values) != len(sort_keys):
+        return None
+
+    values = []
+    for (column, _), raw in zip(sort_keys, raw_values):
+        python_type = column.type.python_type
+        if python_type is datetime:
+            if not isinstance(raw, str):
+                return None
+            try:
+                raw = datetime.fromisoformat(raw)
+            except ValueError:
+                return None
+        elif python_type is int:
+            if not _is_sql_integer(raw):
+                return None
+        elif not isinstance(raw, str):
+            return None
+        values.append(raw)
+    return values
+
+
+def _is_sql_integer(value):
+    """Return True if value is an int (not a bool) that fits a signed 64-bit column."""
+    low, high = SQL_INTEGER_RANGE
+    return isinstance(value, int) and not isinstance(value, bool) and low <= value <= high
+
+
+@projects_bp.route('/projects/facets', methods=['GET'])
+def project_facets():
+    """
+    Count projects per status, classification, project_type and organization.
+
+    Takes the same filters as GET /api/projects (equality and IN filters, the
+    timestamp bounds and search). The counts come from one GROUP BY over the
+    filtered rows, or from the bitmap index when it is warm and only equality
+    filters are given, so no project rows are transferred. Responses are cached
+    with the list results until the next write.
+
+    Returns:
+        JSON object with total (the number of matching projects) and facets,
+        mapping each column to {value: count}. Projects with no value for a
+        column are counted in total only.
+    """
+    query, error = _filtered_projects_query(request.args)
+    if error:
+        return error
+
+    cache_key = result_cache_key(request.args, 'facets')
+    if cache_key is None:
+        return _facet_counts(query)
+
+    def build():
+        response = _facet_counts(query, cache_key[0])
+        return response, (response.get_data(), response.mimetype, None)
+
+    response, cached = list_result_cache().get_or_build(
+        *cache_key, build, current_app.config['PROJECTS_COALESCE_TIMEOUT']
+    )
+    if response is None:
+        return _cached_list_response(*cached)
+    return response
+
+
+def _facet_counts(query, generation=None):
+    """Build the facets response for a filtered project query."""
+    indexable = _index_answers(request.args)
+    if indexable:
+        index = warm_index(generation)
+        if index is not None:
+            filters, _ = _equality_filters(request.args)
+            bitmap = index.match(filters)
+            return jsonify({'total': bitmap.bit_count(), 'facets': index.facets(bitmap)})
+
+    columns = [getattr(Project, column) for column in INDEXED_COLUMNS]
+    groups = query.order_by(None).with_entities(*columns, func.count(Project.id)).group_by(*columns)
+    total, facets = 0, {column: {} for column in INDEXED_COLUMNS}
+    for *values, count in groups:
+        total += count
+        for column, value in zip(INDEXED_COLUMNS, values):
+            if value is not None:
+                facets[column][value] = facets[column].get(value, 0) + count
+
+    response = jsonify({'total': total, 'facets': facets})
+    if indexable:
+        # The index is cold: answer from SQL now, rebuild after the response is sent
+        schedule_rebuild(response)
+    return response
+
+
+@projects_bp.route('/projects/batch-get', methods=['POST'])
+def batch_get_projects():
+    """
+    Get many projects by ID in one request.
+
+    Request body (JSON):
+        - ids (required): List of project IDs (at most PROJECTS_BATCH_GET_MAX_IDS;
+          duplicates are returned once)
+
+    Query parameters:
+        - fields: Comma-separated subset of project fields to return
+
+    The projects are read with one WHERE id IN (...) query as plain rows and
+    encoded through the fragment cache (see app.services.project_fragments).
+
+    Returns:
+        200: JSON object with projects (in the order requested) and missing
+            (the requested IDs that do not exist)
+        400: Invalid body, ids or fields
+    """
+    fields, error = _requested_fields(request.args)
+    if error:
+        return error
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or 'ids' not in data:
+        return jsonify({'error': "Missing 'ids' field"}), 400
+
+    ids = data['ids']
+    if not isinstance(ids, list) or any(
+        not _is_sql_integer(project_id) or project_id < 1 for project_id in ids
+    ):
+        return jsonify({'error': "'ids' must be a list of positive integers"}), 400
+    ids = list(dict.fromkeys(ids))
+    max_ids = current_app.config['PROJECTS_BATCH_GET_MAX_IDS']
+    if len(ids) > max_ids:
+        return jsonify({'error': f'At most {max_ids} ids can be requested at once'}), 400
+
+    # Select the id too (after the serialized fields) to put rows in request order
+    columns = serialized_columns(fields)
+    width = len(columns)
+    names = [column.key for column in columns]
+    id_position = names.index('id') if 'id' in names else width
+
+    rows = {}
+    if ids:
+        result = db.session.execute(
+            sa.select(*columns, Project.id).where(Project.id.in_(ids))
+        )
+        # Drop the extra id so fragments are shared with list responses
+        rows = {row[id_position]: tuple(row)[:width] for row in result}
+
+    fragments = encode_rows([rows[project_id] for project_id in ids if project_id in rows],
+                            row_serializer(fields), fields)
+    missing = [project_id for project_id in ids if project_id not in rows]
+    # Same body as jsonify({'missing': ..., 'projects': [...]}), keys sorted
+    return _json_response(
+        '{"missing":' + current_app.json.dumps(missing)
+        + ',"projects":[' + ','.join(fragments) + ']}'
+    ), 200
 
 
 def create_project():
@@ -138,6 +959,10 @@ def create_project():
         - description (optional): Project description
         - remote_url (optional): Git repository URL
 
+    The project is written with one INSERT ... RETURNING; a duplicate path is
+    rejected by the unique index rather than by a lookup beforehand, so two
+    concurrent requests for the same path cannot both succeed.
+
     Returns:
         201: Created project with Location header
         400: Validation error
@@ -154,39 +979,336 @@ def create_project():
     if error_response:
         return error_response, error_code
 
-    # Check for duplicate path
-    if 'path' in data and data['path']:
-        existing = Project.query.filter_by(path=data['path']).first()
-        if existing:
-            return jsonify({'error': 'Project with this path already exists'}), 409
-
     # Create project
     try:
-        project = Project(
-            name=data['name'],
-            path=data.get('path'),
-            organization=data.get('organization'),
-            classification=data.get('classification'),
-            status=data.get('status', 'active'),
-            description=data.get('description'),
-            remote_url=data.get('remote_url')
-        )
-
-        db.session.add(project)
+        row = db.session.execute(
+            sa.insert(Project).values(
+                name=data['name'],
+                path=data.get('path'),
+                organization=data.get('organization'),
+                classification=data.get('classification'),
+                status=data.get('status', 'active'),
+                description=data.get('description'),
+                remote_url=data.get('remote_url')
+            ).returning(*serialized_columns())
+        ).one()
+        bump_projects_generation()
         db.session.commit()
 
-        return jsonify(project.to_dict()), 201, {
-            'Location': f'/api/projects/{project.id}'
+        return jsonify(row_serializer()(row)), 201, {
+            'Location': f'/api/projects/{row.id}'
         }
 
+    except IntegrityError as e:
+        db.session.rollback()
+        return _integrity_error(e)
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Unexpected error in create_project: {e}", exc_info=True)
+        return jsonify({'error': 'Internal server error'}), 500
+
+
+@projects_bp.route('/projects/bulk', methods=['POST'])
+def bulk_create_projects():
+    """
+    Create many projects in one request and one transaction.
+
+    Request body (JSON): a list of projects (same fields as POST /api/projects),
+    or an object:
+    {
+        "projects": [...],
+        "mode": "all_or_nothing|best_effort"   (optional, default all_or_nothing)
+    }
+
+    All items are validated and their paths checked with one IN query before a
+    single INSERT (see app.services.project_bulk). In all_or_nothing mode nothing
+    is written unless every item is accepted; in best_effort mode the accepted
+    items are written and the others reported.
+
+    Returns:
+        201: ids (aligned with the input, null for items not created) and errors
+        400: Invalid body, or no item created because of invalid items
+        409: No item created, and every rejected item had a duplicate path
+    """
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        items = data.get('projects')
+        mode = data.get('mode', 'all_or_nothing')
+    else:
+        items, mode = data, 'all_or_nothing'
+
+    if not isinstance(items, list):
+        return jsonify({
+            'error': "Request body must be a list of projects or an object with a 'projects' list"
+        }), 400
+    if mode not in BULK_MODES:
+        return jsonify({'error': f"Invalid mode. Must be one of: {', '.join(BULK_MODES)}"}), 400
+    max_items = current_app.config['PROJECTS_BULK_MAX_ITEMS']
+    if len(items) > max_items:
+        return jsonify({'error': f'At most {max_items} projects can be created at once'}), 400
+
+    try:
+        result = bulk_create(items, mode)
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Unexpected error in bulk_create_projects: {e}", exc_info=True)
+        return jsonify({'error': 'Internal server error'}), 500
+
+    created = any(project_id is not None for project_id in result.ids)
+    if result.errors and not created:
+        return jsonify(result.to_dict()), 409 if result.conflicts_only else 400
+    return jsonify(result.to_dict()), 201
+
+
+def bulk_update_projects():
+    """
+    Update many projects with one set-based UPDATE.
+
+    Request body (JSON):
+    {
+        "ids": [1, 2, 3],                  (and/or)
+        "filter": {"status": "active", "organization": "acme,globex", ...},
+        "set": {"status": "paused", ...},  (BULK_UPDATABLE_FIELDS)
+        "return_ids": false                (optional)
+    }
+
+    The projects are selected by ids, the list filters (see _bulk_condition) or
+    both, and written with a single UPDATE ... WHERE that also bumps each
+    project's version. The set values are validated like PATCH /api/projects/<id>.
+
+    Returns:
+        200: updated (number of projects changed), plus ids when return_ids is true
+        400: Invalid selection or set values
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    condition, error = _bulk_condition(data)
+    if error:
+        return error
+
+    values = data.get('set')
+    if not isinstance(values, dict) or not values:
+        return jsonify({'error': "'set' must be an object with the fields to update"}), 400
+    invalid = [field for field in values if field not in BULK_UPDATABLE_FIELDS]
+    if invalid:
+        return jsonify({
+            'error': f"Invalid set fields. Must be any of: {', '.join(BULK_UPDATABLE_FIELDS)}"
+        }), 400
+    if 'name' in values and not values['name']:
+        return jsonify({'error': 'Name cannot be empty'}), 400
+    error_response, error_code = validate_project_data(values)
+    if error_response:
+        return error_response, error_code
+
+    stmt = sa.update(Project).where(condition).values(**values, version=Project.version + 1)
+    return _execute_bulk_write(stmt, 'updated', data.get('return_ids'), 'bulk_update_projects')
+
+
+def bulk_delete_projects():
+    """
+    Permanently delete many projects with one set-based DELETE.
+
+    Request body (JSON): ids and/or filter (see _bulk_condition), plus optional
+    return_ids and dry_run. With dry_run true nothing is deleted; the number of
+    projects that would be is returned instead (see _bulk_dry_run).
+
+    Returns:
+        200: deleted (number of projects removed), plus ids when return_ids is
+            true; or matched for a dry run
+        400: Invalid selection
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    condition, error = _bulk_condition(data)
+    if error:
+        return error
+    if data.get('dry_run'):
+        return _bulk_dry_run(condition, data.get('return_ids'))
+
+    stmt = sa.delete(Project).where(condition)
+    return _execute_bulk_write(stmt, 'deleted', data.get('return_ids'), 'bulk_delete_projects')
+
+
+@projects_bp.route('/projects/archive', methods=['PUT'])
+def bulk_archive_projects():
+    """
+    Archive many projects with one set-based UPDATE.
+
+    Request body (JSON): ids and/or filter (see _bulk_condition), plus optional
+    return_ids and dry_run. Selected projects that are not archived yet get
+    ARCHIVED_VALUES and a new version; already archived ones are left untouched
+    and not counted.
+
+    Returns:
+        200: archived (number of projects changed), plus ids when return_ids is
+            true; or matched for a dry run
+        400: Invalid selection
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+    condition, error = _bulk_condition(data)
+    if error:
+        return error
+    condition = and_(condition, or_(*(
+        getattr(Project, field).is_distinct_from(value) for field, value in ARCHIVED_VALUES.items()
+    )))
+    if data.get('dry_run'):
+        return _bulk_dry_run(condition, data.get('return_ids'))
+
+    stmt = sa.update(Project).where(condition).values(
+        **ARCHIVED_VALUES, version=Project.version + 1
+    )
+    return _execute_bulk_write(stmt, 'archived', data.get('return_ids'), 'bulk_archive_projects')
+
+
+def _bulk_dry_run(condition, return_ids):
+    """
+    Report how many projects a bulk write would affect, without writing.
+
+    Returns:
+        200 with matched (plus the matching ids when return_ids is true) and dry_run
+    """
+    if return_ids:
+        ids = list(db.session.execute(
+            sa.select(Project.id).where(condition).order_by(Project.id)
+        ).scalars())
+        return jsonify({'matched': len(ids), 'ids': ids, 'dry_run': True}), 200
+    count = db.session.execute(sa.select(func.count()).select_from(Project).where(condition))
+    return jsonify({'matched': count.scalar(), 'dry_run': True}), 200
+
+
+def _bulk_condition(data):
+    """
+    Build the WHERE condition selecting the projects a bulk write applies to.
+
+    Args:
+        data: Request body with ids (a list of project IDs) and/or filter (an
+            object of BULK_FILTERS, each a string or list of strings, applied as
+            on GET /api/projects). At least one is required; use an empty filter
+            to select every project.
+
+    Unlike the list, unknown filter names and invalid status or classification
+    values are rejected rather than ignored, so a typo cannot widen the write.
+
+    Returns:
+        tuple: (condition, error) where error is an (error_response, error_code)
+        tuple or None
+    """
+    if 'ids' not in data and 'filter' not in data:
+        return None, (jsonify({'error': "Provide 'ids' and/or 'filter'"}), 400)
+
+    conditions = []
+    if 'ids' in data:
+        ids = data['ids']
+        if not isinstance(ids, list) or not all(_is_sql_integer(project_id) for project_id in ids):
+            return None, (jsonify({'error': "'ids' must be a list of integers"}), 400)
+        max_ids = current_app.config['PROJECTS_BULK_MAX_ITEMS']
+        if len(ids) > max_ids:
+            return None, (jsonify({
+                'error': f'At most {max_ids} ids can be given at once'
+            }), 400)
+        conditions.append(Project.id.in_(ids))
+
+    if 'filter' in data:
+        args, error = _bulk_filter_args(data['filter'])
+        if error:
+            return None, error
+        query, error = _filtered_projects_query(args)
+        if error:
+            return None, error
+        if args.get('search'):
+            # The search joins the FTS table: select the matching ids instead
+            conditions.append(Project.id.in_(
+                query.order_by(None).with_entities(Project.id).statement
+            ))
+        elif query.whereclause is not None:
+            conditions.append(query.whereclause)
+
+    return and_(sa.true(), *conditions), None
+
+
+def _bulk_filter_args(filters):
+    """
+    Turn a bulk write's filter object into list-style query arguments.
+
+    Returns:
+        tuple: (args, error) where args maps BULK_FILTERS names to strings
+    """
+    if not isinstance(filters, dict):
+        return None, (jsonify({'error': "'filter' must be an object"}), 400)
+    unknown = [name for name in filters if name not in BULK_FILTERS]
+    if unknown:
+        return None, (jsonify({
+            'error': f"Invalid filter. Must be any of: {', '.join(BULK_FILTERS)}"
+        }), 400)
+
+    args = {}
+    for name, value in filters.items():
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            value = ','.join(value)
+        if not isinstance(value, str):
+            return None, (jsonify({
+                'error': f"Invalid {name}. Must be a string or a list of strings"
+            }), 400)
+        args[name] = value
+        # An empty value would drop out of the WHERE clause and widen the write to
+        # every project; selecting everything takes an explicit empty filter object
+        empty = not value.strip() if name == 'search' or name in RANGE_FILTERS \
+            else not _list_arg(args, name)
+        if empty:
+            return None, (jsonify({'error': f"Invalid {name}. Must not be empty"}), 400)
+
+    for name, valid in (('status', VALID_STATUSES), ('classification', VALID_CLASSIFICATIONS)):
+        if any(value not in valid for value in _list_arg(args, name)):
+            return None, (jsonify({
+                'error': f"Invalid {name}. Must be one of: {', '.join(valid)}"
+            }), 400)
+    return args, None
+
+
+def _execute_bulk_write(stmt, counter, return_ids, operation):
+    """
+    Run one set-based UPDATE or DELETE and commit, bumping the write generation.
+
+    Args:
+        stmt: UPDATE or DELETE statement on projects
+        counter: Response key for the number of affected projects
+        return_ids: Also return the affected project IDs (via RETURNING)
+        operation: View name for error logging
+
+    Returns:
+        200 with {counter: n} (plus ids), 409 on an integrity error, or 500
+    """
+    # The statement is the whole write: no pre-select to synchronize the session
+    stmt = stmt.execution_options(synchronize_session=False)
+    try:
+        if return_ids:
+            ids = sorted(db.session.execute(stmt.returning(Project.id)).scalars())
+            count = len(ids)
+        else:
+            count = db.session.execute(stmt).rowcount
+        if count:
+            bump_projects_generation()
+        db.session.commit()
     except IntegrityError:
         db.session.rollback()
         return jsonify({'error': 'Database integrity error'}), 409
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Unexpected error in create_project: {e}", exc_info=True)
+        current_app.logger.error(f"Unexpected error in {operation}: {e}", exc_info=True)
         return jsonify({'error': 'Internal server error'}), 500
 
+    body = {counter: count}
+    if return_ids:
+        body['ids'] = ids
+    return jsonify(body), 200
+
 
 @projects_bp.route('/projects/<int:project_id>', methods=['GET', 'PATCH', 'DELETE'])
 def project_detail(project_id):
@@ -212,19 +1334,28 @@ def get_project(project_id):
     Args:
         project_id: Integer ID of the project
 
+    The row is read as plain columns (no Project instance) together with its
+    version, which is the ETag; a matching If-None-Match is answered with 304
+    without serializing the row.
+
     Returns:
-        JSON object of the project
+        JSON object of the project, or 304 when If-None-Match matches
 
     Raises:
         404: Project not found
         500: Invalid enum values in database
     """
-    project = db.session.get(Project, project_id)
-
-    if project is None:
+    row = db.session.execute(
+        sa.select(*serialized_columns(), Project.version).where(Project.id == project_id)
+    ).first()
+    if row is None:
         return jsonify({'error': 'Project not found'}), 404
 
-    return jsonify(project.to_dict()), 200
+    etag = str(row.version)
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag)
+
+    return _with_etag((jsonify(row_serializer()(row)), 200), etag)
 
 
 def update_project(project_id):
@@ -240,78 +1371,86 @@ def update_project(project_id):
         - description: Project description
         - remote_url: Git repository URL
 
+    The update is one UPDATE ... RETURNING with no read before it; a duplicate
+    path is rejected by the unique index. With an If-Match header carrying the
+    project's ETag, the update is applied only if the project is still at that
+    version (see _update_project_if_match).
+
     Returns:
         200: Updated project
         400: Validation error
         404: Project not found
         409: Duplicate path conflict
+        412: If-Match does not match the current version
     """
-    project = db.session.get(Project, project_id)
-
-    if project is None:
-        return jsonify({'error': 'Project not found'}), 404
+    versions = _if_match_versions()
+    if versions is not None:
+        return _update_project_if_match(project_id, versions)
 
     data = request.get_json()
-    if not data:
+    values = {field: data[field] for field in UPDATABLE_FIELDS if field in data} if data else {}
+    if not values:
         # No updates provided - return current project
-        return jsonify(project.to_dict()), 200
+        return get_project(project_id)
 
     # Validate project data
     error_response, error_code = validate_project_data(data)
     if error_response:
         return error_response, error_code
 
-    # Check for duplicate path if updating path
-    if 'path' in data and data['path'] and data['path'] != project.path:
-        existing = Project.query.filter_by(path=data['path']).first()
-        if existing:
-            return jsonify({'error': 'Project with this path already exists'}), 409
+    return _commit_update(project_id, None, values, 'update_project')
 
-    # Update fields that are provided
-    try:
-        if 'name' in data:
-            project.name = data['name']
-        if 'path' in data:
-            project.path = data['path']
-        if 'organization' in data:
-            project.organization = data['organization']
-        if 'classification' in data:
-            project.classification = data['classification']
-        if 'status' in data:
-            project.status = data['status']
-        if 'description' in data:
-            project.description = data['description']
-        if 'remote_url' in data:
-            project.remote_url = data['remote_url']
 
-        db.session.commit()
+def _update_project_if_match(project_id, versions):
+    """
+    Apply a PATCH only if the project is still at one of the If-Match versions.
 
-        return jsonify(project.to_dict()), 200
+    The check and the write are one UPDATE ... WHERE id=? AND version IN (...), so
+    concurrent editors need no lock and there is no read before the write. A path
+    that collides with another project surfaces as an IntegrityError from the
+    unique index.
+    """
+    data = request.get_json()
+    values = {field: data[field] for field in UPDATABLE_FIELDS if field in data} if data else {}
+    if not values:
+        # Nothing to write - return the current project if the precondition holds
+        project = db.session.get(Project, project_id)
+        if project is None:
+            return jsonify({'error': 'Project not found'}), 404
+        if project.version not in versions:
+            return _precondition_failed(project.version)
+        return _with_etag((jsonify(project.to_dict()), 200), str(project.version))
 
-    except IntegrityError:
-        db.session.rollback()
-        return jsonify({'error': 'Database integrity error'}), 409
-    except Exception as e:
-        db.session.rollback()
-        current_app.logger.error(f"Unexpected error in update_project: {e}", exc_info=True)
-        return jsonify({'error': 'Internal server error'}), 500
+    error_response, error_code = validate_project_data(data)
+    if error_response:
+        return error_response, error_code
+
+    return _commit_update(project_id, versions, values, 'update_project')
 
 
 def delete_project(project_id):
     """
     Delete a project permanently.
 
+    The delete is one DELETE ... WHERE id = ? with no read before it, so a
+    concurrent write cannot make it fail. With an If-Match header, the project
+    is deleted only if it is still at that version.
+
     Returns:
         204: Project deleted successfully (No Content)
         404: Project not found
+        412: If-Match does not match the current version
     """
-    project = db.session.get(Project, project_id)
-
-    if project is None:
-        return jsonify({'error': 'Project not found'}), 404
+    versions = _if_match_versions()
+    conditions = [Project.id == project_id]
+    if versions is not None:
+        conditions.append(Project.version.in_(versions))
 
     try:
-        db.session.delete(project)
+        if db.session.execute(sa.delete(Project).where(*conditions)).rowcount == 0:
+            db.session.rollback()
+            return _missing_or_precondition_failed(project_id, versions)
+        bump_projects_generation()
         db.session.commit()
         return '', 204
     except Exception as e:
@@ -323,7 +1462,7 @@ def delete_project(project_id):
 @projects_bp.route('/projects/import', methods=['POST'])
 def import_projects():
     """
-    Bulk import projects from JSON data.
+    Bulk import projects from JSON data (or NDJSON, one project per line).
 
     Expected JSON format:
     {
@@ -338,18 +1477,33 @@ def import_projects():
                 "remote_url": "https://github.com/user/repo"
             },
             ...
-        ]
+        ],
+        "on_conflict": "skip|update|replace",   (optional, default skip)
+        "conflict_key": "remote_url|path"       (optional, default remote_url)
     }
 
+    on_conflict decides what happens to a project whose conflict_key matches an
+    existing one: skip leaves it untouched, update overwrites the fields present in
+    the item, replace overwrites every importable field.
+
+    Projects are imported in chunks of IMPORT_BATCH_SIZE with one existing-key
+    lookup, one INSERT and one commit per chunk (see app.services.project_import).
+
     Returns:
-        201: Import completed with statistics
+        201: Import completed with statistics (plus 'updated' for update/replace);
+            for application/x-ndjson bodies, a streamed NDJSON progress report
         400: Invalid JSON or invalid payload
     """
+    if request.mimetype == NDJSON_MIMETYPE:
+        return _import_ndjson()
+
     if not request.is_json:
         return jsonify({'error': 'Content-Type must be application/json'}), 400
 
     try:
         data = request.get_json()
+    except RequestEntityTooLarge:
+        raise
     except Exception:
         return jsonify({'error': 'Invalid JSON'}), 400
 
@@ -363,113 +1517,114 @@ def import_projects():
     if not isinstance(projects_data, list):
         return jsonify({'error': "'projects' field must be a list"}), 400
 
-    imported = 0
-    skipped = 0
-    errors = []
+    importer, error = _build_importer(data)
+    if error:
+        return error
+
+    result = importer.import_items(projects_data)
+
+    return jsonify(result.to_dict()), 201
+
+
+def _build_importer(options):
+    """
+    Create a ProjectImporter from import options.
+
+    Args:
+        options: Mapping with optional on_conflict and conflict_key
+
+    Returns:
+        tuple: (importer, error) where error is an (error_response, error_code)
+        tuple or None if the options are valid
+    """
+    on_conflict = options.get('on_conflict', 'skip')
+    if on_conflict not in CONFLICT_MODES:
+        return None, (jsonify({
+            'error': f"Invalid on_conflict. Must be one of: {', '.join(CONFLICT_MODES)}"
+        }), 400)
+
+    conflict_key = options.get('conflict_key', 'remote_url')
+    if conflict_key not in CONFLICT_KEYS:
+        return None, (jsonify({
+            'error': f"Invalid conflict_key. Must be one of: {', '.join(CONFLICT_KEYS)}"
+        }), 400)
+
+    if not supports_conflict_mode(on_conflict):
+        return None, (jsonify({
+            'error': f"on_conflict '{on_conflict}' is not supported by this database"
+        }), 400)
+
+    importer = ProjectImporter(
+        batch_size=current_app.config['IMPORT_BATCH_SIZE'],
+        on_conflict=on_conflict,
+        conflict_key=conflict_key
+    )
+    return importer, None
+
+
+def _import_ndjson():
+    """
+    Import projects from an application/x-ndjson request body.
+
+    The body is read from request.stream one line at a time and fed through the
+    batched importer, so memory use is bounded by IMPORT_BATCH_SIZE rather than
+    the payload size. Import options come from the query string.
+
+    The response streams one NDJSON progress line per chunk, carrying running
+    totals and that chunk's errors, followed by a final line with "done": true.
+    If the body becomes unreadable mid-stream (e.g. a corrupt or oversized
+    compressed upload), the final line also carries an "error" message; chunks
+    already committed stay imported.
+    """
+    importer, error = _build_importer(request.args)
+    if error:
+        return error
+
+    stream = request.stream
+    dumps = current_app.json.dumps
 
-    for project_data in projects_data:
+    def generate():
+        processed = 0
+        read_error = None
         try:
-            # Check if project already exists by remote_url
-            remote_url = project_data.get('remote_url')
-            if remote_url:
-                existing = Project.query.filter_by(remote_url=remote_url).first()
-                if existing:
-                    skipped += 1
-                    continue
-
-            # Validate required field
-            if 'name' not in project_data or not project_data['name']:
-                errors.append({
-                    'project': project_data.get('name', 'Unknown'),
-                    'error': 'Name is required'
-                })
-                skipped += 1
-                continue
-
-            # Validate classification if provided
-            classification = project_data.get('classification')
-            if classification is not None and classification not in VALID_CLASSIFICATIONS:
-                errors.append({
-                    'project': project_data.get('name', 'Unknown'),
-                    'error': (
-                        f"Invalid classification '{classification}'. "
-                        f"Must be one of: {', '.join(VALID_CLASSIFICATIONS)}"
-                    )
-                })
-                skipped += 1
-                continue
-
-            # Validate status if provided
-            status = project_data.get('status', 'active')
-            if status not in VALID_STATUSES:
-                errors.append({
-                    'project': project_data.get('name', 'Unknown'),
-                    'error': (
-                        f"Invalid status '{status}'. "
-                        f"Must be one of: {', '.join(VALID_STATUSES)}"
-                    )
-                })
-                skipped += 1
-                continue
-
-            # Create new project
-            project = Project(
-                name=project_data['name'],
-                path=project_data.get('path'),
-                organization=project_data.get('organization'),
-                classification=classification,
-                status=status,
-                description=project_data.get('description'),
-                remote_url=project_data.get('remote_url')
-            )
-
-            db.session.add(project)
-
-            # Commit each project individually to handle IntegrityError per-project
-            # This ensures successful projects persist even if later projects fail
-            try:
-                db.session.commit()
-                imported += 1
-            except IntegrityError as e:
-                # Rollback this specific project, but keep the session for others
-                db.session.rollback()
-                project_name = project_data.get('name', 'Unknown')
-                current_app.logger.warning(
-                    f"IntegrityError importing project {project_name}: {e}",
-                    exc_info=True
-                )
-                # Determine specific error message
-                error_msg = 'Failed to import project'
-                if 'path' in str(e).lower() or 'unique' in str(e).lower():
-                    error_msg = 'Project with this path already exists'
-                errors.append({
-                    'project': project_name,
-                    'error': error_msg
-                })
-                skipped += 1
-                # Continue processing remaining projects
-
-        except Exception as e:
-            # Log full exception for debugging
-            project_name = project_data.get('name', 'Unknown')
-            current_app.logger.error(
-                f"Error importing project {project_name}: {e}",
-                exc_info=True
-            )
-            # Return generic error message to client (don't leak internals)
-            errors.append({
-                'project': project_data.get('name', 'Unknown'),
-                'error': 'Failed to import project'
-            })
-            skipped += 1
-            # Rollback any pending changes for this project
-            db.session.rollback()
+            for chunk_size, result in importer.iter_import(_ndjson_items(stream)):
+                processed += chunk_size
+                yield dumps(
+                    _import_progress(result, processed, errors=result.drain_errors())
+                ) + '\n'
+        except HTTPException as error:
+            read_error = error.description
+        summary = _import_progress(importer.result, processed, done=True)
+        if read_error:
+            summary['error'] = read_error
+        yield dumps(summary) + '\n'
+
+    return current_app.response_class(
+        stream_with_context(generate()), mimetype=NDJSON_MIMETYPE
+    ), 201
+
+
+def _ndjson_items(stream):
+    """Yield one import item per non-blank NDJSON line, marking unparsable lines."""
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield RejectedItem(f"Invalid JSON on line {line_number}")
+
 
-    return jsonify({
-        'imported': imported,
-        'skipped': skipped,
-        'errors': errors
-    }), 201
+def _import_progress(result, processed, errors=None, done=False):
+    """Build one progress (or final) line of a streamed NDJSON import report."""
+    progress = {key: value for key, value in result.to_dict().items() if key != 'errors'}
+    progress['processed'] = processed
+    if done:
+        progress['done'] = True
+        progress['error_count'] = result.error_count
+    else:
+        progress['errors'] = errors
+    return progress
 
 
 @projects_bp.route('/projects/<int:project_id>/archive', methods=['PUT'])
@@ -477,25 +1632,117 @@ def archive_project(project_id):
     """
     Archive a project by setting classification to 'archive' and status to 'completed'.
 
+    The archive is one UPDATE with no read before it. With an If-Match header,
+    the project is archived only if it is still at that version.
+
     Returns:
         200: Project archived successfully (returns updated project)
         404: Project not found
+        412: If-Match does not match the current version
     """
-    project = db.session.get(Project, project_id)
+    return _commit_update(project_id, _if_match_versions(), ARCHIVED_VALUES, 'archive_project')
 
-    if project is None:
-        return jsonify({'error': 'Project not found'}), 404
 
+def _if_match_versions():
+    """
+    Parse the If-Match header into the project versions it accepts.
+
+    Weak tags are accepted too, since response compression only weakens the
+    ETag of an otherwise identical representation.
+
+    Returns:
+        set or None: None when there is no precondition (no header, or '*'),
+        otherwise the versions named by the tags (empty if none is a version)
+    """
+    if_match = request.if_match
+    if not if_match or if_match.star_tag:
+        return None
+    # Tags beyond the 64-bit range are no version (and would overflow the bind)
+    tags = (int(tag) for tag in if_match.as_set(include_weak=True) if tag.isdigit())
+    return {version for version in tags if _is_sql_integer(version)}
+
+
+def _commit_update(project_id, versions, values, operation):
+    """
+    Write values to a project in one statement, bumping the version.
+
+    Args:
+        project_id: ID of the project to update
+        versions: Acceptable current versions (from If-Match), or None to
+            update whatever the current version is
+        values: Column values to set
+        operation: View name for error logging
+
+    Returns:
+        200 with the updated project and its new ETag, 404, 409 (duplicate path),
+        412 (version mismatch) or 500
+    """
+    conditions = [Project.id == project_id]
+    if versions is not None:
+        conditions.append(Project.version.in_(versions))
+    stmt = (
+        sa.update(Project)
+        .where(*conditions)
+        .values(**values, version=Project.version + 1)
+        .returning(Project)
+    )
     try:
-        project.classification = 'archive'
-        project.status = 'completed'
+        project = db.session.execute(stmt).scalar_one_or_none()
+        if project is None:
+            db.session.rollback()
+            return _missing_or_precondition_failed(project_id, versions)
+
+        body, version = project.to_dict(), project.version
+        bump_projects_generation()
         db.session.commit()
-        return jsonify(project.to_dict()), 200
+    except IntegrityError as e:
+        db.session.rollback()
+        return _integrity_error(e)
     except Exception as e:
         db.session.rollback()
-        current_app.logger.error(f"Unexpected error in archive_project: {e}", exc_info=True)
+        current_app.logger.error(f"Unexpected error in {operation}: {e}", exc_info=True)
         return jsonify({'error': 'Internal server error'}), 500
 
+    return _with_etag((jsonify(body), 200), str(version))
+
+
+def _missing_or_precondition_failed(project_id, versions):
+    """
+    Explain why a write keyed on id (and If-Match versions) matched no row.
+
+    Returns:
+        404 if the project does not exist (or there was no precondition),
+        otherwise 412 with the current version
+    """
+    if versions is None:
+        return jsonify({'error': 'Project not found'}), 404
+    current = db.session.execute(
+        sa.select(Project.version).where(Project.id == project_id)
+    ).scalar()
+    if current is None:
+        return jsonify({'error': 'Project not found'}), 404
+    return _precondition_failed(current)
+
+
+def _integrity_error(error):
+    """
+    Build the 409 response for a write rejected by a database constraint.
+
+    The unique index on path is the duplicate check for single-project writes,
+    so a violation of it is reported as a duplicate path.
+    """
+    if 'path' in str(error.orig).lower():
+        return jsonify({'error': DUPLICATE_PATH_ERROR}), 409
+    return jsonify({'error': 'Database integrity error'}), 409
+
+
+def _precondition_failed(version):
+    """Build a 412 response carrying the project's current ETag."""
+    response = jsonify({'error': 'Project has been modified; If-Match does not match'})
+    response.status_code = 412
+    response.set_etag(str(version))
+    return response
+
 
 @projects_bp.route('/projects/<project_id>', methods=['GET'])
 def get_project_invalid(project_id):
@@ -507,6 +1754,12 @@ def get_project_invalid(project_id):
     return jsonify({'error': 'Invalid project ID format'}), 400
 
 
+@projects_bp.errorhandler(RequestEntityTooLarge)
+def handle_request_too_large(error):
+    """Handle request bodies over the (decompressed) size limit."""
+    return jsonify({'error': error.description}), 413
+
+
 @projects_bp.errorhandler(ValueError)
 def handle_value_error(error):
     """Handle ValueError exceptions (e.g., invalid ID format)."""
@@ -0,0 +1,143 @@
+"""
+Negotiated response compression.
+
+init_app registers an after_request hook that compresses buffered responses
+above COMPRESS_MIN_SIZE with the best encoding the client accepts: zstd when a
+zstd module is available (Python 3.14's compression.zstd or the optional
+zstandard package), otherwise gzip. Streamed responses are passed through.
+
+Compressed bodies are cached per app in a small LRU keyed by (encoding, digest
+of the uncompressed body), so repeated polls of an unchanged project list skip
+the compressor. Keying on the body itself means a cached entry can never be
+served for different data, whichever worker or write path changed it.
+"""
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+
+from flask import request
+
+try:
+    from compression import zstd as _zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as _zstd
+    except ImportError:
+        _zstd = None
+
+# Media types worth compressing
+COMPRESSIBLE_MIMETYPES = ('application/json', 'application/x-ndjson', 'text/plain', 'text/html')
+
+ZSTD_LEVEL = 3
+
+
+def _gzip_compress(data, level):
+    # mtime=0 keeps output deterministic for identical bodies
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def available_encodings():
+    """Return supported encodings in server preference order."""
+    if _zstd is not None:
+        return ('zstd', 'gzip')
+    return ('gzip',)
+
+
+class CompressedBodyCache:
+    """Thread-safe LRU of compressed bodies with hit/miss counters."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key, body):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        """Return counters for monitoring."""
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def init_app(app):
+    """Register response compression on a Flask app."""
+    cache = CompressedBodyCache(app.config['COMPRESS_CACHE_SIZE'])
+    app.extensions['response_compression'] = cache
+
+    @app.after_request
+    def compress_response(response):
+        return _compress(response, app.config, cache)
+
+
+def _negotiate(accept_encodings):
+    """Pick the accepted encoding with the highest quality, ties going to server order."""
+    best, best_quality = None, 0
+    for encoding in available_encodings():
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _compress(response, config, cache):
+    """Compress a buffered response in place when it is large enough and accepted."""
+    if (response.status_code < 200 or response.status_code in (204, 304)
+            or response.direct_passthrough or not response.is_sequence
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    body = response.get_data()
+    if len(body) < config['COMPRESS_MIN_SIZE']:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = _negotiate(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    level = config['COMPRESS_LEVEL']
+    key = (encoding, level, hashlib.blake2b(body, digest_size=16).digest())
+    compressed = cache.get(key)
+    if compressed is None:
+        if encoding == 'zstd':
+            compressed = _zstd.compress(body, level=ZSTD_LEVEL)
+        else:
+            compressed = _gzip_compress(body, level)
+        cache.put(key, compressed)
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    # The encoded bytes differ from the identity representation
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
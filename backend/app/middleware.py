@@ -0,0 +1,118 @@
+"""
+WSGI middleware applied by the application factory.
+
+RequestDecompressionMiddleware lets clients upload request bodies with
+Content-Encoding: gzip or deflate. The body is inflated lazily as the view reads
+request.stream (or calls request.get_json()), so large uploads never need to be
+held compressed and decompressed in memory at the same time.
+"""
+
+import io
+import zlib
+
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge, UnsupportedMediaType
+from werkzeug.wsgi import get_input_stream
+
+# Content-Encoding values that are inflated transparently
+SUPPORTED_ENCODINGS = ('gzip', 'x-gzip', 'deflate')
+
+# Accept gzip or zlib framing (RFC 1952 / RFC 1950) for either encoding
+_ZLIB_AUTO_WBITS = zlib.MAX_WBITS | 32
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class DecompressingStream(io.RawIOBase):
+    """
+    Readable stream that inflates a gzip/deflate source incrementally.
+
+    At most one chunk of compressed input and one chunk of output are buffered.
+    Reading past max_size decompressed bytes raises RequestEntityTooLarge, and a
+    corrupt or truncated body raises BadRequest, so views see the same errors as
+    for any other unreadable body.
+    """
+
+    def __init__(self, source, max_size):
+        self._source = source
+        self._max_size = max_size
+        self._decompressor = zlib.decompressobj(_ZLIB_AUTO_WBITS)
+        self._buffer = bytearray()
+        self._size = 0
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._buffer and not self._eof:
+            self._fill()
+        count = min(len(buffer), len(self._buffer))
+        buffer[:count] = self._buffer[:count]
+        del self._buffer[:count]
+        return count
+
+    def _fill(self):
+        """Inflate the next chunk of output into the buffer."""
+        decompressor = self._decompressor
+        if decompressor.eof:
+            # Concatenated gzip members are valid; anything else after the end is not
+            compressed = decompressor.unused_data or self._source.read(_CHUNK_SIZE)
+            if not compressed:
+                self._eof = True
+                return
+            decompressor = self._decompressor = zlib.decompressobj(_ZLIB_AUTO_WBITS)
+        elif decompressor.unconsumed_tail:
+            compressed = decompressor.unconsumed_tail
+        else:
+            compressed = self._source.read(_CHUNK_SIZE)
+            if not compressed:
+                raise BadRequest('Compressed request body is truncated')
+
+        try:
+            data = decompressor.decompress(compressed, _CHUNK_SIZE)
+        except zlib.error:
+            raise BadRequest('Compressed request body is invalid')
+
+        self._size += len(data)
+        if self._size > self._max_size:
+            raise RequestEntityTooLarge(
+                f'Decompressed request body exceeds {self._max_size} bytes'
+            )
+        self._buffer += data
+
+
+class RequestDecompressionMiddleware:
+    """
+    Inflate gzip/deflate request bodies before they reach the Flask app.
+
+    Requests with a supported Content-Encoding get a DecompressingStream as
+    wsgi.input; Content-Length and Content-Encoding are dropped (the decoded
+    length is unknown until the body is read) and wsgi.input_terminated is set so
+    Werkzeug reads the stream to its end. Unsupported encodings get 415.
+
+    The size limit is read from config['MAX_DECOMPRESSED_REQUEST_SIZE'] on each
+    request, so it follows later changes to the app config.
+    """
+
+    def __init__(self, wsgi_app, config):
+        self.wsgi_app = wsgi_app
+        self.config = config
+
+    def __call__(self, environ, start_response):
+        encoding = environ.get('HTTP_CONTENT_ENCODING', '').strip().lower()
+        if encoding and encoding != 'identity':
+            if encoding not in SUPPORTED_ENCODINGS:
+                return UnsupportedMediaType(
+                    f"Unsupported Content-Encoding '{encoding}'. "
+                    f"Must be one of: {', '.join(SUPPORTED_ENCODINGS)}"
+                )(environ, start_response)
+            # Bound the compressed read by the original Content-Length
+            source = get_input_stream(environ)
+            max_size = self.config['MAX_DECOMPRESSED_REQUEST_SIZE']
+            environ['wsgi.input'] = io.BufferedReader(
+                DecompressingStream(source, max_size), _CHUNK_SIZE
+            )
+            environ['wsgi.input_terminated'] = True
+            environ.pop('CONTENT_LENGTH', None)
+            environ.pop('HTTP_CONTENT_ENCODING', None)
+        return self.wsgi_app(environ, start_response)
@@ -1,5 +1,6 @@
 """Database models package."""
 
 from app.models.project import Project
+from app.models.change_counter import ChangeCounter
 
-__all__ = ['Project']
+__all__ = ['Project', 'ChangeCounter']
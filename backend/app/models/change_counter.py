@@ -0,0 +1,34 @@
+"""
+Change counter model.
+
+One row per tracked table whose value is bumped in the same transaction as every
+write to that table. In-process caches compare it with the value they were built
+at to tell, across worker processes, whether their copy is still current.
+"""
+
+from sqlalchemy import DDL, event
+from app import db
+
+# Counter bumped by every write to the projects table
+PROJECTS_COUNTER = 'projects'
+
+
+class ChangeCounter(db.Model):
+    """Monotonic write counter for a table."""
+
+    __tablename__ = 'change_counters'
+
+    name = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        """String representation of ChangeCounter."""
+        return f"<ChangeCounter {self.name}: {self.value}>"
+
+
+# Seed the counter row when the table is created with create_all (the migration seeds it too)
+event.listen(
+    ChangeCounter.__table__,
+    'after_create',
+    DDL(f"INSERT INTO change_counters (name, value) VALUES ('{PROJECTS_COUNTER}', 0)")
+)
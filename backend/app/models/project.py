@@ -4,9 +4,29 @@ Project model.
 Represents a project in the database with core tracking information.
 """
 
-from sqlalchemy import func, Enum
+import sqlite3
+
+from sqlalchemy import DDL, event, func, Enum
 from app import db
 
+# Allowed values for the enum columns (shared with API validation)
+VALID_CLASSIFICATIONS = ['primary', 'secondary', 'archive', 'maintenance']
+VALID_STATUSES = ['active', 'paused', 'completed', 'cancelled']
+VALID_PROJECT_TYPES = ['Work', 'Personal', 'Learning', 'Inactive']
+
+# Keys of Project.to_dict(), in response order
+SERIALIZED_FIELDS = (
+    'id', 'name', 'path', 'organization', 'classification', 'project_type', 'status',
+    'description', 'remote_url', 'created_at', 'updated_at'
+)
+TIMESTAMP_FIELDS = ('created_at', 'updated_at')
+
+# Columns indexed by the projects_fts full-text table (SQLite only)
+FTS_COLUMNS = ('name', 'description', 'organization', 'path')
+
+# Trigram tokenizer for substring matching needs SQLite 3.34+
+FTS_MIN_SQLITE_VERSION = (3, 34, 0)
+
 
 class Project(db.Model):
     """Project model for tracking work, personal, and learning projects."""
@@ -23,49 +43,150 @@ class Project(db.Model):
     # Extended fields (Phase 2)
     organization = db.Column(db.String(100), nullable=True, index=True)
     classification = db.Column(
-        Enum('primary', 'secondary', 'archive', 'maintenance', name='classification_enum'),
+        Enum(*VALID_CLASSIFICATIONS, name='classification_enum'),
         nullable=True,
         index=True
     )
     project_type = db.Column(
-        Enum('Work', 'Personal', 'Learning', 'Inactive', name='project_type_enum'),
+        Enum(*VALID_PROJECT_TYPES, name='project_type_enum'),
         nullable=True,  # Nullable for migration safety
         index=True      # Index for filtering performance
     )
     status = db.Column(
-        Enum('active', 'paused', 'completed', 'cancelled', name='status_enum'),
+        Enum(*VALID_STATUSES, name='status_enum'),
         nullable=False,
         default='active',
         index=True
     )
     description = db.Column(db.Text, nullable=True)
-    remote_url = db.Column(db.String(500), nullable=True)
+    remote_url = db.Column(db.String(500), nullable=True, index=True)
 
     # Timestamps
-    created_at = db.Column(db.DateTime, default=func.now(), nullable=False)
-    updated_at = db.Column(db.DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = db.Column(db.DateTime, default=func.now(), nullable=False, index=True)
+    updated_at = db.Column(
+        db.DateTime, default=func.now(), onupdate=func.now(), nullable=False, index=True
+    )
+
+    # Optimistic concurrency counter, exposed as the detail ETag. ORM flushes bump it
+    # and check it (UPDATE ... WHERE id=? AND version=?); Core writes must bump it
+    # themselves. The server default covers bulk inserts.
+    version = db.Column(db.Integer, nullable=False, server_default='1')
+
+    __mapper_args__ = {'version_id_col': version}
 
-    def to_dict(self):
+    # Filter + sort indexes for sorted list pages (GET /api/projects?status=...&sort=...),
+    # ending in id, the tie-breaker of every sort order.
+    # AUTOINCREMENT keeps SQLite from reusing the id of a deleted max-id row, so an
+    # (id, version) ETag can never name a different project than the one it was issued for.
+    __table_args__ = (
+        db.Index('ix_projects_status_updated_at', 'status', 'updated_at', 'id'),
+        db.Index('ix_projects_status_name', 'status', 'name', 'id'),
+        db.Index('ix_projects_project_type_updated_at', 'project_type', 'updated_at', 'id'),
+        db.Index('ix_projects_project_type_name', 'project_type', 'name', 'id'),
+        {'sqlite_autoincrement': True},
+    )
+
+    def to_dict(self, fields=None):
         """
         Serialize project to dictionary for JSON responses.
 
+        Args:
+            fields: Optional subset of SERIALIZED_FIELDS to include. Only
+                these attributes are read, so columns deferred with
+                load_only are never lazy-loaded.
+
         Returns:
             dict: Project data as dictionary
         """
-        return {
-            'id': self.id,
-            'name': self.name,
-            'path': self.path,
-            'organization': self.organization,
-            'classification': self.classification,
-            'project_type': self.project_type,
-            'status': self.status,
-            'description': self.description,
-            'remote_url': self.remote_url,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-        }
+        data = {}
+        for field in fields or SERIALIZED_FIELDS:
+            value = getattr(self, field)
+            if field in TIMESTAMP_FIELDS and value is not None:
+                value = value.isoformat()
+            data[field] = value
+        return data
 
     def __repr__(self):
         """String representation of Project."""
         return f"<Project {self.id}: {self.name}>"
+
+
+def serialized_columns(fields=None):
+    """Return the projects table columns for fields (default: every serialized field)."""
+    return [Project.__table__.c[field] for field in fields or SERIALIZED_FIELDS]
+
+
+def row_serializer(fields=None):
+    """
+    Precompile a serializer for rows selected with serialized_columns(fields).
+
+    The ORM-free read path selects plain rows instead of hydrating Project
+    instances; the returned function turns one such row into the same dict as
+    Project.to_dict(fields). Extra trailing columns in the row are ignored.
+
+    Returns:
+        callable: row -> dict
+    """
+    fields = tuple(fields or SERIALIZED_FIELDS)
+    timestamps = [field for field in fields if field in TIMESTAMP_FIELDS]
+
+    if not timestamps:
+        def serialize(row):
+            return dict(zip(fields, row))
+        return serialize
+
+    def serialize(row):
+        data = dict(zip(fields, row))
+        for field in timestamps:
+            value = data[field]
+            if value is not None:
+                data[field] = value.isoformat()
+        return data
+    return serialize
+
+
+def _fts_columns(prefix=''):
+    """Comma-separated FTS column list, optionally qualified (e.g. 'new.')."""
+    return ', '.join(f'{prefix}{column}' for column in FTS_COLUMNS)
+
+
+# External-content FTS5 index over projects, kept in sync by triggers.
+# The update trigger only fires when an indexed column changes, so status and
+# classification writes do not touch the full-text index.
+PROJECTS_FTS_DDL = [
+    f"CREATE VIRTUAL TABLE projects_fts USING fts5({_fts_columns()}, "
+    "content='projects', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER projects_fts_ai AFTER INSERT ON projects BEGIN "
+    f"INSERT INTO projects_fts(rowid, {_fts_columns()}) "
+    f"VALUES (new.id, {_fts_columns('new.')}); END",
+    f"CREATE TRIGGER projects_fts_ad AFTER DELETE ON projects BEGIN "
+    f"INSERT INTO projects_fts(projects_fts, rowid, {_fts_columns()}) "
+    f"VALUES ('delete', old.id, {_fts_columns('old.')}); END",
+    f"CREATE TRIGGER projects_fts_au AFTER UPDATE OF {_fts_columns()} ON projects BEGIN "
+    f"INSERT INTO projects_fts(projects_fts, rowid, {_fts_columns()}) "
+    f"VALUES ('delete', old.id, {_fts_columns('old.')}); "
+    f"INSERT INTO projects_fts(rowid, {_fts_columns()}) "
+    f"VALUES (new.id, {_fts_columns('new.')}); END",
+]
+
+
+def fts_supported(dialect_name):
+    """Return True if the database can host the projects_fts index."""
+    return dialect_name == 'sqlite' and sqlite3.sqlite_version_info >= FTS_MIN_SQLITE_VERSION
+
+
+def _fts_ddl_applies(ddl, target, bind, **kw):
+    """execute_if callable: only emit FTS DDL on SQLite builds that support it."""
+    return fts_supported(bind.dialect.name)
+
+
+# Mirror the FTS migration when tables are created with db.create_all()
+for _statement in PROJECTS_FTS_DDL:
+    event.listen(
+        Project.__table__, 'after_create',
+        DDL(_statement).execute_if(callable_=_fts_ddl_applies)
+    )
+event.listen(
+    Project.__table__, 'before_drop',
+    DDL('DROP TABLE IF EXISTS projects_fts').execute_if(callable_=_fts_ddl_applies)
+)
@@ -0,0 +1 @@
+"""Service layer package for work shared by API endpoints."""
@@ -0,0 +1,33 @@
+"""
+Write generation tracking for the projects table.
+
+Every write path calls bump_projects_generation() inside its transaction, so
+the counter commits (or rolls back) together with the write it records.
+"""
+
+from sqlalchemy import select, update
+
+from app import db
+from app.models.change_counter import ChangeCounter, PROJECTS_COUNTER
+
+
+def bump_projects_generation():
+    """Advance the projects write generation in the current transaction."""
+    db.session.execute(
+        update(ChangeCounter)
+        .where(ChangeCounter.name == PROJECTS_COUNTER)
+        .values(value=ChangeCounter.value + 1)
+    )
+
+
+def projects_generation():
+    """
+    Return the committed projects write generation.
+
+    Returns:
+        int or None: None if the counter row is missing, in which case callers
+        must treat every cached copy as stale
+    """
+    return db.session.execute(
+        select(ChangeCounter.value).where(ChangeCounter.name == PROJECTS_COUNTER)
+    ).scalar()
@@ -0,0 +1,171 @@
+"""
+Bulk project creation for POST /api/projects/bulk.
+
+Every item is validated up front, all paths are checked against the table (and
+against each other) with one IN query, and the accepted rows are written with a
+single executemany INSERT ... RETURNING id and one commit.
+
+Two modes decide what happens when some items are rejected:
+    - all_or_nothing: nothing is written unless every item is valid (default)
+    - best_effort: the valid items are written and the rest reported
+A path inserted concurrently after the check makes the INSERT fail with an
+IntegrityError; the paths are then checked again so the conflict is attributed
+to the item that caused it.
+"""
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models.project import Project
+from app.services.change_counter import bump_projects_generation
+from app.services.project_import import (
+    DUPLICATE_PATH_ERROR, IMPORT_FIELDS, build_import_row, validate_import_item
+)
+
+BULK_MODES = ['all_or_nothing', 'best_effort']
+
+INVALID_ITEM_ERROR = 'Project must be a JSON object'
+
+
+class BulkCreateResult:
+    """Per-item outcome of a bulk create."""
+
+    def __init__(self, size):
+        # Created id per input position (None when the item was not created)
+        self.ids = [None] * size
+        # Input position -> error message
+        self.errors = {}
+
+    @property
+    def conflicts_only(self):
+        """True if every rejected item collided with an existing path."""
+        return all(error == DUPLICATE_PATH_ERROR for error in self.errors.values())
+
+    def to_dict(self):
+        """
+        Serialize the outcome for the JSON response.
+
+        Returns:
+            dict: ids (aligned with the input, null for items not created) and
+            errors ({index, error} per rejected item, in input order)
+        """
+        return {
+            'ids': self.ids,
+            'errors': [
+                {'index': index, 'error': error} for index, error in sorted(self.errors.items())
+            ],
+        }
+
+
+def bulk_create(items, mode='all_or_nothing'):
+    """
+    Validate and insert a list of project items in one transaction.
+
+    Args:
+        items: List of project dictionaries (same fields as POST /api/projects)
+        mode: One of BULK_MODES
+
+    Returns:
+        BulkCreateResult: ids of the created projects and per-item errors
+    """
+    result = BulkCreateResult(len(items))
+    rows = _accepted_rows(items, result.errors)
+    if rows and (mode == 'best_effort' or not result.errors):
+        _insert(rows, result, atomic=mode == 'all_or_nothing')
+    return result
+
+
+def _accepted_rows(items, errors):
+    """
+    Validate items and check their paths with one query.
+
+    Returns:
+        dict: Input position -> projects table row for every valid item; errors
+        receives the position and message of every rejected one
+    """
+    rows = {}
+    claimed_paths = set()
+    for position, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors[position] = INVALID_ITEM_ERROR
+            continue
+        error = validate_import_item(item)
+        path = item.get('path')
+        if error is None and path is not None:
+            if path in claimed_paths:
+                error = DUPLICATE_PATH_ERROR
+            claimed_paths.add(path)
+        if error:
+            errors[position] = error
+            continue
+        rows[position] = build_import_row(item)
+
+    for position in _conflicting_positions(rows):
+        errors[position] = DUPLICATE_PATH_ERROR
+        del rows[position]
+    return rows
+
+
+def _conflicting_positions(rows):
+    """Return the positions of rows whose path already exists, with one IN query."""
+    paths = {row['path'] for row in rows.values() if row['path'] is not None}
+    if not paths:
+        return []
+    existing = set(db.session.execute(
+        select(Project.path).where(Project.path.in_(paths))
+    ).scalars())
+    return [position for position, row in rows.items() if row['path'] in existing]
+
+
+def _insert(rows, result, atomic):
+    """
+    Insert rows and commit, recording the new ids in result.
+
+    A path that was taken after the check makes the INSERT fail; the paths are
+    then checked again and the colliding rows rejected. In best_effort mode the
+    remaining rows are retried, so every attempt removes at least one row.
+    """
+    while rows:
+        try:
+            ids = _insert_rows(rows)
+            bump_projects_generation()
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            conflicts = _conflicting_positions(rows)
+            if not conflicts:
+                raise
+            for position in conflicts:
+                result.errors[position] = DUPLICATE_PATH_ERROR
+                del rows[position]
+            if atomic:
+                return
+            continue
+
+        for position, project_id in ids.items():
+            result.ids[position] = project_id
+        return
+
+
+def _insert_rows(rows):
+    """
+    Insert rows with one executemany INSERT ... RETURNING.
+
+    RETURNING does not guarantee row order, so each returned row is matched back
+    to its input position by its values; rows with identical values are
+    interchangeable.
+
+    Returns:
+        dict: Input position -> new project id
+    """
+    table = Project.__table__
+    positions = {}
+    for position, row in rows.items():
+        positions.setdefault(tuple(row[field] for field in IMPORT_FIELDS), []).append(position)
+
+    stmt = insert(table).returning(table.c.id, *(table.c[field] for field in IMPORT_FIELDS))
+    ids = {}
+    for project_id, *values in db.session.execute(stmt, list(rows.values())):
+        ids[positions[tuple(values)].pop()] = project_id
+    return ids
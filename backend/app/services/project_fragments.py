@@ -0,0 +1,124 @@
+"""
+Cached per-project JSON fragments for list responses.
+
+List responses are assembled by concatenating one encoded JSON object per
+project. ProjectFragmentCache keeps those fragments in an LRU bounded by their
+total size (keys included), so a project is only serialized and encoded again
+once its row has changed.
+
+Entries are keyed by the selected field set and the selected row values, which
+include id and updated_at. Keying on (id, updated_at) alone is not enough:
+updated_at has second resolution, so two writes in one second share it, and
+SQLite may reuse the id of a deleted project. Keying on the row itself means a
+fragment is never served for different data, whichever worker made the write
+(the same reasoning as the compressed body cache in app.compression). The
+cost is that each entry holds the row's text twice, once in its key, so both
+count towards the size bound.
+"""
+
+import threading
+from collections import OrderedDict
+
+from flask import current_app
+
+
+class ProjectFragmentCache:
+    """Thread-safe LRU of encoded project fragments with a total size bound."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def fragments(self, fields, rows, encode):
+        """
+        Return the JSON fragment for each row, encoding only rows not cached.
+
+        Args:
+            fields: Tuple of serialized fields the rows were selected for, or None
+            rows: List of selected rows
+            encode: Callable turning one row into its JSON text
+
+        Returns:
+            list: One JSON string per row, in row order
+        """
+        keys = [(fields, *row) for row in rows]
+        with self._lock:
+            found = [self._entries.get(key) for key in keys]
+            for key, fragment in zip(keys, found):
+                if fragment is not None:
+                    self._entries.move_to_end(key)
+
+        missing = [index for index, fragment in enumerate(found) if fragment is None]
+        for index in missing:
+            found[index] = encode(rows[index])
+
+        with self._lock:
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+            for index in missing:
+                self._put(keys[index], found[index])
+            self._evict()
+        return found
+
+    def _put(self, key, fragment):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= _entry_size(key, previous)
+        self._entries[key] = fragment
+        self.size += _entry_size(key, fragment)
+
+    def _evict(self):
+        """Drop least recently used fragments until the total fits max_bytes."""
+        while self.size > self.max_bytes:
+            key, evicted = self._entries.popitem(last=False)
+            self.size -= _entry_size(key, evicted)
+
+    def stats(self):
+        """Return counters for monitoring."""
+        return {
+            'entries': len(self._entries),
+            'bytes': self.size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _entry_size(key, fragment):
+    """
+    Approximate the bytes one entry holds: the fragment plus the text in its key.
+
+    Strings are the only unbounded row values (description can be any length);
+    ids, timestamps and the shared field tuple are small and fixed.
+    """
+    return len(fragment) + sum(len(value) for value in key if isinstance(value, str))
+
+
+def encode_rows(rows, serialize, fields=None):
+    """
+    Return compact JSON text for each row, through the fragment cache if enabled.
+
+    Args:
+        rows: List of rows selected with serialized_columns(fields)
+        serialize: row_serializer(fields) for those rows
+        fields: Optional subset of serialized fields the rows were selected for
+    """
+    dumps = current_app.json.dumps
+
+    def encode(row):
+        return dumps(serialize(row), separators=(',', ':'))
+
+    max_bytes = current_app.config['PROJECTS_FRAGMENT_CACHE_BYTES']
+    if max_bytes <= 0:
+        return [encode(row) for row in rows]
+    cache = current_app.extensions.setdefault(
+        'projects_fragments', ProjectFragmentCache(max_bytes)
+    )
+    return cache.fragments(tuple(fields) if fields else None, rows, encode)
@@ -0,0 +1,471 @@
+"""
+Batched project import engine.
+
+Imports projects in fixed-size chunks instead of one row at a time. For each
+chunk the existing remote_url/path keys are loaded with a single query, items are
+validated in memory, and accepted rows are written with one set-based statement
+per write group followed by a single commit. Per-item outcomes (imported,
+skipped, errors) are reported exactly as the per-row importer did.
+
+Conflict handling (on_conflict) is keyed on remote_url or path (conflict_key):
+    - skip: leave the existing project untouched (default)
+    - update: overwrite only the fields present in the import item
+    - replace: overwrite every importable field, clearing absent ones
+Updates are written with native INSERT ... ON CONFLICT DO UPDATE: on the unique
+path column directly, or on the primary key of the row matched by remote_url.
+"""
+
+from collections import Counter
+from itertools import islice
+
+from flask import current_app
+from sqlalchemy import func, insert, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models.project import Project, VALID_CLASSIFICATIONS, VALID_STATUSES
+from app.services.change_counter import bump_projects_generation
+
+# Fields copied from an import item into the projects table
+IMPORT_FIELDS = (
+    'name', 'path', 'organization', 'classification', 'status', 'description', 'remote_url'
+)
+
+# Dialects with native INSERT ... ON CONFLICT support
+UPSERT_DIALECTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+CONFLICT_MODES = ['skip', 'update', 'replace']
+CONFLICT_KEYS = ['remote_url', 'path']
+
+DUPLICATE_PATH_ERROR = 'Project with this path already exists'
+GENERIC_IMPORT_ERROR = 'Failed to import project'
+
+
+class RejectedItem:
+    """Placeholder for an input record that could not be parsed into an item."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+class ImportResult:
+    """Import statistics returned by POST /api/projects/import."""
+
+    def __init__(self, report_updates=False):
+        self.imported = 0
+        self.updated = 0
+        self.skipped = 0
+        self.errors = []
+        self.error_count = 0
+        self.report_updates = report_updates
+
+    def add_error(self, project_name, message):
+        """Record a failed item (failed items also count as skipped)."""
+        self.errors.append({'project': project_name, 'error': message})
+        self.error_count += 1
+        self.skipped += 1
+
+    def drain_errors(self):
+        """Return the errors recorded so far and stop holding them in memory."""
+        errors, self.errors = self.errors, []
+        return errors
+
+    def to_dict(self):
+        """
+        Serialize the statistics for the JSON response.
+
+        Returns:
+            dict: imported, skipped and errors (plus updated for update/replace imports)
+        """
+        result = {
+            'imported': self.imported,
+            'skipped': self.skipped,
+            'errors': self.errors,
+        }
+        if self.report_updates:
+            result['updated'] = self.updated
+        return result
+
+
+def validate_import_item(item):
+    """
+    Validate a single import item.
+
+    Args:
+        item: Dictionary with project fields
+
+    Returns:
+        str: Error message, or None if the item is valid
+    """
+    if 'name' not in item or not item['name']:
+        return 'Name is required'
+
+    error = _type_error(item)
+    if error:
+        return error
+
+    classification = item.get('classification')
+    if classification is not None and classification not in VALID_CLASSIFICATIONS:
+        return (
+            f"Invalid classification '{classification}'. "
+            f"Must be one of: {', '.join(VALID_CLASSIFICATIONS)}"
+        )
+
+    status = item.get('status', 'active')
+    if status not in VALID_STATUSES:
+        return (
+            f"Invalid status '{status}'. "
+            f"Must be one of: {', '.join(VALID_STATUSES)}"
+        )
+
+    return None
+
+
+def _type_error(item):
+    """Return an error for the first field that is neither a string nor null, or None."""
+    for field in IMPORT_FIELDS:
+        value = item.get(field)
+        if value is not None and not isinstance(value, str):
+            return f'{field} must be a string'
+    return None
+
+
+def build_import_row(item):
+    """
+    Build the projects table row for a validated import item.
+
+    Every row carries the same keys so a chunk can be sent as one executemany.
+    """
+    row = {field: item.get(field) for field in IMPORT_FIELDS}
+    row['status'] = item.get('status', 'active')
+    return row
+
+
+def supports_conflict_mode(on_conflict):
+    """Return True if the current database can run the given on_conflict mode."""
+    return on_conflict == 'skip' or db.engine.dialect.name in UPSERT_DIALECTS
+
+
+def _project_name(item):
+    """Name used to label an item in the errors list."""
+    return item.get('name', 'Unknown') if isinstance(item, dict) else 'Unknown'
+
+
+class ProjectImporter:
+    """
+    Import project items in chunks of batch_size.
+
+    Usage:
+        importer = ProjectImporter(batch_size=1000, on_conflict='update')
+        importer.import_items(items)
+        importer.result.to_dict()
+    """
+
+    def __init__(self, batch_size, on_conflict='skip', conflict_key='remote_url'):
+        self.batch_size = batch_size
+        self.on_conflict = on_conflict
+        self.conflict_key = conflict_key
+        self.result = ImportResult(report_updates=on_conflict != 'skip')
+
+    def import_items(self, items):
+        """
+        Import an iterable of items, one chunk at a time.
+
+        Args:
+            items: Iterable of project dictionaries
+
+        Returns:
+            ImportResult: Accumulated statistics
+        """
+        for _ in self.iter_import(items):
+            pass
+        return self.result
+
+    def iter_import(self, items):
+        """
+        Import items chunk by chunk, yielding the running result after each chunk.
+
+        Only one chunk of items is materialized at a time, so memory use is bounded
+        by batch_size when items is a lazy iterator.
+
+        Args:
+            items: Iterable of project dictionaries (or RejectedItem markers)
+
+        Yields:
+            tuple: (number of items in the chunk, ImportResult)
+        """
+        items = iter(items)
+        while chunk := list(islice(items, self.batch_size)):
+            self.import_chunk(chunk)
+            yield len(chunk), self.result
+
+    def _conflict_value(self, item):
+        """
+        Return the item's conflict key value, or None if it has none.
+
+        A value that is not a string is no key; validate_import_item rejects it.
+        """
+        value = item.get(self.conflict_key)
+        if not isinstance(value, str) or (self.conflict_key == 'remote_url' and not value):
+            return None
+        return value
+
+    def import_chunk(self, chunk):
+        """
+        Validate and write one chunk of items, committing once.
+
+        Items whose conflict key already exists (in the database or earlier in the
+        chunk) are skipped without an error in skip mode, matching the per-row
+        importer. In update/replace mode they become updates of the existing row;
+        a key repeated within the chunk keeps only its last occurrence.
+        """
+        existing_keys, existing_paths = self._existing_keys(chunk)
+        claimed_keys = {}
+        claimed_paths = {}
+        errors = {}
+        pending = {}
+
+        for position, item in enumerate(chunk):
+            if isinstance(item, RejectedItem):
+                errors[position] = item.error
+                continue
+            try:
+                key = self._conflict_value(item)
+                target_id = existing_keys.get(key) if key is not None else None
+                conflict = key is not None and (target_id is not None or key in claimed_keys)
+                if conflict and self.on_conflict == 'skip':
+                    self.result.skipped += 1
+                    continue
+
+                # Earlier pending item with the same key, replaced by this one
+                superseded = claimed_keys.get(key) if key is not None else None
+
+                error = validate_import_item(item)
+                path = item.get('path')
+                if error is None and path is not None:
+                    if path in claimed_paths and claimed_paths[path] != superseded:
+                        error = DUPLICATE_PATH_ERROR
+                    elif path in existing_paths and existing_paths[path] != target_id:
+                        error = DUPLICATE_PATH_ERROR
+                if error:
+                    errors[position] = error
+                    continue
+
+                row = build_import_row(item)
+                if superseded is not None:
+                    # Last occurrence of a key wins within a chunk
+                    claimed_paths.pop(pending.pop(superseded)[0]['path'], None)
+                    self.result.skipped += 1
+
+                pending[position] = (row, target_id, self._update_fields(item))
+                if key is not None:
+                    claimed_keys[key] = position
+                if path is not None:
+                    claimed_paths[path] = position
+            except Exception as e:
+                # Log full exception for debugging, report a generic error to the client
+                current_app.logger.error(
+                    f"Error importing project {_project_name(item)}: {e}",
+                    exc_info=True
+                )
+                errors[position] = GENERIC_IMPORT_ERROR
+
+        if pending:
+            errors.update(self._write_pending(pending))
+
+        for position in sorted(errors):
+            self.result.add_error(_project_name(chunk[position]), errors[position])
+
+    def _update_fields(self, item):
+        """Columns an existing row receives from this item on conflict."""
+        if self.on_conflict == 'replace':
+            fields = IMPORT_FIELDS
+        else:
+            fields = [field for field in IMPORT_FIELDS if field in item]
+        return tuple(field for field in fields if field != self.conflict_key)
+
+    def _existing_keys(self, chunk):
+        """
+        Load the stored conflict keys and paths relevant to this chunk.
+
+        Returns:
+            tuple: (conflict key value -> id, path -> id)
+        """
+        # Only string keys: other values are rejected by validate_import_item, and
+        # a list or dict would not even hash
+        items = [item for item in chunk if isinstance(item, dict)]
+        urls = {url for url in (item.get('remote_url') for item in items)
+                if isinstance(url, str) and url}
+        paths = {path for path in (item.get('path') for item in items) if isinstance(path, str)}
+
+        conditions = []
+        if urls and self.conflict_key == 'remote_url':
+            conditions.append(Project.remote_url.in_(urls))
+        if paths:
+            conditions.append(Project.path.in_(paths))
+        if not conditions:
+            return {}, {}
+
+        rows = db.session.execute(
+            select(Project.id, Project.remote_url, Project.path)
+            .where(or_(*conditions))
+            .order_by(Project.id.desc())
+        ).all()
+        # Descending order so the lowest id wins when remote_url is not unique
+        existing_paths = {path: row_id for row_id, _, path in rows if path is not None}
+        if self.conflict_key == 'path':
+            return existing_paths, existing_paths
+        existing_urls = {url: row_id for row_id, url, _ in rows if url in urls}
+        return existing_urls, existing_paths
+
+    def _write_groups(self, pending):
+        """
+        Split pending rows into groups that each run as one statement.
+
+        Returns:
+            list: (statement, {position: row}, update_positions, report_conflicts)
+        """
+        table = Project.__table__
+        dialect_insert = UPSERT_DIALECTS.get(db.session.get_bind().dialect.name)
+
+        inserts = {}
+        upserts = {}
+        updates = set()
+        for position, (row, target_id, update_fields) in pending.items():
+            if target_id is not None:
+                updates.add(position)
+            if self.on_conflict == 'skip' or (self.conflict_key == 'remote_url'
+                                              and target_id is None):
+                inserts[position] = row
+                continue
+            if self.conflict_key == 'remote_url':
+                row = dict(row, id=target_id)
+            upserts.setdefault(update_fields, {})[position] = row
+
+        groups = []
+        if inserts:
+            if dialect_insert is None:
+                groups.append((insert(table), inserts, set(), False))
+            else:
+                stmt = dialect_insert(table).on_conflict_do_nothing()
+                groups.append((stmt, inserts, set(), True))
+
+        for update_fields, rows in upserts.items():
+            stmt = dialect_insert(table)
+            set_ = {field: stmt.excluded[field] for field in update_fields}
+            set_['updated_at'] = func.now()
+            set_['version'] = table.c.version + 1
+            index_elements = ['path'] if self.conflict_key == 'path' else ['id']
+            stmt = stmt.on_conflict_do_update(index_elements=index_elements, set_=set_)
+            groups.append((stmt, rows, updates & set(rows), False))
+        return groups
+
+    def _write_pending(self, pending):
+        """
+        Write accepted rows and commit the chunk.
+
+        Args:
+            pending: Dictionary of chunk position -> (row, target id, update fields)
+
+        Returns:
+            dict: Chunk position -> error message for rows that were not written
+        """
+        groups = self._write_groups(pending)
+        try:
+            # No savepoint: pysqlite commits at RELEASE, which would publish the
+            # rows before their generation bump. The chunk, its bump and the
+            # commit are one transaction; a failure rolls all of it back.
+            errors = {}
+            for stmt, rows, _, report_conflicts in groups:
+                errors.update(self._execute_group(stmt, rows, report_conflicts))
+            bump_projects_generation()
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            return self._write_rows_individually(groups)
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"Error importing project chunk: {e}", exc_info=True)
+            return {position: GENERIC_IMPORT_ERROR for position in pending}
+
+        self._count_written(groups, errors)
+        return errors
+
+    def _execute_group(self, stmt, rows, report_conflicts):
+        """
+        Execute one write group, reporting rows that lost a path race.
+
+        For ON CONFLICT DO NOTHING inserts, RETURNING path tells us which rows
+        were actually written; a row missing from the result collided with a
+        path inserted concurrently after the chunk was pre-loaded.
+        """
+        if not report_conflicts or not db.session.get_bind().dialect.insert_executemany_returning:
+            db.session.execute(stmt, list(rows.values()))
+            return {}
+
+        table = Project.__table__
+        inserted_paths = Counter(
+            db.session.execute(stmt.returning(table.c.path), list(rows.values())).scalars()
+        )
+
+        errors = {}
+        for position, row in rows.items():
+            if row['path'] is None:
+                continue
+            if inserted_paths[row['path']]:
+                inserted_paths[row['path']] -= 1
+            else:
+                errors[position] = DUPLICATE_PATH_ERROR
+        return errors
+
+    def _write_rows_individually(self, groups):
+        """
+        Fallback after a failed chunk: write each row in its own transaction.
+
+        Each row commits together with its generation bump, so a row is either
+        written and visible to caches or rolled back and reported as an error.
+        """
+        errors = {}
+        for stmt, rows, _, report_conflicts in groups:
+            for position, row in rows.items():
+                try:
+                    written = db.session.execute(stmt, [row]).rowcount
+                    if report_conflicts and written == 0:
+                        errors[position] = DUPLICATE_PATH_ERROR
+                    else:
+                        bump_projects_generation()
+                    db.session.commit()
+                except IntegrityError as e:
+                    db.session.rollback()
+                    current_app.logger.warning(
+                        f"IntegrityError importing project {row['name']}: {e}",
+                        exc_info=True
+                    )
+                    message = str(e).lower()
+                    errors[position] = (DUPLICATE_PATH_ERROR
+                                        if 'path' in message or 'unique' in message
+                                        else GENERIC_IMPORT_ERROR)
+                except Exception as e:
+                    db.session.rollback()
+                    current_app.logger.error(
+                        f"Error importing project {row['name']}: {e}", exc_info=True
+                    )
+                    errors[position] = GENERIC_IMPORT_ERROR
+
+        self._count_written(groups, errors)
+        return errors
+
+    def _count_written(self, groups, errors):
+        """Add successfully written rows to the imported/updated totals."""
+        for _, rows, update_positions, _ in groups:
+            for position in rows:
+                if position in errors:
+                    continue
+                if position in update_positions:
+                    self.result.updated += 1
+                else:
+                    self.result.imported += 1
@@ -0,0 +1,194 @@
+"""
+In-process bitmap index for project list filters.
+
+ProjectBitmapIndex is an immutable columnar copy of the projects table (the
+serialized values, one list per field, in id order) with one bitset per distinct
+value of each filter column. A combined filter is the AND (across columns) of
+ORs (across accepted values) of a few Python ints, so equality and IN filters on
+status, classification, project_type and organization are answered without
+touching the database.
+
+Each index records the projects write generation it was built at (see
+app.services.change_counter). A list request uses the index only while that
+generation is still current; otherwise the request is answered by SQL and the
+index is rebuilt after the response has been sent. Because the generation lives
+in the database, a write made by any worker process makes every worker's index
+cold.
+"""
+
+import threading
+
+from flask import current_app
+
+from app import db
+from app.models.project import Project, row_serializer, serialized_columns
+from app.services.change_counter import projects_generation
+
+# Project columns with one bitset per distinct value
+INDEXED_COLUMNS = ('status', 'classification', 'project_type', 'organization')
+
+
+class ProjectBitmapIndex:
+    """Immutable columnar snapshot of the projects table at one write generation."""
+
+    def __init__(self, generation, projects):
+        """
+        Build the index from projects in id order.
+
+        Args:
+            generation: Projects write generation read before the rows were loaded
+            projects: Iterable of serialized project dicts ordered by id
+        """
+        self.generation = generation
+        self._columns = {}
+        positions = {column: {} for column in INDEXED_COLUMNS}
+
+        size = 0
+        for position, project in enumerate(projects):
+            for key, value in project.items():
+                self._columns.setdefault(key, []).append(value)
+            for column in INDEXED_COLUMNS:
+                positions[column].setdefault(project[column], []).append(position)
+            size = position + 1
+
+        self.size = size
+        self._all = (1 << size) - 1
+        self._bitmaps = {
+            column: {value: _bitmap(members, size) for value, members in values.items()}
+            for column, values in positions.items()
+        }
+
+    def match(self, filters):
+        """
+        Return the bitset of rows matching every column in filters.
+
+        Args:
+            filters: Dictionary of indexed column -> tuple of accepted values
+        """
+        bitmap = self._all
+        for column, values in filters.items():
+            accepted = 0
+            for value in values:
+                accepted |= self._bitmaps[column].get(value, 0)
+            bitmap &= accepted
+        return bitmap
+
+    def facets(self, bitmap):
+        """Return {column: {value: count}} for the rows in a bitset, leaving out NULL values."""
+        facets = {}
+        for column, values in self._bitmaps.items():
+            facets[column] = {}
+            for value, members in values.items():
+                count = (members & bitmap).bit_count()
+                if value is not None and count:
+                    facets[column][value] = count
+        return facets
+
+    def rows(self, bitmap, fields=None):
+        """Return the serialized rows (optionally only fields) for a bitset, in id order."""
+        columns = self._columns.items()
+        if fields:
+            columns = [(field, self._columns[field]) for field in fields]
+        return [
+            {key: values[position] for key, values in columns}
+            for position in _positions(bitmap)
+        ]
+
+
+def _bitmap(positions, size):
+    """Build an int bitset from row positions in O(size)."""
+    bits = bytearray((size + 7) // 8)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def _positions(bitmap):
+    """Yield set bit positions in ascending order."""
+    binary = bin(bitmap)[:1:-1]
+    position = binary.find('1')
+    while position != -1:
+        yield position
+        position = binary.find('1', position + 1)
+
+
+class _IndexState:
+    """Per-app holder for the current index and its rebuild guard."""
+
+    def __init__(self):
+        self.index = None
+        self.building = False
+        self.lock = threading.Lock()
+
+
+def _state():
+    return current_app.extensions.setdefault('projects_index', _IndexState())
+
+
+def warm_index(generation=None):
+    """
+    Return the bitmap index if it is enabled and current, else None.
+
+    When the index is enabled but cold, the caller falls back to SQL and should
+    pass its response to schedule_rebuild.
+
+    Args:
+        generation: Current projects write generation, if the caller has
+            already read it; otherwise it is read here
+    """
+    if not current_app.config['PROJECTS_BITMAP_INDEX']:
+        return None
+    index = _state().index
+    if index is None:
+        return None
+    if generation is None:
+        generation = projects_generation()
+    if index.generation != generation:
+        return None
+    return index
+
+
+def schedule_rebuild(response):
+    """
+    Rebuild the index once response has been sent to the client.
+
+    Only one rebuild runs at a time per app; concurrent cold requests skip it.
+    """
+    state = _state()
+    with state.lock:
+        if state.building:
+            return response
+        state.building = True
+
+    app = current_app._get_current_object()
+
+    def rebuild():
+        with app.app_context():
+            try:
+                state.index = build_index()
+            except Exception as e:
+                app.logger.error(f"Error building project bitmap index: {e}", exc_info=True)
+            finally:
+                state.building = False
+
+    response.call_on_close(rebuild)
+    return response
+
+
+def build_index():
+    """
+    Build a ProjectBitmapIndex from the database.
+
+    The generation is read before the rows, so a write landing during the scan
+    leaves the index looking stale rather than wrongly current.
+    """
+    generation = projects_generation()
+    if generation is None:
+        return None
+    batch_size = current_app.config['PROJECTS_STREAM_BATCH_SIZE']
+    rows = db.session.execute(
+        db.select(*serialized_columns()).order_by(Project.id)
+        .execution_options(yield_per=batch_size)
+    )
+    serialize = row_serializer()
+    return ProjectBitmapIndex(generation, (serialize(row) for row in rows))
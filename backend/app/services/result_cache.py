@@ -0,0 +1,228 @@
+"""
+Result cache for project list responses.
+
+Dashboards repeat the same few filter combinations between writes. Each worker
+keeps the encoded bodies of recent list responses in an LRU keyed by the
+normalized query arguments and representation, and tagged with the projects
+write generation (see app.services.change_counter) they were built at.
+
+A request first reads the current generation. Entries from an older generation
+are never served, and the whole cache is dropped the first time a newer
+generation is seen. Because the generation lives in the database, a write made
+by any worker invalidates every worker's cache. Entries also expire after
+PROJECTS_RESULT_CACHE_TTL seconds, bounding staleness for writes made outside
+the API (migrations, manual SQL).
+
+Misses are single-flight: when many requests for the same key miss at once
+(after a write or an expiry), one of them builds the response and the others
+wait for it and share its encoded body, so each distinct list is queried and
+serialized once per worker per refresh.
+
+With PROJECTS_STALE_WHILE_REVALIDATE set, invalidated and expired entries are
+kept as stale copies for that many seconds. A request that finds only a stale
+copy is answered with it at once, and the first such request refreshes the
+entry after its response has been sent.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+from app.services.change_counter import projects_generation
+
+
+class _Flight:
+    """One in-progress build that concurrent callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+
+
+class ListResultCache:
+    """Thread-safe LRU of list responses for one write generation, with a TTL."""
+
+    def __init__(self, max_entries, ttl, max_stale=0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stale_hits = 0
+        self.generation = None
+        self._clock = clock
+        # key -> (expires_at, value, stored_at)
+        self._entries = OrderedDict()
+        # key -> (stale_since, value, stored_at)
+        self._stale = OrderedDict()
+        self._refreshing = set()
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def get(self, generation, key):
+        """Return the cached value for key at generation, or None."""
+        with self._lock:
+            self._advance(generation)
+            self._expire(key)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_stale(self, generation, key):
+        """
+        Return a stale copy for key when no fresh entry exists, or None.
+
+        Returns:
+            tuple: (value, age, refresh) where age is the seconds since the
+            value was built and refresh is True for exactly one caller until
+            refresh_done(key) is called
+        """
+        with self._lock:
+            self._advance(generation)
+            self._expire(key)
+            entry = self._stale.get(key)
+            if key in self._entries or entry is None:
+                return None
+            stale_since, value, stored_at = entry
+            now = self._clock()
+            if now - stale_since > self.max_stale:
+                del self._stale[key]
+                return None
+            refresh = key not in self._refreshing
+            self._refreshing.add(key)
+            self.stale_hits += 1
+            return value, now - stored_at, refresh
+
+    def refresh_done(self, key):
+        """Allow the next stale read of key to trigger a refresh again."""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def put(self, generation, key, value):
+        """Cache value for key if generation is still the newest one seen."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._advance(generation)
+            if generation != self.generation:
+                return
+            now = self._clock()
+            self._entries[key] = (now + self.ttl, value, now)
+            self._entries.move_to_end(key)
+            self._stale.pop(key, None)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_build(self, generation, key, build, wait_timeout):
+        """
+        Return the cached value for key, running build at most once concurrently.
+
+        On a miss the first caller runs build(), which returns (result, value):
+        its own result plus the value to cache and share, or None if there is
+        nothing cacheable. Concurrent callers for the same key wait for that
+        build instead of starting their own; if it fails, yields no value or
+        takes longer than wait_timeout seconds, they run build() themselves.
+
+        Returns:
+            tuple: (result, value), where result is None when the value came
+            from the cache or another caller's build
+        """
+        value = self.get(generation, key)
+        if value is not None:
+            return None, value
+
+        flight_key = (generation, key)
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[flight_key] = _Flight()
+
+        if not leader:
+            if flight.done.wait(wait_timeout) and flight.value is not None:
+                with self._lock:
+                    self.coalesced += 1
+                return None, flight.value
+            return build()
+
+        try:
+            result, flight.value = build()
+            if flight.value is not None:
+                self.put(generation, key, flight.value)
+        finally:
+            with self._lock:
+                del self._flights[flight_key]
+            flight.done.set()
+        return result, flight.value
+
+    def _advance(self, generation):
+        """Drop (or keep as stale) every entry once a newer write generation is seen."""
+        if self.generation is None or generation > self.generation:
+            now = self._clock()
+            for key, (_, value, stored_at) in self._entries.items():
+                self._keep_stale(key, now, value, stored_at)
+            self._entries.clear()
+            self.generation = generation
+
+    def _expire(self, key):
+        """Drop (or keep as stale) the entry for key if its TTL has passed."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[key]
+            self._keep_stale(key, *entry)
+
+    def _keep_stale(self, key, stale_since, value, stored_at):
+        if self.max_stale <= 0:
+            return
+        self._stale[key] = (stale_since, value, stored_at)
+        self._stale.move_to_end(key)
+        while len(self._stale) > self.max_entries:
+            self._stale.popitem(last=False)
+
+    def stats(self):
+        """Return counters for monitoring."""
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'stale_hits': self.stale_hits,
+            'generation': self.generation,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def list_result_cache():
+    """Return this app's list result cache, creating it from config on first use."""
+    return current_app.extensions.setdefault('projects_results', ListResultCache(
+        current_app.config['PROJECTS_RESULT_CACHE_SIZE'],
+        current_app.config['PROJECTS_RESULT_CACHE_TTL'],
+        current_app.config['PROJECTS_STALE_WHILE_REVALIDATE'],
+    ))
+
+
+def result_cache_key(args, representation):
+    """
+    Return (generation, key) for a list request, or None if it must not be cached.
+
+    Args:
+        args: Request query arguments
+        representation: Hashable description of the response format
+    """
+    if current_app.config['PROJECTS_RESULT_CACHE_SIZE'] <= 0:
+        return None
+    generation = projects_generation()
+    if generation is None:
+        return None
+    normalized = tuple(sorted((name, value) for name, value in args.items(multi=True)))
+    return generation, (representation, normalized)
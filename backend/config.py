@@ -22,7 +22,49 @@ class Config:
     
     # CORS settings (override in subclasses)
     CORS_ORIGINS = []
-    
+
+    # Keyset pagination for GET /api/projects (used when limit or cursor is given)
+    PROJECTS_DEFAULT_PAGE_SIZE = 100
+    PROJECTS_MAX_PAGE_SIZE = 1000
+
+    # Most ids POST /api/projects/batch-get resolves in one request (one IN query)
+    PROJECTS_BATCH_GET_MAX_IDS = 1000
+
+    # Rows fetched and encoded per chunk when streaming GET /api/projects
+    PROJECTS_STREAM_BATCH_SIZE = 500
+
+    # Answer exact-match list filters from an in-process bitmap index (see
+    # app.services.project_index); costs one columnar copy of the table per worker
+    PROJECTS_BITMAP_INDEX = False
+
+    # Byte budget for cached per-project JSON fragments per worker (see
+    # app.services.project_fragments); 0 disables the cache
+    PROJECTS_FRAGMENT_CACHE_BYTES = 32 * 1024 * 1024
+
+    # Cached list responses per worker, dropped on any write (see
+    # app.services.result_cache); 0 entries disables the cache
+    PROJECTS_RESULT_CACHE_SIZE = 64
+    PROJECTS_RESULT_CACHE_TTL = 60  # seconds
+    # Longest wait for a concurrent identical list request's result before building it
+    PROJECTS_COALESCE_TIMEOUT = 30  # seconds
+    # Serve a list invalidated or expired up to this many seconds ago while it is
+    # refreshed after the response is sent; 0 disables stale-while-revalidate
+    PROJECTS_STALE_WHILE_REVALIDATE = 0  # seconds
+
+    # Most projects POST /api/projects/bulk creates in one request (one transaction)
+    PROJECTS_BULK_MAX_ITEMS = 1000
+
+    # Rows validated, inserted and committed together by POST /api/projects/import
+    IMPORT_BATCH_SIZE = 1000
+
+    # Upper bound on a gzip/deflate request body once decompressed (guards against zip bombs)
+    MAX_DECOMPRESSED_REQUEST_SIZE = 1024 * 1024 * 1024
+
+    # Response compression: minimum body size, gzip level, cached compressed bodies per worker
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_LEVEL = 6
+    COMPRESS_CACHE_SIZE = 32
+
     @staticmethod
     def init_app(app):
         """Initialize application with config-specific settings."""
@@ -0,0 +1,66 @@
+"""Add projects_fts full-text index with sync triggers
+
+Revision ID: a41c9e2f7d10
+Revises: e8b0673fe1a0
+Create Date: 2026-10-18 09:20:00.000000
+
+"""
+import sqlite3
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41c9e2f7d10'
+down_revision = 'e8b0673fe1a0'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = 'name, description, organization, path'
+NEW_COLUMNS = 'new.name, new.description, new.organization, new.path'
+OLD_COLUMNS = 'old.name, old.description, old.organization, old.path'
+
+
+def _fts_supported():
+    # FTS5 trigram tokenizer requires SQLite 3.34+; other databases keep ILIKE search
+    bind = op.get_bind()
+    return bind.dialect.name == 'sqlite' and sqlite3.sqlite_version_info >= (3, 34, 0)
+
+
+def upgrade():
+    if not _fts_supported():
+        return
+
+    op.execute(
+        f"CREATE VIRTUAL TABLE projects_fts USING fts5({COLUMNS}, "
+        "content='projects', content_rowid='id', tokenize='trigram')"
+    )
+    op.execute(
+        "CREATE TRIGGER projects_fts_ai AFTER INSERT ON projects BEGIN "
+        f"INSERT INTO projects_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_COLUMNS}); END"
+    )
+    op.execute(
+        "CREATE TRIGGER projects_fts_ad AFTER DELETE ON projects BEGIN "
+        f"INSERT INTO projects_fts(projects_fts, rowid, {COLUMNS}) "
+        f"VALUES ('delete', old.id, {OLD_COLUMNS}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER projects_fts_au AFTER UPDATE OF {COLUMNS} ON projects BEGIN "
+        f"INSERT INTO projects_fts(projects_fts, rowid, {COLUMNS}) "
+        f"VALUES ('delete', old.id, {OLD_COLUMNS}); "
+        f"INSERT INTO projects_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_COLUMNS}); END"
+    )
+
+    # Index existing rows
+    op.execute("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    if not _fts_supported():
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS projects_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS projects_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS projects_fts_ai")
+    op.execute("DROP TABLE IF EXISTS projects_fts")
@@ -0,0 +1,61 @@
+"""Stop SQLite from reusing deleted project ids (AUTOINCREMENT)
+
+Revision ID: a9c4e2b7f318
+Revises: e4a1c7b9d352
+Create Date: 2026-10-18 18:30:00.000000
+
+"""
+import sqlite3
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c4e2b7f318'
+down_revision = 'e4a1c7b9d352'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = 'name, description, organization, path'
+NEW_COLUMNS = 'new.name, new.description, new.organization, new.path'
+OLD_COLUMNS = 'old.name, old.description, old.organization, old.path'
+
+
+def _rebuild_projects(autoincrement):
+    # AUTOINCREMENT can only be declared in CREATE TABLE, so the table is rebuilt;
+    # ids are copied unchanged. Other databases never reuse sequence values.
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    with op.batch_alter_table('projects', schema=None, recreate='always',
+                              table_kwargs={'sqlite_autoincrement': autoincrement}):
+        pass
+
+    # Dropping the old table dropped its projects_fts sync triggers
+    if sqlite3.sqlite_version_info < (3, 34, 0):
+        return
+    op.execute(
+        "CREATE TRIGGER projects_fts_ai AFTER INSERT ON projects BEGIN "
+        f"INSERT INTO projects_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_COLUMNS}); END"
+    )
+    op.execute(
+        "CREATE TRIGGER projects_fts_ad AFTER DELETE ON projects BEGIN "
+        f"INSERT INTO projects_fts(projects_fts, rowid, {COLUMNS}) "
+        f"VALUES ('delete', old.id, {OLD_COLUMNS}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER projects_fts_au AFTER UPDATE OF {COLUMNS} ON projects BEGIN "
+        f"INSERT INTO projects_fts(projects_fts, rowid, {COLUMNS}) "
+        f"VALUES ('delete', old.id, {OLD_COLUMNS}); "
+        f"INSERT INTO projects_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW_COLUMNS}); END"
+    )
+
+
+def upgrade():
+    _rebuild_projects(autoincrement=True)
+
+
+def downgrade():
+    _rebuild_projects(autoincrement=False)
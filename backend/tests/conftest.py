@@ -4,10 +4,52 @@ Pytest configuration and shared fixtures.
 Provides common test fixtures for Flask application testing.
 """
 
+import re
+
 import pytest
+from sqlalchemy import event
 from app import create_app, db
 
 
+class StatementRecorder:
+    """
+    Record the SQL statements executed on an engine inside a with block.
+
+    Each with block starts a fresh recording. executed holds (statement,
+    parameters) pairs in execution order; statements holds just the SQL.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.executed = []
+
+    def __enter__(self):
+        self.executed = []
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.executed.append((statement, parameters))
+
+    @property
+    def statements(self):
+        return [statement for statement, _ in self.executed]
+
+    def verbs(self, table=None):
+        """
+        Return the leading keyword of each statement (e.g. ['INSERT', 'UPDATE']).
+
+        Args:
+            table: Only include statements that read or write this table
+        """
+        pattern = re.compile(rf'\b(FROM|INTO|UPDATE) {table}\b') if table else None
+        return [statement.split()[0].upper() for statement in self.statements
+                if pattern is None or pattern.search(statement)]
+
+
 @pytest.fixture
 def app():
     """
@@ -65,3 +107,21 @@ def cli_runner():
     from click.testing import CliRunner
     return CliRunner()
 
+
+@pytest.fixture
+def statement_recorder(app):
+    """
+    Create a recorder for the SQL statements the application executes.
+
+    Usage:
+        with statement_recorder:
+            client.get('/api/projects')
+        assert statement_recorder.verbs() == ['SELECT']
+
+    Args:
+        app: Flask application fixture
+
+    Returns:
+        StatementRecorder bound to the application's engine
+    """
+    return StatementRecorder(db.engine)
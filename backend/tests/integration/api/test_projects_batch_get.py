@@ -0,0 +1,103 @@
+"""
+Integration tests for POST /api/projects/batch-get.
+
+Tests resolving many project ids in one IN query, the missing list, field
+projection, validation and reuse of the fragment cache.
+"""
+
+import pytest
+import json
+from app.models.project import Project
+from app import db
+
+
+@pytest.fixture
+def projects(app):
+    """Create 5 projects (ids 1-5)."""
+    with app.app_context():
+        db.session.add_all([
+            Project(name=f'Project {i}', path=f'/p/{i}', status='active') for i in range(1, 6)
+        ])
+        db.session.commit()
+
+
+def _batch_get(client, ids, query=''):
+    return client.post(f'/api/projects/batch-get{query}', json={'ids': ids})
+
+
+@pytest.mark.integration
+def test_batch_get_in_request_order(client, projects):
+    """Test found projects come back in request order and unknown ids in missing."""
+    response = _batch_get(client, [4, 99, 2, 4, 1, 7])
+
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert [project['id'] for project in data['projects']] == [4, 2, 1]
+    assert data['missing'] == [99, 7]
+    assert data['projects'][0] == json.loads(client.get('/api/projects/4').data)
+
+
+@pytest.mark.integration
+def test_batch_get_single_query(client, projects, statement_recorder):
+    """Test every id is resolved by one IN query."""
+    with statement_recorder:
+        _batch_get(client, [1, 2, 3, 4, 5])
+
+    statements = [s for s in statement_recorder.statements if 'FROM projects' in s]
+    assert len(statements) == 1
+    assert ' IN ' in statements[0]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('fields', ['name,status', 'id,name'])
+def test_batch_get_fields(client, projects, fields):
+    """Test fields narrows each project, with or without id."""
+    data = json.loads(_batch_get(client, [3, 1], f'?fields={fields}').data)
+
+    assert [list(project) for project in data['projects']] == [fields.split(',')] * 2
+    assert data['projects'][0]['name'] == 'Project 3'
+
+
+@pytest.mark.integration
+def test_batch_get_empty(client, projects):
+    """Test an empty id list returns empty results."""
+    data = json.loads(_batch_get(client, []).data)
+
+    assert data == {'missing': [], 'projects': []}
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('body', [
+    None, [], {}, {'ids': 3}, {'ids': ['1']}, {'ids': [True]}, {'ids': [0]}, {'ids': [1.5]},
+    {'ids': [1, 2 ** 70]}, {'ids': [2 ** 63]},
+])
+def test_batch_get_invalid_body(client, projects, body):
+    """Test bodies without a list of positive 64-bit integer ids return 400."""
+    response = client.post('/api/projects/batch-get', json=body)
+
+    assert response.status_code == 400
+
+
+@pytest.mark.integration
+def test_batch_get_too_many_ids(client, app, projects):
+    """Test more distinct ids than PROJECTS_BATCH_GET_MAX_IDS returns 400."""
+    app.config['PROJECTS_BATCH_GET_MAX_IDS'] = 3
+
+    assert _batch_get(client, [1, 2, 3, 3]).status_code == 200
+    response = _batch_get(client, [1, 2, 3, 4])
+
+    assert response.status_code == 400
+    assert 'At most 3 ids' in json.loads(response.data)['error']
+
+
+@pytest.mark.integration
+def test_batch_get_reuses_fragment_cache(client, app, projects):
+    """Test projects already encoded for a list are not encoded again."""
+    app.config['PROJECTS_RESULT_CACHE_SIZE'] = 0
+    client.get('/api/projects?fields=name,status')
+    cache = app.extensions['projects_fragments']
+    hits = cache.hits
+
+    _batch_get(client, [1, 2, 3], '?fields=name,status')
+
+    assert cache.hits == hits + 3
@@ -0,0 +1,205 @@
+"""
+Integration tests for the in-process bitmap index behind GET /api/projects.
+
+Tests that indexed answers match SQL, that every write path makes the index
+cold, and that cold or unsupported requests fall back to SQL.
+"""
+
+import pytest
+import json
+from sqlalchemy import update
+from app.models import ChangeCounter, Project
+from app.services.project_index import ProjectBitmapIndex
+from app import db
+
+
+@pytest.fixture
+def projects(app):
+    """Create projects spread over every indexed column."""
+    with app.app_context():
+        statuses = ['active', 'paused', 'completed', 'cancelled']
+        classifications = ['primary', 'secondary', 'archive', 'maintenance', None]
+        project_types = ['Work', 'Personal', 'Learning', None]
+        organizations = ['work', 'personal', None]
+        db.session.add_all([
+            Project(
+                name=f'Project {i}',
+                path=f'/p/{i}',
+                status=statuses[i % 4],
+                classification=classifications[i % 5],
+                project_type=project_types[i % 4 if i % 3 else 3],
+                organization=organizations[i % 3],
+            )
+            for i in range(60)
+        ])
+        db.session.commit()
+
+
+@pytest.fixture
+def indexed(app):
+    """Enable the bitmap index."""
+    app.config['PROJECTS_BITMAP_INDEX'] = True
+
+
+def _index(app):
+    state = app.extensions.get('projects_index')
+    return state.index if state else None
+
+
+def _warm(client):
+    """GET the list and close the response, as a WSGI server does once it is sent."""
+    client.get('/api/projects').close()
+
+
+def _project_reads(recorder, client, url):
+    """GET url (closing the response) and count statements that read the projects table."""
+    with recorder:
+        response = client.get(url)
+        response.close()
+    return response, len(recorder.verbs(table='projects'))
+
+
+@pytest.mark.integration
+def test_index_builds_after_cold_request(client, app, projects, indexed, statement_recorder):
+    """Test the first request is answered by SQL and warms the index afterwards."""
+    assert _index(app) is None
+
+    response, selects = _project_reads(statement_recorder, client, '/api/projects')
+    assert len(json.loads(response.data)) == 60
+    assert selects >= 1
+    assert _index(app) is not None
+
+    response, selects = _project_reads(statement_recorder, client, '/api/projects')
+    assert len(json.loads(response.data)) == 60
+    assert selects == 0
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('query', [
+    '',
+    'status=active',
+    'status=paused&classification=archive',
+    'organization=work&project_type=Work',
+    'status=completed&organization=personal&classification=secondary&project_type=Learning',
+    'status=bogus&classification=bogus',   # Invalid values are ignored
+    'organization=nobody',
+    'organization=',
+    'status=active,paused&project_type=Work,Personal',
+    'classification=archive,bogus&organization=work,personal',
+])
+def test_index_matches_sql(client, app, projects, query, statement_recorder):
+    """Test indexed answers are identical to the SQL answers."""
+    expected = json.loads(client.get(f'/api/projects?{query}').data)
+
+    app.config['PROJECTS_BITMAP_INDEX'] = True
+    _warm(client)
+    response, selects = _project_reads(statement_recorder, client, f'/api/projects?{query}')
+
+    assert selects == 0
+    assert json.loads(response.data) == expected
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('cache_size', [0, 64])
+def test_warm_index_reads_no_projects(client, app, projects, indexed, cache_size,
+                                      statement_recorder):
+    """Test a warm answer is tagged and counted without reading the projects table."""
+    app.config['PROJECTS_RESULT_CACHE_SIZE'] = cache_size
+    _warm(client)
+    expected = Project.query.filter_by(status='active').count()
+
+    response, reads = _project_reads(statement_recorder, client,
+                                     '/api/projects?status=active&count=true')
+
+    assert reads == 0
+    assert response.headers['ETag']
+    assert response.headers['X-Total-Count'] == str(expected)
+    assert len(json.loads(response.data)) == expected
+
+
+@pytest.mark.integration
+def test_index_invalid_project_type_still_rejected(client, projects, indexed):
+    """Test validation errors are unchanged when the index is warm."""
+    _warm(client)
+
+    response = client.get('/api/projects?project_type=Bogus')
+
+    assert response.status_code == 400
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('write', ['create', 'update', 'delete', 'archive', 'import'])
+def test_writes_make_index_cold(client, app, projects, indexed, write, statement_recorder):
+    """Test every write path bumps the generation so the next list sees the change."""
+    _warm(client)
+    first = db.session.scalars(db.select(Project.id).order_by(Project.id)).first()
+
+    if write == 'create':
+        client.post('/api/projects', json={'name': 'New'})
+    elif write == 'update':
+        client.patch(f'/api/projects/{first}', json={'name': 'Changed'})
+    elif write == 'delete':
+        client.delete(f'/api/projects/{first}')
+    elif write == 'archive':
+        client.put(f'/api/projects/{first}/archive')
+    else:
+        client.post('/api/projects/import', json={'projects': [{'name': 'Imported'}]})
+
+    expected = [project.to_dict() for project in Project.query.order_by(Project.id)]
+    response, selects = _project_reads(statement_recorder, client, '/api/projects')
+    assert selects >= 1  # Cold: answered by SQL
+    assert json.loads(response.data) == expected
+
+    response, selects = _project_reads(statement_recorder, client, '/api/projects')
+    assert selects == 0  # Rebuilt after the cold response
+    assert json.loads(response.data) == expected
+
+
+@pytest.mark.integration
+def test_write_from_another_process_makes_index_cold(client, app, projects, indexed,
+                                                     statement_recorder):
+    """Test a generation bump committed elsewhere invalidates this worker's index."""
+    _warm(client)
+    db.session.execute(update(ChangeCounter).values(value=ChangeCounter.value + 1))
+    db.session.commit()
+
+    _, selects = _project_reads(statement_recorder, client, '/api/projects')
+
+    assert selects >= 1
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('query', ['search=Project 1', 'limit=5', 'stream=true'])
+def test_unsupported_requests_use_sql(client, projects, indexed, query, statement_recorder):
+    """Test search, pagination and streaming bypass the index."""
+    _warm(client)
+
+    _, selects = _project_reads(statement_recorder, client, f'/api/projects?{query}')
+
+    assert selects >= 1
+
+
+@pytest.mark.integration
+def test_index_disabled_by_default(client, app, projects):
+    """Test the index is never built unless enabled."""
+    _warm(client)
+    _warm(client)
+
+    assert _index(app) is None
+
+
+@pytest.mark.integration
+def test_bitmap_index_unit(app, projects):
+    """Test bitset intersection and row reconstruction directly."""
+    rows = Project.query.order_by(Project.id).all()
+    index = ProjectBitmapIndex(0, [p.to_dict() for p in rows])
+
+    bitmap = index.match({'status': ('active',), 'organization': ('work',)})
+    expected = [p.to_dict() for p in rows if p.status == 'active' and p.organization == 'work']
+
+    assert index.size == 60
+    assert index.rows(bitmap) == expected
+    assert index.rows(index.match({'status': ('nonexistent',)})) == []
+    either = index.rows(index.match({'status': ('active', 'paused')}))
+    assert either == [p.to_dict() for p in rows if p.status in ('active', 'paused')]
+    assert len(index.rows(index.match({}))) == 60
@@ -0,0 +1,170 @@
+"""
+Integration tests for PUT /api/projects/archive and DELETE /api/projects.
+
+Tests set-based archive and delete by id list or list filters, dry runs, the
+single-statement writes and validation of the selection.
+"""
+
+import pytest
+import json
+from datetime import datetime
+from app.models.project import Project
+from app import db
+
+
+@pytest.fixture
+def projects(app):
+    """Create 6 projects; 1-3 last updated in 2023, 4-6 in 2024, project 2 archived."""
+    with app.app_context():
+        db.session.add_all([
+            Project(
+                name=f'Repo {i}',
+                path=f'/repos/{i}',
+                organization='acme' if i % 2 else 'globex',
+                classification='archive' if i == 2 else 'primary',
+                status='completed' if i == 2 else 'active',
+                created_at=datetime(2023, 1, 1),
+                updated_at=datetime(2023 if i <= 3 else 2024, 6, i),
+            )
+            for i in range(1, 7)
+        ])
+        db.session.commit()
+
+
+def _projects(client):
+    return {p['id']: p for p in json.loads(client.get('/api/projects').data)}
+
+
+def _statements(recorder, client, method, url, body):
+    """Send a request and return it with the statements that touch the projects table."""
+    with recorder:
+        response = client.open(url, method=method, json=body)
+    return response, recorder.verbs(table='projects')
+
+
+@pytest.mark.integration
+def test_bulk_archive_by_filter(client, projects, statement_recorder):
+    """Test stale projects are archived in one UPDATE, skipping already archived ones."""
+    response, statements = _statements(statement_recorder, client, 'PUT', '/api/projects/archive', {
+        'filter': {'updated_before': '2024-01-01'}, 'return_ids': True
+    })
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == {'archived': 2, 'ids': [1, 3]}
+    assert statements == ['UPDATE']
+    rows = _projects(client)
+    assert all(rows[pid]['classification'] == 'archive' for pid in (1, 2, 3))
+    assert all(rows[pid]['status'] == 'completed' for pid in (1, 2, 3))
+    assert rows[4]['classification'] == 'primary'
+    assert client.get('/api/projects/1').headers['ETag'] == '"2"'
+    assert client.get('/api/projects/2').headers['ETag'] == '"1"'
+
+
+@pytest.mark.integration
+def test_bulk_archive_by_ids(client, projects):
+    """Test an id list archives exactly those projects."""
+    response = client.put('/api/projects/archive', json={'ids': [4, 5]})
+
+    assert json.loads(response.data) == {'archived': 2}
+    assert [pid for pid, p in _projects(client).items() if p['status'] == 'completed'] == [2, 4, 5]
+
+
+@pytest.mark.integration
+def test_bulk_delete_by_filter(client, projects, statement_recorder):
+    """Test matching projects are deleted in one DELETE."""
+    response, statements = _statements(statement_recorder, client, 'DELETE', '/api/projects', {
+        'filter': {'organization': 'acme', 'updated_before': '2024-01-01'}, 'return_ids': True
+    })
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == {'deleted': 2, 'ids': [1, 3]}
+    assert statements == ['DELETE']
+    assert list(_projects(client)) == [2, 4, 5, 6]
+    assert client.get('/api/projects/1').status_code == 404
+
+
+@pytest.mark.integration
+def test_bulk_delete_by_ids_and_search(client, projects):
+    """Test ids and a search filter combine, and deleted rows leave the search index."""
+    response = client.delete('/api/projects', json={'ids': [4, 5, 6], 'filter': {'search': 'Repo'}})
+
+    assert json.loads(response.data) == {'deleted': 3}
+    assert [p['id'] for p in json.loads(client.get('/api/projects?search=Repo').data)] == [1, 2, 3]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('method, url, body, expected', [
+    ('DELETE', '/api/projects', {'filter': {'updated_before': '2024-01-01'}},
+     {'matched': 3, 'dry_run': True}),
+    ('DELETE', '/api/projects', {'ids': [1, 6, 9], 'return_ids': True},
+     {'matched': 2, 'ids': [1, 6], 'dry_run': True}),
+    ('PUT', '/api/projects/archive', {'filter': {'updated_before': '2024-01-01'}},
+     {'matched': 2, 'dry_run': True}),
+    ('PUT', '/api/projects/archive', {'filter': {'search': 'Repo 2'}, 'return_ids': True},
+     {'matched': 0, 'ids': [], 'dry_run': True}),
+])
+def test_dry_run(client, projects, method, url, body, expected, statement_recorder):
+    """Test a dry run reports what would change and writes nothing."""
+    before = _projects(client)
+
+    response, statements = _statements(statement_recorder, client, method, url,
+                                       {**body, 'dry_run': True})
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == expected
+    assert statements == ['SELECT']
+    assert _projects(client) == before
+
+
+@pytest.mark.integration
+def test_bulk_delete_invalidates_list_cache(client, projects):
+    """Test a bulk delete is visible in an already cached list."""
+    _projects(client)
+
+    client.delete('/api/projects', json={'filter': {}})
+
+    assert _projects(client) == {}
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('method, url', [('DELETE', '/api/projects'),
+                                         ('PUT', '/api/projects/archive')])
+@pytest.mark.parametrize('body', [
+    None, {}, {'dry_run': True}, {'filter': {'status': 'stale'}}, {'filter': {'org': 'acme'}},
+    {'ids': [1, 'two']}, {'ids': [2 ** 70]}, {'ids': [-2 ** 63 - 1]},
+])
+def test_bulk_archive_delete_invalid(client, projects, method, url, body):
+    """Test a missing or invalid selection is rejected without writing."""
+    before = _projects(client)
+
+    response = client.open(url, method=method, json=body)
+
+    assert response.status_code == 400
+    assert _projects(client) == before
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('method, url', [('DELETE', '/api/projects'),
+                                         ('PUT', '/api/projects/archive')])
+@pytest.mark.parametrize('filters', [
+    {'status': []}, {'status': ''}, {'organization': ','}, {'search': ' '},
+    {'updated_before': ''}, {'organization': 'acme', 'classification': []},
+])
+def test_empty_filter_value_matches_nothing(client, projects, method, url, filters):
+    """Test an empty filter value is rejected rather than widening the write to every project."""
+    before = _projects(client)
+
+    response = client.open(url, method=method, json={'filter': filters})
+
+    assert response.status_code == 400
+    assert 'Must not be empty' in json.loads(response.data)['error']
+    assert _projects(client) == before
+    assert len(before) == 6
+
+
+@pytest.mark.integration
+def test_single_project_routes_unchanged(client, projects):
+    """Test the per-id archive and delete still work next to the bulk routes."""
+    assert client.put('/api/projects/5/archive').status_code == 200
+    assert client.delete('/api/projects/6').status_code == 204
+    assert list(_projects(client)) == [1, 2, 3, 4, 5]
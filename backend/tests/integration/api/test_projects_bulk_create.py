@@ -0,0 +1,168 @@
+"""
+Integration tests for POST /api/projects/bulk.
+
+Tests up-front validation, the single path check and INSERT, the
+all_or_nothing and best_effort modes, and paths that race the check.
+"""
+
+import pytest
+import json
+from app.models.project import Project
+from app.services import project_bulk
+from app import db
+
+
+@pytest.fixture
+def existing(app):
+    """Create one project at /taken."""
+    with app.app_context():
+        db.session.add(Project(name='Existing', path='/taken'))
+        db.session.commit()
+
+
+def _names(app):
+    with app.app_context():
+        return [name for (name,) in db.session.query(Project.name).order_by(Project.id)]
+
+
+@pytest.mark.integration
+def test_bulk_create(client, app):
+    """Test every item is created and ids come back in input order."""
+    response = client.post('/api/projects/bulk', json=[
+        {'name': 'One', 'path': '/one', 'status': 'paused'},
+        {'name': 'Two', 'classification': 'primary'},
+        {'name': 'Three', 'path': '/three', 'remote_url': 'https://example.com/three'},
+    ])
+
+    assert response.status_code == 201
+    data = json.loads(response.data)
+    assert data['errors'] == []
+    assert len(data['ids']) == 3
+    for project_id, name in zip(data['ids'], ['One', 'Two', 'Three']):
+        project = json.loads(client.get(f'/api/projects/{project_id}').data)
+        assert project['name'] == name
+    assert project['remote_url'] == 'https://example.com/three'
+    assert json.loads(client.get(f"/api/projects/{data['ids'][0]}").data)['status'] == 'paused'
+
+
+@pytest.mark.integration
+def test_bulk_create_statement_count(client, app, statement_recorder):
+    """Test the whole batch costs one path check and one INSERT."""
+    items = [{'name': f'Project {i}', 'path': f'/p/{i}'} for i in range(50)]
+    with statement_recorder:
+        response = client.post('/api/projects/bulk', json={'projects': items})
+
+    assert response.status_code == 201
+    assert statement_recorder.verbs(table='projects') == ['SELECT', 'INSERT']
+    assert len(_names(app)) == 50
+
+
+@pytest.mark.integration
+def test_all_or_nothing_rejects_batch(client, app, existing):
+    """Test one invalid item leaves the table unchanged and reports every problem."""
+    response = client.post('/api/projects/bulk', json=[
+        {'name': 'Good', 'path': '/good'},
+        {'path': '/nameless'},
+        {'name': 'Clash', 'path': '/taken'},
+        'not an object',
+        {'name': 'Numeric path', 'path': 42},
+    ])
+
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert data['ids'] == [None] * 5
+    assert [(error['index'], error['error']) for error in data['errors']] == [
+        (1, 'Name is required'),
+        (2, 'Project with this path already exists'),
+        (3, 'Project must be a JSON object'),
+        (4, 'path must be a string'),
+    ]
+    assert _names(app) == ['Existing']
+
+
+@pytest.mark.integration
+def test_all_or_nothing_conflict_only_is_409(client, app, existing):
+    """Test a batch rejected only for duplicate paths returns 409."""
+    response = client.post('/api/projects/bulk', json=[
+        {'name': 'A', 'path': '/a'}, {'name': 'B', 'path': '/a'}, {'name': 'C', 'path': '/taken'},
+    ])
+
+    assert response.status_code == 409
+    assert [error['index'] for error in json.loads(response.data)['errors']] == [1, 2]
+    assert _names(app) == ['Existing']
+
+
+@pytest.mark.integration
+def test_best_effort_creates_valid_items(client, app, existing):
+    """Test best_effort writes the accepted items and reports the rest."""
+    response = client.post('/api/projects/bulk', json={'mode': 'best_effort', 'projects': [
+        {'name': 'Good', 'path': '/good'},
+        {'name': 'Bad status', 'status': 'archived'},
+        {'name': 'Clash', 'path': '/taken'},
+        {'name': 'Also good'},
+    ]})
+
+    assert response.status_code == 201
+    data = json.loads(response.data)
+    assert data['ids'][1:3] == [None, None]
+    assert None not in (data['ids'][0], data['ids'][3])
+    assert [error['index'] for error in data['errors']] == [1, 2]
+    assert _names(app) == ['Existing', 'Good', 'Also good']
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('mode, status, names', [
+    ('all_or_nothing', 409, ['Existing', 'Racer']),
+    ('best_effort', 201, ['Existing', 'Racer', 'Fine']),
+])
+def test_path_race_attributed_to_item(client, app, existing, monkeypatch, mode, status, names):
+    """Test a path inserted after the check is reported for the item that collides."""
+    accepted_rows = project_bulk._accepted_rows
+
+    def racing(items, errors):
+        rows = accepted_rows(items, errors)
+        # Another request inserts /race between the check and the INSERT
+        db.session.add(Project(name='Racer', path='/race'))
+        db.session.commit()
+        return rows
+
+    monkeypatch.setattr(project_bulk, '_accepted_rows', racing)
+    response = client.post('/api/projects/bulk', json={'mode': mode, 'projects': [
+        {'name': 'Fine', 'path': '/fine'}, {'name': 'Late', 'path': '/race'},
+    ]})
+
+    assert response.status_code == status
+    assert json.loads(response.data)['errors'] == [
+        {'index': 1, 'error': 'Project with this path already exists'}
+    ]
+    assert _names(app) == names
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('body', [
+    None, {'projects': 'nope'}, {'projects': [], 'mode': 'sometimes'}, {'mode': 'best_effort'},
+])
+def test_bulk_create_invalid_body(client, body):
+    """Test bodies without a projects list or with an unknown mode return 400."""
+    assert client.post('/api/projects/bulk', json=body).status_code == 400
+
+
+@pytest.mark.integration
+def test_bulk_create_too_many_items(client, app):
+    """Test more items than PROJECTS_BULK_MAX_ITEMS returns 400."""
+    app.config['PROJECTS_BULK_MAX_ITEMS'] = 2
+
+    response = client.post('/api/projects/bulk', json=[{'name': str(i)} for i in range(3)])
+
+    assert response.status_code == 400
+    assert _names(app) == []
+
+
+@pytest.mark.integration
+def test_bulk_create_invalidates_list_cache(client):
+    """Test created projects appear in an already cached list."""
+    assert json.loads(client.get('/api/projects').data) == []
+
+    client.post('/api/projects/bulk', json=[{'name': 'New'}])
+
+    assert [p['name'] for p in json.loads(client.get('/api/projects').data)] == ['New']
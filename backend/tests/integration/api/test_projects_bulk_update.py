@@ -0,0 +1,143 @@
+"""
+Integration tests for PATCH /api/projects (bulk update).
+
+Tests selecting projects by id list, list filters or both, the single UPDATE
+statement, validation of the selection and of the set values, and versioning.
+"""
+
+import pytest
+import json
+from datetime import datetime
+from app.models.project import Project
+from app import db
+
+
+@pytest.fixture
+def projects(app):
+    """Create 8 projects over two organizations and statuses (ids 1-8)."""
+    with app.app_context():
+        db.session.add_all([
+            Project(
+                name=f'Project {i}',
+                path=f'/p/{i}',
+                organization='acme' if i % 2 else 'globex',
+                status='active' if i < 5 else 'paused',
+                created_at=datetime(2024, 1, i),
+                updated_at=datetime(2024, 1, i),
+            )
+            for i in range(1, 9)
+        ])
+        db.session.commit()
+
+
+def _projects(client):
+    return {p['id']: p for p in json.loads(client.get('/api/projects').data)}
+
+
+def _statuses(client):
+    return {project_id: p['status'] for project_id, p in _projects(client).items()}
+
+
+@pytest.mark.integration
+def test_bulk_update_by_ids(client, projects):
+    """Test only the listed projects change and their versions are bumped."""
+    response = client.patch('/api/projects', json={
+        'ids': [2, 3, 99], 'set': {'status': 'completed', 'classification': 'archive'}
+    })
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == {'updated': 2}
+    rows = _projects(client)
+    assert [pid for pid, p in rows.items() if p['status'] == 'completed'] == [2, 3]
+    assert rows[2]['classification'] == 'archive'
+    assert rows[1]['classification'] is None
+    assert client.get('/api/projects/2').headers['ETag'] == '"2"'
+    assert client.get('/api/projects/1').headers['ETag'] == '"1"'
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('selection, expected', [
+    ({'filter': {'organization': 'acme'}}, [1, 3, 5, 7]),
+    ({'filter': {'organization': 'acme', 'status': ['active']}}, [1, 3]),
+    ({'filter': {'status': 'active,paused', 'created_after': '2024-01-06'}}, [7, 8]),
+    ({'filter': {'search': 'Project 4'}}, [4]),
+    ({'filter': {'organization': 'globex'}, 'ids': [1, 2, 3, 4]}, [2, 4]),
+    ({'filter': {}}, [1, 2, 3, 4, 5, 6, 7, 8]),
+])
+def test_bulk_update_by_filter(client, projects, selection, expected):
+    """Test list filters (alone or with ids) select the updated projects."""
+    response = client.patch('/api/projects', json={
+        **selection, 'set': {'status': 'cancelled'}, 'return_ids': True
+    })
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == {'updated': len(expected), 'ids': expected}
+    assert sorted(pid for pid, s in _statuses(client).items() if s == 'cancelled') == expected
+
+
+@pytest.mark.integration
+def test_bulk_update_single_statement(client, projects, statement_recorder):
+    """Test the write is one UPDATE with no per-row loads."""
+    with statement_recorder:
+        response = client.patch('/api/projects', json={
+            'filter': {'organization': 'acme'}, 'set': {'description': 'Reviewed'}
+        })
+
+    assert json.loads(response.data) == {'updated': 4}
+    assert statement_recorder.verbs(table='projects') == ['UPDATE']
+
+
+@pytest.mark.integration
+def test_bulk_update_invalidates_list_cache(client, projects):
+    """Test a bulk update is visible in an already cached list."""
+    _statuses(client)
+
+    client.patch('/api/projects', json={'ids': [1], 'set': {'status': 'paused'}})
+
+    assert _statuses(client)[1] == 'paused'
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('body, message', [
+    ({'set': {'status': 'paused'}}, "Provide 'ids' and/or 'filter'"),
+    ({'ids': 'all', 'set': {'status': 'paused'}}, "'ids' must be a list of integers"),
+    ({'ids': [1, 2 ** 70], 'set': {'status': 'paused'}}, "'ids' must be a list of integers"),
+    ({'filter': {'stauts': 'active'}, 'set': {'status': 'paused'}}, 'Invalid filter'),
+    ({'filter': {'status': 'bogus'}, 'set': {'status': 'paused'}}, 'Invalid status'),
+    ({'filter': {'classification': ['x']}, 'set': {'status': 'paused'}},
+     'Invalid classification'),
+    ({'filter': {'project_type': 'Hobby'}, 'set': {'status': 'paused'}}, 'Invalid project_type'),
+    ({'filter': {'updated_after': 'soon'}, 'set': {'status': 'paused'}}, 'Invalid updated_after'),
+    ({'filter': {'status': 3}, 'set': {'status': 'paused'}}, 'Invalid status'),
+    ({'filter': []}, "'filter' must be an object"),
+    ({'filter': {'status': []}, 'set': {'status': 'paused'}}, 'Invalid status'),
+    ({'filter': {'status': ''}, 'set': {'status': 'paused'}}, 'Invalid status'),
+    ({'filter': {'organization': ' , '}, 'set': {'status': 'paused'}}, 'Invalid organization'),
+    ({'filter': {'search': ''}, 'set': {'status': 'paused'}}, 'Invalid search'),
+    ({'filter': {'created_after': ''}, 'set': {'status': 'paused'}}, 'Invalid created_after'),
+    ({'ids': [1]}, "'set' must be an object"),
+    ({'ids': [1], 'set': {'path': '/same'}}, 'Invalid set fields'),
+    ({'ids': [1], 'set': {'version': 7}}, 'Invalid set fields'),
+    ({'ids': [1], 'set': {'status': 'archived'}}, 'Invalid status'),
+    ({'ids': [1], 'set': {'status': None}}, 'Status cannot be null'),
+    ({'ids': [1], 'set': {'name': ''}}, 'Name cannot be empty'),
+])
+def test_bulk_update_invalid(client, projects, body, message):
+    """Test invalid selections and values are rejected without writing."""
+    before = _projects(client)
+
+    response = client.patch('/api/projects', json=body)
+
+    assert response.status_code == 400
+    assert message in json.loads(response.data)['error']
+    assert _projects(client) == before
+
+
+@pytest.mark.integration
+def test_bulk_update_no_match(client, projects):
+    """Test a selection matching nothing reports no updated projects."""
+    response = client.patch('/api/projects', json={
+        'filter': {'organization': 'initech'}, 'set': {'status': 'paused'}, 'return_ids': True
+    })
+
+    assert json.loads(response.data) == {'updated': 0, 'ids': []}
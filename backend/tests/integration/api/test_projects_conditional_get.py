@@ -0,0 +1,163 @@
+"""
+Integration tests for ETag / If-None-Match on GET /api/projects and /api/projects/<id>.
+
+Tests that unchanged lists and projects are answered with 304 without serializing.
+"""
+
+import pytest
+from datetime import datetime
+from app.models.project import Project
+from app import db
+
+PAST = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def settled(app):
+    """Create projects last modified well before the current second; return their IDs."""
+    with app.app_context():
+        projects = [
+            Project(name='Alpha', status='active', created_at=PAST, updated_at=PAST),
+            Project(name='Beta', status='paused', created_at=PAST, updated_at=PAST),
+        ]
+        db.session.add_all(projects)
+        db.session.commit()
+        return [project.id for project in projects]
+
+
+def _revalidate(client, url, etag, **headers):
+    """Repeat a GET with If-None-Match set to etag."""
+    return client.get(url, headers={'If-None-Match': etag, **headers})
+
+
+@pytest.mark.integration
+def test_list_not_modified(client, settled, monkeypatch):
+    """Test an unchanged list returns 304 without serializing any project."""
+    response = client.get('/api/projects')
+    etag = response.headers['ETag']
+    assert response.status_code == 200
+
+    # to_dict would raise if called
+    monkeypatch.setattr(Project, 'to_dict', None)
+    response = _revalidate(client, '/api/projects', etag)
+
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+
+
+@pytest.mark.integration
+def test_list_etag_differs_per_filter_and_representation(client, settled):
+    """Test different filters and representations never share a tag."""
+    urls = ['/api/projects', '/api/projects?status=active', '/api/projects?status=paused',
+            '/api/projects?limit=1', '/api/projects?stream=true']
+    etags = {client.get(url).headers['ETag'] for url in urls}
+    etags.add(client.get('/api/projects',
+                         headers={'Accept': 'application/x-ndjson'}).headers['ETag'])
+
+    assert len(etags) == len(urls) + 1
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('change', ['create', 'delete', 'update'])
+def test_list_changes_invalidate_etag(client, app, settled, change):
+    """Test inserts, deletes and updates all change the list response."""
+    etag = client.get('/api/projects').headers['ETag']
+
+    if change == 'create':
+        client.post('/api/projects', json={'name': 'Gamma'})
+    elif change == 'delete':
+        client.delete(f'/api/projects/{settled[0]}')
+    else:
+        client.patch(f'/api/projects/{settled[0]}', json={'name': 'Renamed'})
+
+    response = _revalidate(client, '/api/projects', etag)
+    assert response.status_code == 200
+
+
+@pytest.mark.integration
+def test_list_etag_changes_within_one_second(client, settled):
+    """Test back-to-back writes in the same second each change the list tag."""
+    etags = [client.get('/api/projects').headers['ETag']]
+    for name in ('First', 'Second'):
+        client.patch(f'/api/projects/{settled[0]}', json={'name': name})
+        etags.append(client.get('/api/projects').headers['ETag'])
+
+    assert len(set(etags)) == 3
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('url', ['/api/projects?limit=1', '/api/projects?stream=true'])
+def test_list_etag_does_not_scan_rows(client, settled, url, statement_recorder):
+    """Test pages and streams are tagged without an aggregate over the filtered rows."""
+    with statement_recorder:
+        response = client.get(url)
+        response.get_data()
+
+    assert response.headers['ETag']
+    assert not any('count(' in statement or 'sum(' in statement
+                   for statement in statement_recorder.statements)
+
+
+@pytest.mark.integration
+def test_list_weak_etag_after_compression(client, app, settled):
+    """Test a compressed response's weak ETag still revalidates."""
+    app.config['COMPRESS_MIN_SIZE'] = 1
+    response = client.get('/api/projects', headers={'Accept-Encoding': 'gzip'})
+    etag = response.headers['ETag']
+    assert etag.startswith('W/')
+
+    response = _revalidate(client, '/api/projects', etag, **{'Accept-Encoding': 'gzip'})
+    assert response.status_code == 304
+
+
+@pytest.mark.integration
+def test_list_errors_have_no_etag(client, settled):
+    """Test error responses are not tagged."""
+    response = client.get('/api/projects?limit=0')
+
+    assert response.status_code == 400
+    assert 'ETag' not in response.headers
+
+
+@pytest.mark.integration
+def test_detail_etag_round_trip(client, settled, monkeypatch):
+    """Test the detail ETag is the version, revalidates, and changes after an update."""
+    url = f'/api/projects/{settled[0]}'
+    response = client.get(url)
+    etag = response.headers['ETag']
+    assert etag == '"1"'
+    assert response.get_json()['name'] == 'Alpha'
+
+    # A 304 is answered without loading or serializing the project
+    monkeypatch.setattr(Project, 'to_dict', None)
+    assert _revalidate(client, url, etag).status_code == 304
+    monkeypatch.undo()
+
+    client.patch(url, json={'name': 'Renamed'})
+    response = _revalidate(client, url, etag)
+    assert response.status_code == 200
+    assert response.headers['ETag'] == '"2"'  # No same-second blind spot for versions
+
+
+@pytest.mark.integration
+def test_detail_not_found_has_no_etag(client):
+    """Test a missing project is still a plain 404."""
+    response = client.get('/api/projects/999', headers={'If-None-Match': '*'})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_detail_etag_not_reused_after_delete(client, settled):
+    """Test a new project never takes the id (and so the ETag) of a deleted one."""
+    url = f'/api/projects/{settled[-1]}'
+    etag = client.get(url).headers['ETag']
+    client.delete(url)
+
+    created = client.post('/api/projects', json={'name': 'Successor'}).get_json()
+
+    assert created['id'] > settled[-1]
+    assert _revalidate(client, url, etag).status_code == 404
+    response = client.patch(url, json={'name': 'Overwrite'}, headers={'If-Match': etag})
+    assert response.status_code == 404
@@ -0,0 +1,172 @@
+"""
+Integration tests for GET /api/projects/facets and the list's X-Total-Count.
+
+Tests that facet counts match the filtered list, come from one aggregate query
+(or the bitmap index) without loading rows, and that count=true and HEAD report
+the total without materializing the list.
+"""
+
+import pytest
+import json
+from collections import Counter
+from datetime import datetime
+from app.models.project import Project
+from app import db
+
+FACETS = ('status', 'classification', 'project_type', 'organization')
+
+
+@pytest.fixture
+def projects(app):
+    """Create projects spread over every facet column, some with NULL values."""
+    with app.app_context():
+        past = datetime(2024, 1, 1)
+        statuses = ['active', 'paused', 'completed', 'cancelled']
+        classifications = ['primary', 'secondary', 'archive', None]
+        project_types = ['Work', 'Personal', 'Learning', None]
+        organizations = ['acme', 'globex', None]
+        db.session.add_all([
+            Project(
+                name=f'Project {i}',
+                status=statuses[i % 4],
+                classification=classifications[i % 4 if i % 5 else 3],
+                project_type=project_types[i % 3],
+                organization=organizations[i % 3 if i % 2 else 0],
+                created_at=past,
+                updated_at=past,
+            )
+            for i in range(30)
+        ])
+        db.session.commit()
+
+
+def _expected(client, query):
+    """Compute facets in Python from the full filtered list."""
+    rows = json.loads(client.get(f'/api/projects?{query}').data)
+    return {
+        'total': len(rows),
+        'facets': {
+            column: dict(Counter(row[column] for row in rows if row[column] is not None))
+            for column in FACETS
+        },
+    }
+
+
+def _project_statements(recorder, client, method, url):
+    """Send a request and return it with the statements that read the projects table."""
+    with recorder:
+        response = client.open(url, method=method)
+        response.close()
+    return response, [statement for statement in recorder.statements
+                      if 'FROM projects' in statement]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('query', [
+    '',
+    'status=active,paused',
+    'project_type=Work&organization=acme',
+    'search=project 1',
+    'classification=primary,archive&created_after=2000-01-01',
+    'status=bogus',
+])
+def test_facets_match_filtered_list(client, projects, query):
+    """Test facet counts equal the counts of the filtered list rows."""
+    response = client.get(f'/api/projects/facets?{query}')
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == _expected(client, query)
+
+
+@pytest.mark.integration
+def test_facets_single_aggregate_query(client, projects, app, statement_recorder):
+    """Test facets are computed by one GROUP BY without loading project rows."""
+    app.config['PROJECTS_RESULT_CACHE_SIZE'] = 0
+
+    response, statements = _project_statements(
+        statement_recorder, client, 'GET', '/api/projects/facets?status=active'
+    )
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+    assert 'GROUP BY' in statements[0]
+    assert 'projects.description' not in statements[0]
+
+
+@pytest.mark.integration
+def test_facets_from_bitmap_index(client, projects, app, statement_recorder):
+    """Test a warm bitmap index answers facets without querying the projects table."""
+    app.config['PROJECTS_BITMAP_INDEX'] = True
+    app.config['PROJECTS_RESULT_CACHE_SIZE'] = 0
+    client.get('/api/projects').close()  # Build the index
+
+    response, statements = _project_statements(
+        statement_recorder, client, 'GET', '/api/projects/facets?status=active,completed'
+    )
+
+    assert statements == []
+    assert json.loads(response.data) == _expected(client, 'status=active,completed')
+
+
+@pytest.mark.integration
+def test_facets_invalidated_by_write(client, projects):
+    """Test cached facets are refreshed after a write."""
+    before = json.loads(client.get('/api/projects/facets').data)
+
+    client.post('/api/projects', json={'name': 'New', 'status': 'paused'})
+    after = json.loads(client.get('/api/projects/facets').data)
+
+    assert after['total'] == before['total'] + 1
+    assert after['facets']['status']['paused'] == before['facets']['status']['paused'] + 1
+
+
+@pytest.mark.integration
+def test_facets_invalid_filter(client, projects):
+    """Test invalid filters are rejected like on the list endpoint."""
+    response = client.get('/api/projects/facets?project_type=Hobby')
+
+    assert response.status_code == 400
+    assert 'Invalid project_type' in json.loads(response.data)['error']
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('filters, page', [
+    ('', ''), ('status=active', ''), ('', '&limit=4'), ('status=paused', '&limit=2'),
+])
+def test_total_count_header(client, projects, filters, page):
+    """Test count=true reports every matching project, across all pages."""
+    expected = _expected(client, filters)['total']
+    query = filters + page
+
+    first = client.get(f'/api/projects?{query}&count=true')
+    cached = client.get(f'/api/projects?{query}&count=true')
+
+    assert first.headers['X-Total-Count'] == str(expected)
+    assert cached.headers['X-Total-Count'] == str(expected)
+    assert 'X-Total-Count' not in client.get(f'/api/projects?{query}').headers
+
+
+@pytest.mark.integration
+def test_total_count_on_streamed_list(client, projects):
+    """Test the header is also set on streamed (uncached) lists."""
+    response = client.get('/api/projects?status=active&count=true',
+                          headers={'Accept': 'application/x-ndjson'})
+
+    assert len(response.data.splitlines()) == int(response.headers['X-Total-Count'])
+
+
+@pytest.mark.integration
+def test_head_counts_without_loading_rows(client, projects, statement_recorder):
+    """Test HEAD returns the ETag and total from the aggregate query alone."""
+    etag = client.get('/api/projects?status=active&count=true').headers['ETag']
+
+    response, statements = _project_statements(
+        statement_recorder, client, 'HEAD', '/api/projects?status=active&count=true'
+    )
+
+    assert response.status_code == 200
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+    assert response.headers['X-Total-Count'] == '8'
+    assert response.mimetype == 'application/json'
+    assert all('projects.description' not in statement for statement in statements)
@@ -0,0 +1,112 @@
+"""
+Integration tests for the fields= column projection on GET /api/projects.
+
+Tests that both the SELECT and the serialized objects are narrowed.
+"""
+
+import pytest
+import json
+from datetime import datetime
+from app.models.project import Project
+from app import db
+
+
+@pytest.fixture
+def projects(app):
+    """Create projects with large descriptions."""
+    with app.app_context():
+        db.session.add_all([
+            Project(name=f'Project {i}', status='active', description='x' * 10000,
+                    created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 1))
+            for i in range(5)
+        ])
+        db.session.commit()
+
+
+def _get(recorder, client, url, **kwargs):
+    """GET url and return (response, SQL statements executed)."""
+    with recorder:
+        response = client.get(url, **kwargs)
+        response.close()
+    return response, recorder.statements
+
+
+@pytest.mark.integration
+def test_fields_narrow_response_and_select(client, projects, statement_recorder):
+    """Test only the requested fields are selected and returned."""
+    response, statements = _get(statement_recorder, client, '/api/projects?fields=name,status,id')
+
+    data = json.loads(response.data)
+    assert [set(item) for item in data] == [{'name', 'status', 'id'}] * 5
+    assert not any('description' in statement for statement in statements)
+
+
+@pytest.mark.integration
+def test_fields_whitespace_and_duplicates(client, projects):
+    """Test field names are trimmed and de-duplicated."""
+    response = client.get('/api/projects?fields= name , id,name')
+
+    assert set(json.loads(response.data)[0]) == {'name', 'id'}
+
+
+@pytest.mark.integration
+def test_fields_empty_means_all(client, projects):
+    """Test an empty fields parameter returns every field."""
+    response = client.get('/api/projects?fields=')
+
+    assert json.loads(response.data)[0].keys() == Project().to_dict().keys()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('fields', ['name,bogus', ',', 'version'])
+def test_fields_invalid(client, projects, fields):
+    """Test unknown field names return 400."""
+    response = client.get(f'/api/projects?fields={fields}')
+
+    assert response.status_code == 400
+    assert 'Invalid fields' in json.loads(response.data)['error']
+
+
+@pytest.mark.integration
+def test_fields_with_pagination(client, projects):
+    """Test keyset pagination still works when id is not among the fields."""
+    first = json.loads(client.get('/api/projects?fields=name&limit=3').data)
+    second = json.loads(client.get(
+        f"/api/projects?fields=name&limit=3&cursor={first['next_cursor']}"
+    ).data)
+
+    names = [item['name'] for item in first['projects'] + second['projects']]
+    assert names == [f'Project {i}' for i in range(5)]
+    assert second['next_cursor'] is None
+
+
+@pytest.mark.integration
+def test_fields_with_ndjson_stream(client, projects, statement_recorder):
+    """Test streamed NDJSON honours fields."""
+    response, statements = _get(statement_recorder, client, '/api/projects?fields=id,name',
+                                headers={'Accept': 'application/x-ndjson'})
+
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert all(set(line) == {'id', 'name'} for line in lines)
+    assert not any('description' in statement for statement in statements)
+
+
+@pytest.mark.integration
+def test_fields_with_bitmap_index(client, app, projects, statement_recorder):
+    """Test indexed list answers honour fields."""
+    app.config['PROJECTS_BITMAP_INDEX'] = True
+    client.get('/api/projects').close()
+
+    response, statements = _get(statement_recorder, client, '/api/projects?fields=status,name')
+
+    assert set(json.loads(response.data)[0]) == {'status', 'name'}
+    assert not any('description' in statement for statement in statements)
+
+
+@pytest.mark.integration
+def test_fields_change_etag(client, projects):
+    """Test narrowed and full lists do not share an ETag."""
+    full = client.get('/api/projects')
+    narrow = client.get('/api/projects?fields=id')
+
+    assert full.headers['ETag'] != narrow.headers['ETag']
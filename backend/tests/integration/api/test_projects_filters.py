@@ -0,0 +1,159 @@
+"""
+Integration tests for multi-value (IN) and timestamp range list filters.
+
+Tests comma-separated status, classification, project_type and organization
+filters and the created_after / created_before / updated_after / updated_before
+bounds on GET /api/projects.
+"""
+
+import pytest
+import json
+from datetime import datetime
+from sqlalchemy import text
+from app.models.project import Project
+from app import db
+
+
+@pytest.fixture
+def projects(app):
+    """Create projects across statuses, types, organizations and dates."""
+    with app.app_context():
+        rows = [
+            ('Alpha', 'active', 'Work', 'acme', datetime(2024, 1, 10), datetime(2024, 3, 1)),
+            ('Beta', 'paused', 'Personal', 'acme', datetime(2024, 2, 10), datetime(2024, 2, 15)),
+            ('Gamma', 'completed', 'Work', 'globex', datetime(2024, 3, 10), datetime(2024, 4, 1)),
+            ('Delta', 'active', 'Learning', 'initech', datetime(2024, 4, 10),
+             datetime(2024, 4, 12)),
+            ('Epsilon', 'cancelled', 'Personal', 'globex', datetime(2024, 5, 10),
+             datetime(2024, 5, 11)),
+        ]
+        db.session.add_all([
+            Project(name=name, status=status, project_type=project_type, organization=org,
+                    created_at=created_at, updated_at=updated_at)
+            for name, status, project_type, org, created_at, updated_at in rows
+        ])
+        db.session.commit()
+
+
+def _names(client, query):
+    response = client.get(f'/api/projects?{query}')
+    assert response.status_code == 200
+    return [project['name'] for project in json.loads(response.data)]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('query, expected', [
+    ('status=active,paused', ['Alpha', 'Beta', 'Delta']),
+    ('status=active,paused&project_type=Work,Personal', ['Alpha', 'Beta']),
+    ('organization=acme,initech', ['Alpha', 'Beta', 'Delta']),
+    ('status=active,bogus', ['Alpha', 'Delta']),          # Invalid values are ignored
+    ('status=bogus,nope', ['Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon']),
+    ('status= active , paused,,active', ['Alpha', 'Beta', 'Delta']),
+    ('project_type=Personal&organization=globex', ['Epsilon']),
+])
+def test_in_filters(client, projects, query, expected):
+    """Test comma-separated values match any of the listed values."""
+    assert _names(client, query) == expected
+
+
+@pytest.mark.integration
+def test_in_filter_invalid_project_type(client, projects):
+    """Test one invalid project_type in a list rejects the request."""
+    response = client.get('/api/projects?project_type=Work,Hobby')
+
+    assert response.status_code == 400
+    assert 'Invalid project_type' in json.loads(response.data)['error']
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('query, expected', [
+    ('created_after=2024-03-01', ['Gamma', 'Delta', 'Epsilon']),
+    ('created_before=2024-02-10T00:00:01', ['Alpha', 'Beta']),
+    ('updated_after=2024-03-15&updated_before=2024-05-01', ['Gamma', 'Delta']),
+    ('created_after=2024-01-01&status=active,cancelled&updated_before=2024-05-01',
+     ['Alpha', 'Delta']),
+    ('updated_after=2024-04-11T23:00:00-02:00', ['Epsilon']),   # 2024-04-12T01:00 UTC
+    ('updated_after=2024-04-11T23:00:00Z', ['Delta', 'Epsilon']),
+    ('created_after=', ['Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon']),
+])
+def test_range_filters(client, projects, query, expected):
+    """Test exclusive timestamp bounds, alone and combined with other filters."""
+    assert _names(client, query) == expected
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('query, expected', [
+    ('created_before=2024-01-10', []),
+    ('created_after=2024-05-10T00:00:00', []),
+    ('updated_before=2024-02-15T00:00:00Z', []),
+    # Gamma's created_at is stored without microseconds, as func.now() writes it
+    ('created_before=2024-03-10', ['Alpha', 'Beta']),
+    ('created_after=2024-03-10', ['Delta', 'Epsilon']),
+    ('created_before=2024-03-10T00:00:00.000001', ['Alpha', 'Beta', 'Gamma']),
+    ('created_after=2024-03-09T23:59:59.999999', ['Gamma', 'Delta', 'Epsilon']),
+])
+def test_range_bounds_are_exclusive(client, projects, query, expected):
+    """Test a project stamped exactly at a bound is excluded, whatever its stored spelling."""
+    db.session.execute(text(
+        "UPDATE projects SET created_at = '2024-03-10 00:00:00' WHERE name = 'Gamma'"
+    ))
+    db.session.commit()
+
+    assert _names(client, query) == expected
+
+
+@pytest.mark.integration
+def test_bulk_delete_spares_project_at_bound(client, projects):
+    """Test a bulk delete by created_before keeps a project created at exactly the bound."""
+    created = json.loads(client.post('/api/projects', json={'name': 'Zeta'}).data)
+
+    response = client.delete('/api/projects', json={
+        'filter': {'created_before': created['created_at'], 'created_after': '2024-12-31'}
+    })
+
+    assert json.loads(response.data) == {'deleted': 0}
+    assert 'Zeta' in _names(client, '')
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('name', [
+    'created_after', 'created_before', 'updated_after', 'updated_before'
+])
+@pytest.mark.parametrize('value', [
+    'last-tuesday',
+    # Valid, but past year 9999 or before year 1 once converted to UTC
+    '9999-12-31T23:59:59-01:00',
+    '0001-01-01T00:00:00%2B01:00',
+])
+def test_range_filter_invalid_value(client, projects, name, value):
+    """Test an unparseable or unrepresentable bound returns 400 naming the parameter."""
+    response = client.get(f'/api/projects?{name}={value}')
+
+    assert response.status_code == 400
+    assert json.loads(response.data)['error'] == (
+        f'Invalid {name}. Must be an ISO 8601 date or datetime'
+    )
+
+
+@pytest.mark.integration
+def test_filters_compose_with_pagination_and_streaming(client, projects):
+    """Test the new filters apply to paginated and streamed lists too."""
+    query = 'status=active,paused&updated_before=2024-03-15'
+
+    page = json.loads(client.get(f'/api/projects?{query}&limit=1').data)
+    streamed = client.get(f'/api/projects?{query}', headers={'Accept': 'application/x-ndjson'})
+
+    assert [p['name'] for p in page['projects']] == ['Alpha']
+    assert [json.loads(line)['name'] for line in streamed.data.splitlines()] == ['Alpha', 'Beta']
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('column', ['created_at', 'updated_at'])
+def test_range_filters_use_timestamp_indexes(app, column):
+    """Test range conditions on the timestamps are answered by an index."""
+    with app.app_context():
+        plan = db.session.execute(text(
+            f"EXPLAIN QUERY PLAN SELECT id FROM projects WHERE {column} > '2024-01-01'"
+        )).fetchall()
+
+    assert any(f'ix_projects_{column}' in row[-1] for row in plan)
@@ -0,0 +1,140 @@
+"""
+Integration tests for cached per-project JSON fragments.
+
+Tests app.services.project_fragments through GET /api/projects.
+"""
+
+import pytest
+import json
+from app.models.project import Project
+from app import db
+
+
+@pytest.fixture(autouse=True)
+def no_result_cache(app):
+    """Disable the list result cache so repeated lists reach the fragment cache."""
+    app.config['PROJECTS_RESULT_CACHE_SIZE'] = 0
+
+
+@pytest.fixture
+def projects(app):
+    """Create 10 projects."""
+    with app.app_context():
+        db.session.add_all([
+            Project(name=f'Project {i}', path=f'/repos/{i}', status='active') for i in range(10)
+        ])
+        db.session.commit()
+
+
+def _cache(app):
+    return app.extensions['projects_fragments']
+
+
+@pytest.mark.integration
+def test_repeated_list_reuses_fragments(client, app, projects):
+    """Test an unchanged list is assembled entirely from cached fragments."""
+    first = client.get('/api/projects')
+    cache = _cache(app)
+    assert (cache.misses, cache.hits) == (10, 0)
+
+    second = client.get('/api/projects')
+    assert (cache.misses, cache.hits) == (10, 10)
+    assert second.data == first.data
+    assert json.loads(second.data) == [p.to_dict() for p in Project.query.order_by(Project.id)]
+
+
+@pytest.mark.integration
+def test_only_changed_rows_are_encoded(client, app, projects):
+    """Test an update re-encodes just the changed project."""
+    client.get('/api/projects')
+    client.patch('/api/projects/3', json={'name': 'Renamed'})
+
+    response = client.get('/api/projects')
+
+    assert _cache(app).misses == 11
+    assert json.loads(response.data)[2]['name'] == 'Renamed'
+
+
+@pytest.mark.integration
+def test_reused_id_is_not_served_stale(client, app, projects):
+    """Test a project recreated under a deleted project's id gets its own fragment."""
+    client.get('/api/projects')
+    client.delete('/api/projects/10')
+    client.post('/api/projects', json={'name': 'Replacement', 'path': '/repos/new'})
+
+    data = json.loads(client.get('/api/projects').data)
+
+    assert [project['name'] for project in data][-1] == 'Replacement'
+
+
+@pytest.mark.integration
+def test_field_sets_do_not_collide(client, app):
+    """Test projections with equal values but different keys are cached separately."""
+    with app.app_context():
+        db.session.add(Project(name='same', path='same'))
+        db.session.commit()
+
+    assert json.loads(client.get('/api/projects?fields=name').data) == [{'name': 'same'}]
+    assert json.loads(client.get('/api/projects?fields=path').data) == [{'path': 'same'}]
+
+
+@pytest.mark.integration
+def test_streamed_and_paginated_lists_use_fragments(client, app, projects):
+    """Test NDJSON, chunked and paginated responses share the cached fragments."""
+    expected = json.loads(client.get('/api/projects').data)
+    cache = _cache(app)
+
+    ndjson = client.get('/api/projects', headers={'Accept': 'application/x-ndjson'}).data
+    chunked = client.get('/api/projects?stream=true').data
+    page = client.get('/api/projects?limit=4').data
+
+    assert [json.loads(line) for line in ndjson.splitlines()] == expected
+    assert json.loads(chunked) == expected
+    data = json.loads(page)
+    assert data['projects'] == expected[:4]
+    assert data['next_cursor']
+    assert cache.misses == 10
+
+
+@pytest.mark.integration
+def test_fragment_cache_byte_bound(client, app, projects):
+    """Test least recently used fragments are evicted past the byte budget."""
+    client.get('/api/projects')
+    cache = _cache(app)
+    cache.max_bytes = cache.size // 2
+
+    client.get('/api/projects')
+
+    assert 0 < cache.size <= cache.max_bytes
+    assert len(cache) < 10
+
+
+@pytest.mark.integration
+def test_fragment_cache_counts_keys(client, app):
+    """Test the row text held in each key counts towards the byte budget."""
+    description = 'x' * 5000
+    with app.app_context():
+        db.session.add_all([Project(name=f'Long {i}', description=description) for i in range(3)])
+        db.session.commit()
+
+    client.get('/api/projects')
+    cache = _cache(app)
+    assert cache.size > 2 * 3 * len(description)
+
+    # Room for three fragments, but not for three fragments and their keys
+    cache.max_bytes = 4 * len(description)
+    client.get('/api/projects?fields=id,description')
+
+    assert cache.size <= cache.max_bytes
+    assert len(cache) == 1
+
+
+@pytest.mark.integration
+def test_fragment_cache_disabled(client, app, projects):
+    """Test a zero budget disables the cache."""
+    app.config['PROJECTS_FRAGMENT_CACHE_BYTES'] = 0
+
+    response = client.get('/api/projects')
+
+    assert len(json.loads(response.data)) == 10
+    assert 'projects_fragments' not in app.extensions
@@ -0,0 +1,224 @@
+"""
+Integration tests for the batched import engine behind POST /api/projects/import.
+
+Tests chunk boundaries, in-payload duplicates, statement counts, and the
+conflict handling paths of app.services.project_import.
+"""
+
+import pytest
+import json
+from app.models.project import Project
+from app.services import project_import
+from app.services.change_counter import projects_generation
+from app import db
+
+
+def _import(client, projects):
+    """POST projects to the import endpoint and return the decoded response."""
+    response = client.post('/api/projects/import', json={'projects': projects})
+    assert response.status_code == 201
+    return json.loads(response.data)
+
+
+@pytest.fixture
+def small_batches(app):
+    """Import in chunks of two so tests cross chunk boundaries."""
+    app.config['IMPORT_BATCH_SIZE'] = 2
+
+
+@pytest.mark.integration
+def test_import_across_chunks(client, small_batches):
+    """Test every item is imported when the payload spans several chunks."""
+    data = _import(client, [{'name': f'Project {i}', 'path': f'/p/{i}'} for i in range(5)])
+
+    assert data == {'imported': 5, 'skipped': 0, 'errors': []}
+    assert Project.query.count() == 5
+
+
+@pytest.mark.integration
+def test_import_duplicate_remote_url_in_payload_is_skipped(client, small_batches):
+    """Test a remote_url repeated later in the payload is skipped without error."""
+    data = _import(client, [
+        {'name': 'First', 'remote_url': 'https://example.com/a'},
+        {'name': 'Same chunk', 'remote_url': 'https://example.com/a'},
+        {'name': 'Next chunk', 'remote_url': 'https://example.com/a'},
+    ])
+
+    assert data == {'imported': 1, 'skipped': 2, 'errors': []}
+
+
+@pytest.mark.integration
+def test_import_invalid_item_does_not_claim_remote_url(client):
+    """Test a rejected item does not cause a later valid duplicate to be skipped."""
+    data = _import(client, [
+        {'name': 'Bad', 'status': 'bogus', 'remote_url': 'https://example.com/a'},
+        {'name': 'Good', 'remote_url': 'https://example.com/a'},
+    ])
+
+    assert data['imported'] == 1
+    assert [e['project'] for e in data['errors']] == ['Bad']
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('field, value', [
+    ('path', ['/a', '/b']),
+    ('path', {'dir': '/a'}),
+    ('path', 42),
+    ('remote_url', ['https://example.com/a']),
+    ('remote_url', {'url': 'https://example.com/a'}),
+])
+def test_import_non_string_key_is_item_error(client, small_batches, field, value):
+    """Test a path or remote_url that is not a string is rejected per item."""
+    data = _import(client, [
+        {'name': 'Bad', field: value},
+        {'name': 'Good', 'path': '/good'},
+    ])
+
+    assert data == {
+        'imported': 1,
+        'skipped': 1,
+        'errors': [{'project': 'Bad', 'error': f'{field} must be a string'}],
+    }
+    assert [p.name for p in Project.query.all()] == ['Good']
+
+
+@pytest.mark.integration
+def test_import_duplicate_path_in_payload_is_error(client, small_batches):
+    """Test a path repeated in the payload reports a duplicate-path error."""
+    data = _import(client, [
+        {'name': 'First', 'path': '/dup'},
+        {'name': 'Second', 'path': '/dup'},
+        {'name': 'Third', 'path': '/dup'},
+    ])
+
+    assert data['imported'] == 1
+    assert data['skipped'] == 2
+    assert [e['project'] for e in data['errors']] == ['Second', 'Third']
+    assert all(e['error'] == 'Project with this path already exists' for e in data['errors'])
+
+
+@pytest.mark.integration
+def test_import_errors_keep_payload_order(client, app):
+    """Test errors are reported in payload order within a chunk."""
+    with app.app_context():
+        db.session.add(Project(name='Existing', path='/taken'))
+        db.session.commit()
+
+    data = _import(client, [
+        {'name': 'Taken', 'path': '/taken'},
+        {'name': ''},
+        {'name': 'Bad class', 'classification': 'nope'},
+        'not an object',
+    ])
+
+    assert [e['project'] for e in data['errors']] == ['Taken', '', 'Bad class', 'Unknown']
+    assert data['skipped'] == 4
+
+
+@pytest.mark.integration
+def test_import_uses_one_insert_per_chunk(client, small_batches, statement_recorder):
+    """Test rows are written with one INSERT statement per chunk."""
+    with statement_recorder:
+        _import(client, [{'name': f'Project {i}', 'path': f'/p/{i}'} for i in range(6)])
+
+    statements = statement_recorder.statements
+    inserts = [s for s in statements if s.lstrip().upper().startswith('INSERT INTO PROJECTS ')]
+    selects = [s for s in statements if s.lstrip().upper().startswith('SELECT')]
+    assert len(inserts) == 3
+    assert len(selects) == 3
+
+
+@pytest.mark.integration
+def test_import_reports_path_conflict_missed_by_preload(client, app, monkeypatch):
+    """Test ON CONFLICT DO NOTHING rows are reported when the pre-load misses them."""
+    with app.app_context():
+        db.session.add(Project(name='Existing', path='/raced'))
+        db.session.commit()
+    # Simulate a concurrent insert landing between the pre-load and the INSERT
+    monkeypatch.setattr(project_import.ProjectImporter, '_existing_keys',
+                        lambda self, chunk: ({}, {}))
+
+    data = _import(client, [
+        {'name': 'Before', 'path': '/before'},
+        {'name': 'Raced', 'path': '/raced'},
+        {'name': 'No path'},
+    ])
+
+    assert data['imported'] == 2
+    assert data['errors'] == [
+        {'project': 'Raced', 'error': 'Project with this path already exists'}
+    ]
+
+
+@pytest.mark.integration
+def test_import_without_on_conflict_falls_back_per_row(client, app, monkeypatch):
+    """Test dialects without ON CONFLICT retry the chunk one row per transaction."""
+    with app.app_context():
+        db.session.add(Project(name='Existing', path='/raced'))
+        db.session.commit()
+    monkeypatch.setattr(project_import, 'UPSERT_DIALECTS', {})
+    monkeypatch.setattr(project_import.ProjectImporter, '_existing_keys',
+                        lambda self, chunk: ({}, {}))
+
+    data = _import(client, [
+        {'name': 'Before', 'path': '/before'},
+        {'name': 'Raced', 'path': '/raced'},
+        {'name': 'After', 'path': '/after'},
+    ])
+
+    assert data['imported'] == 2
+    assert data['errors'] == [
+        {'project': 'Raced', 'error': 'Project with this path already exists'}
+    ]
+    assert {p.name for p in Project.query.all()} == {'Existing', 'Before', 'After'}
+
+
+@pytest.mark.integration
+def test_import_chunk_commits_with_generation_bump(client, app, monkeypatch):
+    """Test a chunk whose generation bump fails leaves no rows behind."""
+    def failing_bump():
+        raise RuntimeError('counter unavailable')
+
+    monkeypatch.setattr(project_import, 'bump_projects_generation', failing_bump)
+    data = _import(client, [{'name': 'One', 'path': '/one'}, {'name': 'Two'}])
+
+    assert data['imported'] == 0
+    assert [e['error'] for e in data['errors']] == ['Failed to import project'] * 2
+    with app.app_context():
+        db.session.rollback()
+        assert Project.query.count() == 0
+        assert projects_generation() == 0
+
+
+@pytest.mark.integration
+def test_import_fallback_rows_commit_with_generation_bump(client, app, monkeypatch):
+    """Test each row written by the per-row fallback is committed with its own bump."""
+    with app.app_context():
+        db.session.add(Project(name='Existing', path='/raced'))
+        db.session.commit()
+    monkeypatch.setattr(project_import, 'UPSERT_DIALECTS', {})
+    monkeypatch.setattr(project_import.ProjectImporter, '_existing_keys',
+                        lambda self, chunk: ({}, {}))
+    bump = project_import.bump_projects_generation
+    calls = []
+
+    def bump_failing_on_second_row():
+        calls.append(None)
+        if len(calls) == 2:
+            raise RuntimeError('counter unavailable')
+        bump()
+
+    monkeypatch.setattr(project_import, 'bump_projects_generation', bump_failing_on_second_row)
+    data = _import(client, [
+        {'name': 'Before', 'path': '/before'},
+        {'name': 'Raced', 'path': '/raced'},
+        {'name': 'Lost', 'path': '/lost'},
+        {'name': 'After', 'path': '/after'},
+    ])
+
+    assert data['imported'] == 2
+    assert [e['project'] for e in data['errors']] == ['Raced', 'Lost']
+    with app.app_context():
+        db.session.rollback()
+        assert {p.name for p in Project.query.all()} == {'Existing', 'Before', 'After'}
+        assert projects_generation() == 2
@@ -0,0 +1,158 @@
+"""
+Integration tests for import conflict modes on POST /api/projects/import.
+
+Tests on_conflict (skip, update, replace) keyed on remote_url or path.
+"""
+
+import pytest
+import json
+from app.models.project import Project
+from app import db
+
+
+def _import(client, projects, **options):
+    """POST projects with import options and return the decoded response."""
+    response = client.post('/api/projects/import', json={'projects': projects, **options})
+    assert response.status_code == 201
+    return json.loads(response.data)
+
+
+@pytest.fixture
+def existing(app):
+    """Create one fully-populated project and return its ID."""
+    with app.app_context():
+        project = Project(
+            name='Old Name',
+            path='/repos/tool',
+            organization='Old Org',
+            classification='primary',
+            status='paused',
+            description='Old description',
+            remote_url='https://github.com/user/tool'
+        )
+        db.session.add(project)
+        db.session.commit()
+        return project.id
+
+
+@pytest.mark.integration
+def test_import_update_by_remote_url_merges_fields(client, existing):
+    """Test on_conflict=update overwrites only the fields present in the item."""
+    data = _import(client, [
+        {'name': 'New Name', 'remote_url': 'https://github.com/user/tool', 'status': 'active'},
+        {'name': 'Brand New', 'remote_url': 'https://github.com/user/other'},
+    ], on_conflict='update')
+
+    assert data == {'imported': 1, 'updated': 1, 'skipped': 0, 'errors': []}
+    project = db.session.get(Project, existing)
+    assert project.name == 'New Name'
+    assert project.status == 'active'
+    assert project.description == 'Old description'
+    assert project.path == '/repos/tool'
+    assert Project.query.count() == 2
+
+
+@pytest.mark.integration
+def test_import_replace_by_remote_url_clears_absent_fields(client, existing):
+    """Test on_conflict=replace overwrites every importable field."""
+    data = _import(client, [
+        {'name': 'Replaced', 'remote_url': 'https://github.com/user/tool'},
+    ], on_conflict='replace')
+
+    assert data['updated'] == 1
+    project = db.session.get(Project, existing)
+    assert project.name == 'Replaced'
+    assert project.status == 'active'  # Default when absent
+    assert project.description is None
+    assert project.organization is None
+    assert project.path is None
+
+
+@pytest.mark.integration
+def test_import_update_by_path(client, existing):
+    """Test conflict_key=path matches existing projects on path."""
+    data = _import(client, [
+        {'name': 'Renamed', 'path': '/repos/tool', 'organization': 'New Org'},
+        {'name': 'Another', 'path': '/repos/another'},
+    ], on_conflict='update', conflict_key='path')
+
+    assert data == {'imported': 1, 'updated': 1, 'skipped': 0, 'errors': []}
+    project = db.session.get(Project, existing)
+    assert project.name == 'Renamed'
+    assert project.organization == 'New Org'
+    assert project.remote_url == 'https://github.com/user/tool'
+
+
+@pytest.mark.integration
+def test_import_skip_by_path(client, existing):
+    """Test conflict_key=path with skip leaves an existing path untouched, without error."""
+    data = _import(client, [
+        {'name': 'Ignored', 'path': '/repos/tool'},
+    ], conflict_key='path')
+
+    assert data == {'imported': 0, 'skipped': 1, 'errors': []}
+    assert db.session.get(Project, existing).name == 'Old Name'
+
+
+@pytest.mark.integration
+def test_import_update_repeated_key_last_wins(client, existing):
+    """Test a key repeated within the payload applies only its last occurrence."""
+    data = _import(client, [
+        {'name': 'First', 'remote_url': 'https://github.com/user/tool', 'path': '/repos/tool'},
+        {'name': 'Second', 'remote_url': 'https://github.com/user/tool', 'path': '/repos/tool'},
+    ], on_conflict='update')
+
+    assert data == {'imported': 0, 'updated': 1, 'skipped': 1, 'errors': []}
+    assert db.session.get(Project, existing).name == 'Second'
+
+
+@pytest.mark.integration
+def test_import_update_path_collision_is_error(client, app, existing):
+    """Test an update that would take another project's path is reported as an error."""
+    with app.app_context():
+        db.session.add(Project(name='Other', path='/repos/other'))
+        db.session.commit()
+
+    data = _import(client, [
+        {'name': 'Moved', 'remote_url': 'https://github.com/user/tool', 'path': '/repos/other'},
+    ], on_conflict='update')
+
+    assert data['updated'] == 0
+    assert data['errors'] == [
+        {'project': 'Moved', 'error': 'Project with this path already exists'}
+    ]
+    assert db.session.get(Project, existing).path == '/repos/tool'
+
+
+@pytest.mark.integration
+def test_import_update_is_one_statement_per_chunk(client, app, statement_recorder):
+    """Test a path-keyed resync writes each chunk with a single upsert statement."""
+    with app.app_context():
+        db.session.add_all([Project(name=f'P{i}', path=f'/p/{i}') for i in range(4)])
+        db.session.commit()
+
+    with statement_recorder:
+        data = _import(client, [{'name': f'Q{i}', 'path': f'/p/{i}'} for i in range(6)],
+                       on_conflict='update', conflict_key='path')
+
+    assert data['updated'] == 4
+    assert data['imported'] == 2
+    writes = [s for s in statement_recorder.statements
+              if s.lstrip().upper().startswith('INSERT')]
+    assert len(writes) == 1
+    assert 'ON CONFLICT (path) DO UPDATE' in writes[0]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('options', [
+    {'on_conflict': 'merge'},
+    {'conflict_key': 'name'},
+])
+def test_import_invalid_conflict_options(client, options):
+    """Test unknown on_conflict or conflict_key values return 400."""
+    response = client.post('/api/projects/import',
+                           json={'projects': [{'name': 'P'}], **options})
+
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert 'error' in data
@@ -0,0 +1,118 @@
+"""
+Integration tests for NDJSON streaming import on POST /api/projects/import.
+
+Tests the application/x-ndjson request mode and its streamed progress report.
+"""
+
+import pytest
+import json
+from app.models.project import Project
+from app.services.project_import import ProjectImporter
+
+
+def _ndjson(*items):
+    """Encode items as an NDJSON request body."""
+    return ''.join(json.dumps(item) + '\n' for item in items)
+
+
+def _post_ndjson(client, body, query=''):
+    """POST an NDJSON body and return (status code, decoded report lines)."""
+    response = client.post(f'/api/projects/import{query}', data=body,
+                           content_type='application/x-ndjson')
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    return response, lines
+
+
+@pytest.mark.integration
+def test_import_ndjson_basic(client):
+    """Test NDJSON import creates projects and ends with a done summary line."""
+    response, lines = _post_ndjson(client, _ndjson(
+        {'name': 'Project 1', 'path': '/p/1'},
+        {'name': 'Project 2', 'path': '/p/2'},
+    ))
+
+    assert response.status_code == 201
+    assert response.mimetype == 'application/x-ndjson'
+    assert lines[-1] == {
+        'imported': 2, 'skipped': 0, 'processed': 2, 'done': True, 'error_count': 0
+    }
+    assert Project.query.count() == 2
+
+
+@pytest.mark.integration
+def test_import_ndjson_reports_progress_per_chunk(client, app):
+    """Test one progress line is streamed per chunk with running totals."""
+    app.config['IMPORT_BATCH_SIZE'] = 2
+
+    _, lines = _post_ndjson(client, _ndjson(*({'name': f'P{i}'} for i in range(5))))
+
+    progress = lines[:-1]
+    assert [line['processed'] for line in progress] == [2, 4, 5]
+    assert [line['imported'] for line in progress] == [2, 4, 5]
+    assert lines[-1]['done'] is True
+
+
+@pytest.mark.integration
+def test_import_ndjson_errors_stream_with_their_chunk(client, app):
+    """Test invalid lines and items are reported in the chunk that contained them."""
+    app.config['IMPORT_BATCH_SIZE'] = 2
+    body = (
+        _ndjson({'name': 'Good'})
+        + '{not json\n'
+        + '\n'  # Blank lines are ignored
+        + _ndjson({'name': ''}, {'name': 'Also good'})
+    )
+
+    _, lines = _post_ndjson(client, body)
+
+    assert lines[0]['errors'] == [{'project': 'Unknown', 'error': 'Invalid JSON on line 2'}]
+    assert lines[1]['errors'] == [{'project': '', 'error': 'Name is required'}]
+    assert lines[-1]['imported'] == 2
+    assert lines[-1]['skipped'] == 2
+    assert lines[-1]['error_count'] == 2
+    assert 'errors' not in lines[-1]
+
+
+@pytest.mark.integration
+def test_import_ndjson_options_from_query_string(client, app):
+    """Test on_conflict and conflict_key are read from the query string."""
+    with app.app_context():
+        from app import db
+        db.session.add(Project(name='Old', path='/p/1'))
+        db.session.commit()
+
+    _, lines = _post_ndjson(client, _ndjson({'name': 'New', 'path': '/p/1'}),
+                            query='?on_conflict=update&conflict_key=path')
+
+    assert lines[-1]['updated'] == 1
+    assert Project.query.filter_by(path='/p/1').one().name == 'New'
+
+
+@pytest.mark.integration
+def test_import_ndjson_invalid_options(client):
+    """Test invalid options are rejected before any input is read."""
+    response = client.post('/api/projects/import?on_conflict=bogus',
+                           data=_ndjson({'name': 'P'}),
+                           content_type='application/x-ndjson')
+
+    assert response.status_code == 400
+    assert Project.query.count() == 0
+
+
+@pytest.mark.integration
+def test_import_iter_import_consumes_input_lazily(app):
+    """Test the importer pulls at most one chunk of items ahead of what it writes."""
+    pulled = []
+
+    def items():
+        for i in range(10):
+            pulled.append(i)
+            yield {'name': f'P{i}'}
+
+    importer = ProjectImporter(batch_size=3)
+    progress = importer.iter_import(items())
+
+    next(progress)
+    assert len(pulled) == 3
+    next(progress)
+    assert len(pulled) == 6
@@ -0,0 +1,203 @@
+"""
+Integration tests for If-Match optimistic concurrency on PATCH, archive and delete.
+
+Tests the version column, conditional UPDATE ... WHERE version=?, and 412 responses.
+"""
+
+import pytest
+import json
+from app.models.project import Project
+from app import db
+
+
+@pytest.fixture
+def project_id(app):
+    """Create one project at version 1 and return its ID."""
+    with app.app_context():
+        project = Project(name='Original', path='/repos/original', status='active')
+        db.session.add(project)
+        db.session.commit()
+        return project.id
+
+
+def _patch(client, project_id, data, if_match):
+    """PATCH a project with an If-Match header."""
+    return client.patch(f'/api/projects/{project_id}', json=data,
+                        headers={'If-Match': if_match})
+
+
+@pytest.mark.integration
+def test_patch_if_match_current_version(client, project_id):
+    """Test a matching If-Match applies the update and returns the new ETag."""
+    response = _patch(client, project_id, {'name': 'Renamed'}, '"1"')
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] == '"2"'
+    assert json.loads(response.data)['name'] == 'Renamed'
+    assert db.session.get(Project, project_id).version == 2
+
+
+@pytest.mark.integration
+def test_patch_if_match_stale_version(client, project_id):
+    """Test a stale If-Match returns 412 with the current ETag and changes nothing."""
+    _patch(client, project_id, {'name': 'First writer'}, '"1"')
+
+    response = _patch(client, project_id, {'name': 'Second writer'}, '"1"')
+
+    assert response.status_code == 412
+    assert response.headers['ETag'] == '"2"'
+    assert 'error' in json.loads(response.data)
+    assert db.session.get(Project, project_id).name == 'First writer'
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('if_match, expected', [
+    ('W/"1"', 200),           # Weakened by response compression
+    ('"7", "1"', 200),        # Any listed version matches
+    ('*', 200),               # No version precondition
+    ('"not-a-version"', 412),
+    ('"99999999999999999999"', 412),  # Beyond the 64-bit version column
+])
+def test_patch_if_match_forms(client, project_id, if_match, expected):
+    """Test the accepted forms of the If-Match header."""
+    response = _patch(client, project_id, {'status': 'paused'}, if_match)
+
+    assert response.status_code == expected
+
+
+@pytest.mark.integration
+def test_patch_if_match_missing_project(client):
+    """Test If-Match on a missing project returns 404, not 412."""
+    response = _patch(client, 999, {'name': 'Ghost'}, '"1"')
+
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_patch_if_match_empty_body_checks_precondition(client, project_id):
+    """Test a PATCH with nothing to change still honours If-Match."""
+    assert _patch(client, project_id, {}, '"1"').status_code == 200
+    assert _patch(client, project_id, {}, '"5"').status_code == 412
+
+
+@pytest.mark.integration
+def test_patch_if_match_validates(client, project_id):
+    """Test conditional updates are validated like unconditional ones."""
+    response = _patch(client, project_id, {'status': 'bogus'}, '"1"')
+
+    assert response.status_code == 400
+    assert db.session.get(Project, project_id).version == 1
+
+
+@pytest.mark.integration
+def test_patch_if_match_duplicate_path(client, app, project_id):
+    """Test a conditional update onto another project's path returns 409."""
+    with app.app_context():
+        db.session.add(Project(name='Other', path='/repos/other'))
+        db.session.commit()
+
+    response = _patch(client, project_id, {'path': '/repos/other'}, '"1"')
+
+    assert response.status_code == 409
+    assert json.loads(response.data)['error'] == 'Project with this path already exists'
+
+
+@pytest.mark.integration
+def test_patch_if_match_has_no_read_before_write(client, project_id, statement_recorder):
+    """Test the conditional update runs without a read before the write."""
+    with statement_recorder:
+        response = _patch(client, project_id, {'name': 'Renamed'}, '"1"')
+
+    assert response.status_code == 200
+    # The project, then the change counter
+    assert statement_recorder.verbs() == ['UPDATE', 'UPDATE']
+
+
+@pytest.mark.integration
+def test_archive_if_match(client, project_id):
+    """Test archive honours If-Match and bumps the version."""
+    url = f'/api/projects/{project_id}/archive'
+
+    stale = client.put(url, headers={'If-Match': '"3"'})
+    assert stale.status_code == 412
+    assert db.session.get(Project, project_id).status == 'active'
+
+    response = client.put(url, headers={'If-Match': '"1"'})
+    assert response.status_code == 200
+    assert response.headers['ETag'] == '"2"'
+    data = json.loads(response.data)
+    assert data['classification'] == 'archive'
+    assert data['status'] == 'completed'
+
+
+@pytest.mark.integration
+def test_archive_if_match_missing_project(client):
+    """Test conditional archive of a missing project returns 404."""
+    response = client.put('/api/projects/999/archive', headers={'If-Match': '"1"'})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('method, suffix, verbs', [
+    ('put', '/archive', ['UPDATE', 'UPDATE']),
+    ('delete', '', ['DELETE', 'UPDATE']),
+])
+def test_unconditional_write_has_no_read_before_write(client, project_id, statement_recorder,
+                                                      method, suffix, verbs):
+    """Test archive and delete without If-Match are one statement keyed on id."""
+    with statement_recorder:
+        response = getattr(client, method)(f'/api/projects/{project_id}{suffix}')
+
+    assert response.status_code in (200, 204)
+    # The project, then the change counter; no version check to go stale
+    assert statement_recorder.verbs() == verbs
+
+
+@pytest.mark.integration
+def test_delete_if_match(client, project_id):
+    """Test delete honours If-Match."""
+    url = f'/api/projects/{project_id}'
+
+    stale = client.delete(url, headers={'If-Match': '"3"'})
+    assert stale.status_code == 412
+    assert stale.headers['ETag'] == '"1"'
+    assert db.session.get(Project, project_id) is not None
+
+    assert client.delete(url, headers={'If-Match': '"1"'}).status_code == 204
+    assert db.session.get(Project, project_id) is None
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('headers', [{}, {'If-Match': '"1"'}])
+def test_delete_missing_project(client, headers):
+    """Test deleting a missing project returns 404 with or without If-Match."""
+    response = client.delete('/api/projects/999', headers=headers)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_unconditional_writes_bump_version(client, project_id):
+    """Test PATCH and archive without If-Match still advance the version."""
+    response = client.patch(f'/api/projects/{project_id}', json={'name': 'Renamed'})
+    assert response.headers['ETag'] == '"2"'
+
+    response = client.put(f'/api/projects/{project_id}/archive')
+    assert response.headers['ETag'] == '"3"'
+
+    # The new ETag is immediately usable as a precondition
+    assert _patch(client, project_id, {'name': 'Again'}, '"3"').status_code == 200
+
+
+@pytest.mark.integration
+def test_import_update_bumps_version(client, project_id):
+    """Test import upserts bump the version so stale If-Match writers get 412."""
+    client.post('/api/projects/import', json={
+        'projects': [{'name': 'Imported', 'path': '/repos/original'}],
+        'on_conflict': 'update',
+        'conflict_key': 'path',
+    })
+
+    assert db.session.get(Project, project_id).version == 2
+    assert _patch(client, project_id, {'name': 'Stale'}, '"1"').status_code == 412
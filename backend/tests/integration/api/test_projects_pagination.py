@@ -0,0 +1,138 @@
+"""
+Integration tests for keyset pagination on GET /api/projects.
+
+Tests the limit/cursor parameters and their composition with list filters.
+"""
+
+import pytest
+import json
+from app.models.project import Project
+from app import db
+
+
+def _create_projects(count, **fields):
+    """Create count projects sharing the given field values and return their IDs."""
+    projects = [Project(name=f"Project {i}", **fields) for i in range(count)]
+    db.session.add_all(projects)
+    db.session.commit()
+    return [project.id for project in projects]
+
+
+def _collect_pages(client, url):
+    """Follow next_cursor links from url and return (all IDs, number of pages)."""
+    ids = []
+    pages = 0
+    next_url = url
+    while next_url:
+        response = client.get(next_url)
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        ids.extend(p['id'] for p in data['projects'])
+        pages += 1
+        cursor = data['next_cursor']
+        next_url = f"{url}&cursor={cursor}" if cursor else None
+    return ids, pages
+
+
+@pytest.mark.integration
+def test_list_projects_limit_returns_page_object(client, app):
+    """Test GET /api/projects?limit=N returns the first page and a next_cursor."""
+    with app.app_context():
+        project_ids = _create_projects(5)
+
+    response = client.get('/api/projects?limit=2')
+
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert [p['id'] for p in data['projects']] == project_ids[:2]
+    assert data['next_cursor'] is not None
+
+
+@pytest.mark.integration
+def test_list_projects_cursor_walks_all_pages(client, app):
+    """Test following next_cursor returns every project exactly once, in ID order."""
+    with app.app_context():
+        project_ids = _create_projects(7)
+
+    ids, pages = _collect_pages(client, '/api/projects?limit=3')
+
+    assert ids == project_ids
+    assert pages == 3
+
+
+@pytest.mark.integration
+def test_list_projects_last_page_has_no_cursor(client, app):
+    """Test an exactly-full last page reports next_cursor as null."""
+    with app.app_context():
+        _create_projects(2)
+
+    response = client.get('/api/projects?limit=2')
+
+    data = json.loads(response.data)
+    assert len(data['projects']) == 2
+    assert data['next_cursor'] is None
+
+
+@pytest.mark.integration
+def test_list_projects_cursor_composes_with_filters(client, app):
+    """Test filters apply on every page when paginating."""
+    with app.app_context():
+        active_ids = _create_projects(5, status='active', project_type='Work')
+        _create_projects(5, status='paused', project_type='Work')
+
+    ids, _ = _collect_pages(client, '/api/projects?status=active&project_type=Work&limit=2')
+
+    assert ids == active_ids
+
+
+@pytest.mark.integration
+def test_list_projects_cursor_skips_deleted_rows(client, app):
+    """Test the cursor seeks by key, so deleting a seen row does not shift pages."""
+    with app.app_context():
+        project_ids = _create_projects(4)
+
+    first = json.loads(client.get('/api/projects?limit=2').data)
+    client.delete(f"/api/projects/{project_ids[0]}")
+    second = json.loads(client.get(f"/api/projects?limit=2&cursor={first['next_cursor']}").data)
+
+    assert [p['id'] for p in second['projects']] == project_ids[2:]
+
+
+@pytest.mark.integration
+def test_list_projects_limit_clamped_to_maximum(client, app):
+    """Test limit above PROJECTS_MAX_PAGE_SIZE is clamped."""
+    app.config['PROJECTS_MAX_PAGE_SIZE'] = 2
+    with app.app_context():
+        _create_projects(3)
+
+    response = client.get('/api/projects?limit=50')
+
+    data = json.loads(response.data)
+    assert len(data['projects']) == 2
+    assert data['next_cursor'] is not None
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('limit', ['0', '-1', 'abc'])
+def test_list_projects_invalid_limit(client, limit):
+    """Test non-positive or non-integer limit returns 400."""
+    response = client.get(f'/api/projects?limit={limit}')
+
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert 'limit' in data['error']
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('cursor', [
+    'not-a-cursor', 'WyJhIl0', 'WzEsMl0',
+    'WzExODA1OTE2MjA3MTc0MTEzMDM0MjRd',  # [2 ** 70]
+    'WzkyMjMzNzIwMzY4NTQ3NzU4MDhd',      # [2 ** 63], one past the largest id
+])
+def test_list_projects_invalid_cursor(client, cursor):
+    """Test malformed, mismatched or out-of-range cursors return 400."""
+    response = client.get(f'/api/projects?cursor={cursor}')
+
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert data['error'] == 'Invalid cursor'
@@ -0,0 +1,146 @@
+"""
+Integration tests for the project list result cache.
+
+Tests app.services.result_cache through GET /api/projects and the cache
+counters reported by GET /api/health/caches.
+"""
+
+import pytest
+import json
+from datetime import datetime
+from app.models.project import Project
+from app import db
+
+
+@pytest.fixture
+def projects(app):
+    """Create 6 projects, half of them active, last modified in the past."""
+    with app.app_context():
+        past = datetime(2024, 1, 1)
+        db.session.add_all([
+            Project(name=f'Project {i}', path=f'/repos/{i}',
+                    status='active' if i % 2 == 0 else 'paused',
+                    created_at=past, updated_at=past)
+            for i in range(6)
+        ])
+        db.session.commit()
+
+
+def _stats(client):
+    return client.get('/api/health/caches').get_json()['list_results']
+
+
+def _project_selects(recorder, client, url):
+    """GET url and count statements reading the projects table."""
+    with recorder:
+        response = client.get(url)
+    return response, sum('FROM projects' in statement for statement in recorder.statements)
+
+
+@pytest.mark.integration
+def test_repeated_list_served_from_cache(client, projects, statement_recorder):
+    """Test a repeated list is answered without querying the projects table."""
+    first, selects = _project_selects(statement_recorder, client, '/api/projects?status=active')
+    assert selects >= 1
+
+    second, selects = _project_selects(statement_recorder, client, '/api/projects?status=active')
+    assert selects == 0
+    assert second.data == first.data
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert (_stats(client)['hits'], _stats(client)['misses']) == (1, 1)
+
+
+@pytest.mark.integration
+def test_cache_key_normalizes_argument_order(client, projects):
+    """Test reordered query arguments share one entry."""
+    client.get('/api/projects?status=active&fields=id,name')
+    response = client.get('/api/projects?fields=id,name&status=active')
+
+    assert _stats(client)['hits'] == 1
+    assert len(json.loads(response.data)) == 3
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('write', [
+    lambda client: client.post('/api/projects', json={'name': 'New', 'status': 'active'}),
+    lambda client: client.patch('/api/projects/1', json={'name': 'Renamed'}),
+    lambda client: client.delete('/api/projects/1'),
+    lambda client: client.put('/api/projects/2/archive'),
+    lambda client: client.post('/api/projects/import', json={'projects': [{'name': 'Imp'}]}),
+])
+def test_writes_invalidate_cache(client, projects, write):
+    """Test every write path bumps the generation and drops cached lists."""
+    before = json.loads(client.get('/api/projects').data)
+
+    write(client)
+    after = json.loads(client.get('/api/projects').data)
+
+    assert after != before
+    assert _stats(client)['hits'] == 0
+    assert _stats(client)['entries'] == 1
+
+
+@pytest.mark.integration
+def test_cached_list_honours_if_none_match(client, projects):
+    """Test a cache hit still answers a matching If-None-Match with 304."""
+    etag = client.get('/api/projects').headers['ETag']
+
+    response = client.get('/api/projects', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+    assert _stats(client)['hits'] == 1
+
+
+@pytest.mark.integration
+def test_paginated_list_cached_per_cursor(client, projects):
+    """Test pages are cached separately by limit and cursor."""
+    first = json.loads(client.get('/api/projects?limit=2').data)
+    second = json.loads(client.get(f'/api/projects?limit=2&cursor={first["next_cursor"]}').data)
+
+    assert json.loads(client.get('/api/projects?limit=2').data) == first
+    assert [p['id'] for p in second['projects']] == [3, 4]
+    assert _stats(client)['hits'] == 1
+
+
+@pytest.mark.integration
+def test_streamed_lists_not_cached(client, projects):
+    """Test NDJSON and chunked lists bypass the cache."""
+    for _ in range(2):
+        client.get('/api/projects?stream=true').data
+        client.get('/api/projects', headers={'Accept': 'application/x-ndjson'}).data
+
+    assert _stats(client) is None
+
+
+@pytest.mark.integration
+def test_errors_not_cached(client, projects):
+    """Test invalid requests are not cached."""
+    url = '/api/projects?search=project&sort=relevance&limit=2'
+    assert client.get(url).status_code == 400
+    assert client.get(url).status_code == 400
+
+    assert (_stats(client)['entries'], _stats(client)['misses']) == (0, 2)
+
+
+@pytest.mark.integration
+def test_cache_disabled(client, app, projects, statement_recorder):
+    """Test a zero size disables the cache."""
+    app.config['PROJECTS_RESULT_CACHE_SIZE'] = 0
+
+    client.get('/api/projects')
+    _, selects = _project_selects(statement_recorder, client, '/api/projects')
+
+    assert selects >= 1
+    assert _stats(client) is None
+
+
+@pytest.mark.integration
+def test_cache_stats_reports_all_caches(client, projects):
+    """Test the monitoring endpoint reports each cache once it has been used."""
+    client.get('/api/projects')
+
+    data = client.get('/api/health/caches').get_json()
+
+    assert set(data) == {'list_results', 'project_fragments', 'compressed_bodies'}
+    assert data['list_results']['misses'] == 1
+    assert data['project_fragments']['misses'] == 6
@@ -0,0 +1,124 @@
+"""
+Integration tests for full-text search on GET /api/projects.
+
+Tests the FTS5-backed search parameter, index synchronization triggers,
+relevance ordering, and the ILIKE fallback.
+"""
+
+import pytest
+import json
+from sqlalchemy import inspect
+from app.models.project import Project
+from app import db
+
+
+def _search(client, query_string):
+    """Run a list request and return the matching project names."""
+    response = client.get(f'/api/projects?{query_string}')
+    assert response.status_code == 200
+    return [p['name'] for p in json.loads(response.data)]
+
+
+@pytest.mark.integration
+def test_fts_index_created_with_tables(app):
+    """Test db.create_all() creates the projects_fts index on SQLite."""
+    assert inspect(db.engine).has_table('projects_fts')
+
+
+@pytest.mark.integration
+def test_search_matches_organization_and_path(client, app):
+    """Test search covers organization and path as well as name and description."""
+    with app.app_context():
+        db.session.add_all([
+            Project(name="Alpha", organization="Acme Corp"),
+            Project(name="Beta", path="/home/dev/acme-tools"),
+            Project(name="Gamma", description="Unrelated"),
+        ])
+        db.session.commit()
+
+    assert _search(client, 'search=acme') == ["Alpha", "Beta"]
+
+
+@pytest.mark.integration
+def test_search_index_follows_updates_and_deletes(client, app):
+    """Test triggers keep the FTS index in sync with writes."""
+    with app.app_context():
+        project = Project(name="Original Name")
+        db.session.add(project)
+        db.session.commit()
+        project_id = project.id
+
+    client.patch(f'/api/projects/{project_id}', json={'name': 'Renamed Widget'})
+
+    assert _search(client, 'search=original') == []
+    assert _search(client, 'search=widget') == ["Renamed Widget"]
+
+    client.delete(f'/api/projects/{project_id}')
+
+    assert _search(client, 'search=widget') == []
+
+
+@pytest.mark.integration
+def test_search_relevance_ordering(client, app):
+    """Test sort=relevance ranks stronger matches first, default stays ID order."""
+    with app.app_context():
+        db.session.add_all([
+            Project(name="Weak", description="A long description that mentions "
+                                             "telemetry once among many other words"),
+            Project(name="Telemetry", description="Telemetry telemetry"),
+        ])
+        db.session.commit()
+
+    assert _search(client, 'search=telemetry') == ["Weak", "Telemetry"]
+    assert _search(client, 'search=telemetry&sort=relevance') == ["Telemetry", "Weak"]
+
+
+@pytest.mark.integration
+def test_search_short_term_falls_back_to_like(client, app):
+    """Test terms shorter than a trigram still match as substrings."""
+    with app.app_context():
+        db.session.add_all([Project(name="Go service"), Project(name="Rust service")])
+        db.session.commit()
+
+    assert _search(client, 'search=go') == ["Go service"]
+
+
+@pytest.mark.integration
+def test_search_without_fts_index_uses_like(client, app):
+    """Test search still works when the FTS index is unavailable."""
+    app.extensions['projects_fts'] = False
+    with app.app_context():
+        db.session.add_all([Project(name="Dashboard"), Project(name="Backend")])
+        db.session.commit()
+
+    assert _search(client, 'search=dash') == ["Dashboard"]
+    assert _search(client, 'search=dash&sort=relevance') == ["Dashboard"]
+
+
+@pytest.mark.integration
+def test_search_treats_fts_syntax_literally(client, app):
+    """Test quotes and FTS operators in the term do not cause errors."""
+    with app.app_context():
+        db.session.add(Project(name='Say "hello" OR NOT'))
+        db.session.commit()
+
+    assert _search(client, 'search="hello" OR') == ['Say "hello" OR NOT']
+    assert _search(client, 'search=NEAR(a b)') == []
+
+
+@pytest.mark.integration
+def test_search_invalid_sort(client):
+    """Test unknown sort values return 400."""
+    response = client.get('/api/projects?sort=bogus')
+
+    assert response.status_code == 400
+
+
+@pytest.mark.integration
+def test_search_relevance_rejected_with_pagination(client):
+    """Test sort=relevance cannot be combined with keyset pagination."""
+    response = client.get('/api/projects?search=abc&sort=relevance&limit=10')
+
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert 'relevance' in data['error']
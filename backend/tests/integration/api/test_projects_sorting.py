@@ -0,0 +1,182 @@
+"""
+Integration tests for the sort parameter on GET /api/projects.
+
+Tests multi-key ascending/descending sorts, sorted keyset pagination and the
+composite filter + sort indexes.
+"""
+
+import pytest
+import json
+from datetime import datetime
+from sqlalchemy import text
+from app.models.project import Project
+from app import db
+
+
+@pytest.fixture
+def projects(app):
+    """Create projects with repeated names and timestamps to exercise tie-breaking."""
+    with app.app_context():
+        for i in range(12):
+            db.session.add(Project(
+                name=f'Project {i % 4}',
+                status='active' if i % 3 else 'paused',
+                project_type='Work' if i % 2 else 'Personal',
+                updated_at=datetime(2024, 1, 1 + i % 3),
+            ))
+        # Timestamps written by the database (no microseconds in the stored text)
+        db.session.add_all([Project(name='Server', status='active') for _ in range(3)])
+        db.session.commit()
+
+
+def _all(client, query):
+    response = client.get(f'/api/projects?{query}')
+    assert response.status_code == 200
+    return json.loads(response.data)
+
+
+def _values(rows, keys):
+    return [tuple(row[field] for field, _ in keys) for row in rows]
+
+
+def _walk_pages(client, query, limit):
+    """Follow next_cursor through every page and return the ids in order."""
+    ids, cursor = [], None
+    while True:
+        url = f'{query}&limit={limit}' + (f'&cursor={cursor}' if cursor else '')
+        page = _all(client, url)
+        ids += [row['id'] for row in page['projects']]
+        cursor = page['next_cursor']
+        if not cursor:
+            return ids
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('sort, keys', [
+    ('name', [('name', False)]),
+    ('-name', [('name', True)]),
+    ('-updated_at', [('updated_at', True)]),
+    ('status,-updated_at', [('status', False), ('updated_at', True)]),
+    ('-created_at,name', [('created_at', True), ('name', False)]),
+    ('-id', [('id', True)]),
+])
+def test_sorted_list(client, projects, sort, keys):
+    """Test sorts order rows like the equivalent stable Python sort."""
+    expected = _all(client, '')
+    for field, descending in reversed(keys):
+        expected.sort(key=lambda row: row[field], reverse=descending)
+
+    rows = _all(client, f'sort={sort}')
+
+    assert sorted(row['id'] for row in rows) == sorted(row['id'] for row in expected)
+    assert _values(rows, keys) == _values(expected, keys)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('sort', ['name', '-name', '-updated_at', 'status,-updated_at',
+                                  'updated_at,-name', '-created_at'])
+@pytest.mark.parametrize('limit', [1, 4, 7])
+def test_sorted_pagination_matches_unpaginated(client, projects, sort, limit):
+    """Test walking sorted pages visits every row once, in the unpaginated order."""
+    unpaginated = [row['id'] for row in _all(client, f'sort={sort}')]
+
+    assert _walk_pages(client, f'sort={sort}', limit) == unpaginated
+
+
+@pytest.mark.integration
+def test_sorted_streams(client, projects):
+    """Test NDJSON and chunked lists follow the requested order."""
+    expected = _all(client, 'sort=-name')
+
+    ndjson = client.get('/api/projects?sort=-name',
+                        headers={'Accept': 'application/x-ndjson'}).data
+    chunked = client.get('/api/projects?sort=-name&stream=true').data
+
+    assert [json.loads(line) for line in ndjson.splitlines()] == expected
+    assert json.loads(chunked) == expected
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('sort', ['organization', 'name,name', 'bogus', '-', 'name,'])
+def test_invalid_sort(client, sort):
+    """Test unknown, nullable or repeated sort keys return 400."""
+    response = client.get(f'/api/projects?sort={sort}')
+
+    assert response.status_code == 400
+    assert 'Invalid sort' in json.loads(response.data)['error']
+
+
+@pytest.mark.integration
+def test_cursor_from_other_sort_rejected(client, projects):
+    """Test a cursor whose values do not fit the sort keys returns 400."""
+    cursor = _all(client, 'sort=-updated_at&limit=2')['next_cursor']
+
+    response = client.get(f'/api/projects?sort=-id&limit=2&cursor={cursor}')
+
+    assert response.status_code == 400
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('query, index', [
+    ('status=active&sort=-updated_at&limit=5', 'ix_projects_status_updated_at'),
+    ('status=active&sort=name', 'ix_projects_status_name'),
+    ('project_type=Work&sort=name&limit=5', 'ix_projects_project_type_name'),
+    ('project_type=Work&sort=-updated_at', 'ix_projects_project_type_updated_at'),
+])
+def test_filtered_sorts_avoid_temp_btree(client, projects, query, index, statement_recorder):
+    """Test filtered, sorted lists are read in index order without a sort step."""
+    details = _list_plan(client, query, statement_recorder)
+
+    assert index in details
+    assert 'TEMP B-TREE' not in details
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('query, seek', [
+    ('sort=name', 'ix_projects_name (name>?)'),
+    ('sort=-updated_at', 'ix_projects_updated_at (updated_at<?)'),
+    ('status=active&sort=-updated_at',
+     'ix_projects_status_updated_at (status=? AND updated_at<?)'),
+])
+def test_cursor_pages_seek_on_index(client, projects, query, seek, statement_recorder):
+    """Test a later page starts an index range at the cursor instead of scanning."""
+    cursor = _all(client, f'{query}&limit=2')['next_cursor']
+
+    details = _list_plan(client, f'{query}&limit=2&cursor={cursor}', statement_recorder)
+
+    assert seek in details
+    assert 'TEMP B-TREE' not in details
+
+
+@pytest.mark.integration
+def test_mixed_direction_cursor_seeks_on_first_key(client, projects, statement_recorder):
+    """Test a mixed-direction sort still bounds the first key for the planner."""
+    cursor = _all(client, 'sort=name,-updated_at&limit=2')['next_cursor']
+
+    details = _list_plan(client, f'sort=name,-updated_at&limit=2&cursor={cursor}',
+                         statement_recorder)
+
+    assert 'ix_projects_name (name>?)' in details
+
+
+def _list_plan(client, query, statement_recorder):
+    """Return the query plan of the list SELECT for a request, joined into one string."""
+    with statement_recorder:
+        client.get(f'/api/projects?{query}')
+
+    statement, parameters = [(s, p) for s, p in statement_recorder.executed if 'ORDER BY' in s][-1]
+    with db.engine.connect() as connection:
+        plan = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).fetchall()
+    return ' | '.join(row[-1] for row in plan)
+
+
+@pytest.mark.integration
+def test_composite_indexes_exist(app):
+    """Test the model declares the filter + sort indexes."""
+    with app.app_context():
+        names = {row[0] for row in db.session.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index'")
+        )}
+
+    assert {'ix_projects_status_updated_at', 'ix_projects_status_name',
+            'ix_projects_project_type_updated_at', 'ix_projects_project_type_name'} <= names
@@ -0,0 +1,138 @@
+"""
+Integration tests for stale-while-revalidate on GET /api/projects.
+
+Tests PROJECTS_STALE_WHILE_REVALIDATE with the list result cache.
+"""
+
+import pytest
+import json
+from app.models.project import Project
+from app.services.result_cache import ListResultCache
+from app import db
+
+
+@pytest.fixture
+def clock():
+    """Controllable monotonic clock for the result cache."""
+    return [1000.0]
+
+
+@pytest.fixture
+def swr(app, clock):
+    """Enable stale-while-revalidate with a 30 second window."""
+    app.config['PROJECTS_STALE_WHILE_REVALIDATE'] = 30
+    app.extensions['projects_results'] = ListResultCache(
+        64, 60, max_stale=30, clock=lambda: clock[0]
+    )
+    return app.extensions['projects_results']
+
+
+@pytest.fixture
+def projects(app):
+    """Create 3 projects."""
+    with app.app_context():
+        db.session.add_all([Project(name=f'Project {i}') for i in range(3)])
+        db.session.commit()
+
+
+def _list(client):
+    """GET the list and close the response, running any scheduled refresh."""
+    response = client.get('/api/projects')
+    response.close()
+    return response
+
+
+@pytest.mark.integration
+def test_stale_list_served_then_refreshed(client, swr, projects, clock):
+    """Test the first list after a write is the stale copy, refreshed once it is sent."""
+    _list(client)
+    client.post('/api/projects', json={'name': 'New'})
+    clock[0] += 4
+
+    stale = client.get('/api/projects')
+    assert len(json.loads(stale.data)) == 3
+    assert stale.headers['Warning'] == '110 - "Response is Stale"'
+    assert stale.headers['Age'] == '4'
+    stale.close()
+
+    fresh = _list(client)
+    assert len(json.loads(fresh.data)) == 4
+    assert 'Warning' not in fresh.headers
+    assert 'Age' not in fresh.headers
+    assert swr.stale_hits == 1
+
+
+@pytest.mark.integration
+def test_one_refresh_for_concurrent_stale_reads(client, swr, projects):
+    """Test only the first stale read schedules a refresh."""
+    _list(client)
+    client.post('/api/projects', json={'name': 'New'})
+
+    first = client.get('/api/projects')
+    second = client.get('/api/projects')
+    misses = swr.misses
+    second.close()
+    assert swr.misses == misses  # The second response refreshes nothing
+    first.close()
+    assert swr.misses == misses + 1
+
+    assert len(json.loads(_list(client).data)) == 4
+    assert swr.stale_hits == 2
+
+
+@pytest.mark.integration
+def test_stale_window_bounds_staleness(client, swr, projects, clock):
+    """Test a copy that went stale longer ago than the window is not served."""
+    _list(client)
+    with client.application.app_context():
+        db.session.add(Project(name='Outside the API'))  # No generation bump
+        db.session.commit()
+    clock[0] += 60 + 31  # TTL, then past the 30 second window
+
+    response = _list(client)
+
+    assert len(json.loads(response.data)) == 4
+    assert 'Warning' not in response.headers
+
+
+@pytest.mark.integration
+def test_expired_entries_served_stale(client, swr, projects, clock):
+    """Test an entry past its TTL is served stale while it is refreshed."""
+    _list(client)
+    clock[0] += 70
+
+    response = _list(client)
+
+    assert response.headers['Warning'] == '110 - "Response is Stale"'
+    assert response.headers['Age'] == '70'
+    assert 'Warning' not in _list(client).headers
+
+
+@pytest.mark.integration
+def test_refresh_failure_allows_retry(client, swr, projects, monkeypatch):
+    """Test a failed refresh is logged and the next stale read schedules another."""
+    _list(client)
+    client.post('/api/projects', json={'name': 'New'})
+
+    def fail(*args, **kwargs):
+        raise RuntimeError('database went away')
+
+    monkeypatch.setattr(ListResultCache, 'get_or_build', fail)
+    _list(client)
+    assert swr._refreshing == set()
+
+    monkeypatch.undo()
+    _list(client)
+    assert len(json.loads(_list(client).data)) == 4
+
+
+@pytest.mark.integration
+def test_stale_while_revalidate_disabled_by_default(client, projects):
+    """Test lists are never stale unless enabled."""
+    _list(client)
+    client.post('/api/projects', json={'name': 'New'})
+
+    response = _list(client)
+
+    assert len(json.loads(response.data)) == 4
+    assert 'Warning' not in response.headers
@@ -0,0 +1,92 @@
+"""
+Integration tests for streamed GET /api/projects responses.
+
+Tests the NDJSON (Accept: application/x-ndjson) and chunked JSON array
+(stream=true) response modes.
+"""
+
+import pytest
+import json
+from app.models.project import Project
+from app import db
+
+
+@pytest.fixture
+def projects(app):
+    """Create five projects, two of them paused, and return their IDs."""
+    with app.app_context():
+        created = [
+            Project(name=f"Project {i}", status='paused' if i % 2 else 'active')
+            for i in range(5)
+        ]
+        db.session.add_all(created)
+        db.session.commit()
+        return [project.id for project in created]
+
+
+@pytest.mark.integration
+def test_list_projects_ndjson(client, projects):
+    """Test Accept: application/x-ndjson streams one project per line."""
+    response = client.get('/api/projects', headers={'Accept': 'application/x-ndjson'})
+
+    assert response.status_code == 200
+    assert 'Content-Length' not in response.headers  # Chunked, not buffered
+    assert response.mimetype == 'application/x-ndjson'
+
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line)['id'] for line in lines] == projects
+
+
+@pytest.mark.integration
+def test_list_projects_ndjson_with_filters(client, projects):
+    """Test NDJSON streaming applies list filters."""
+    response = client.get('/api/projects?status=paused',
+                          headers={'Accept': 'application/x-ndjson'})
+
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line)['status'] for line in lines] == ['paused', 'paused']
+
+
+@pytest.mark.integration
+def test_list_projects_stream_json_array_matches_buffered(client, projects):
+    """Test stream=true returns the same projects as the buffered response."""
+    buffered = json.loads(client.get('/api/projects').data)
+
+    response = client.get('/api/projects?stream=true')
+
+    assert response.status_code == 200
+    assert 'Content-Length' not in response.headers  # Chunked, not buffered
+    assert response.mimetype == 'application/json'
+    assert json.loads(response.data) == buffered
+
+
+@pytest.mark.integration
+def test_list_projects_stream_spans_batches(client, app, projects):
+    """Test streaming joins multiple yield_per batches into one valid array."""
+    app.config['PROJECTS_STREAM_BATCH_SIZE'] = 2
+
+    array = json.loads(client.get('/api/projects?stream=true').data)
+    lines = client.get('/api/projects', headers={'Accept': 'application/x-ndjson'}) \
+        .get_data(as_text=True).splitlines()
+
+    assert [p['id'] for p in array] == projects
+    assert len(lines) == len(projects)
+
+
+@pytest.mark.integration
+def test_list_projects_stream_empty(client):
+    """Test streamed responses are well-formed when nothing matches."""
+    array = client.get('/api/projects?stream=true')
+    ndjson = client.get('/api/projects', headers={'Accept': 'application/x-ndjson'})
+
+    assert json.loads(array.data) == []
+    assert ndjson.get_data(as_text=True) == ''
+
+
+@pytest.mark.integration
+def test_list_projects_default_accept_is_not_streamed(client, projects):
+    """Test a wildcard Accept header keeps the buffered JSON response."""
+    response = client.get('/api/projects', headers={'Accept': '*/*'})
+
+    assert 'Content-Length' in response.headers
+    assert response.mimetype == 'application/json'
@@ -79,19 +79,20 @@ def test_delete_project_exception_handling(client, app, monkeypatch):
 
 @pytest.mark.integration
 def test_import_projects_per_project_exception_handling(client, app, monkeypatch):
-    """Test exception handling for individual project import errors (lines 408-416)."""
-    # Mock Project creation to raise an exception for one project
-    original_add = db.session.add
-    
+    """Test exception handling for individual project import errors."""
+    # Mock row construction to raise an exception for one project
+    from app.services import project_import
+    original_build = project_import.build_import_row
+
     call_count = [0]
-    
-    def mock_add(obj):
+
+    def mock_build(item):
         call_count[0] += 1
         if call_count[0] == 1:  # First project fails
             raise ValueError("Invalid project data")
-        original_add(obj)
-    
-    monkeypatch.setattr(db.session, 'add', mock_add)
+        return original_build(item)
+
+    monkeypatch.setattr(project_import, 'build_import_row', mock_build)
     
     response = client.post('/api/projects/import',
                           json={
@@ -108,9 +109,6 @@ def test_import_projects_per_project_exception_handling(client, app, monkeypatch
     assert data['skipped'] == 1  # One project skipped
     assert len(data['errors']) == 1
     assert 'error' in data['errors'][0]
-    
-    # Restore original add
-    monkeypatch.setattr(db.session, 'add', original_add)
 
 
 @pytest.mark.integration
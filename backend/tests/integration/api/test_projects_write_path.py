@@ -0,0 +1,120 @@
+"""
+Integration tests for the single round-trip create and update write path.
+
+Tests that POST and PATCH write without a duplicate-path lookup, that the
+unique index on path turns duplicates into 409 responses, and that concurrent
+requests for the same path still yield exactly one project.
+"""
+
+import pytest
+import json
+import threading
+from app.models.project import Project
+from app import create_app, db
+from config import TestingConfig, config
+
+
+@pytest.fixture
+def file_app(tmp_path, monkeypatch):
+    """App on a file-backed SQLite database, so each thread gets its own connection."""
+
+    class FileTestingConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'projects.db'}"
+
+    monkeypatch.setitem(config, 'file_testing', FileTestingConfig)
+    app = create_app('file_testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+def _statements(recorder, client, method, url, body):
+    """Send a request and return it with the leading keyword of every statement it executes."""
+    with recorder:
+        response = client.open(url, method=method, json=body)
+    return response, recorder.verbs()
+
+
+@pytest.mark.integration
+def test_create_is_one_insert(client, statement_recorder):
+    """Test POST writes with INSERT ... RETURNING plus the generation bump, nothing else."""
+    response, statements = _statements(statement_recorder, client, 'POST', '/api/projects',
+                                       {'name': 'New', 'path': '/new'})
+
+    assert response.status_code == 201
+    # Previously: duplicate-path SELECT, INSERT, generation bump, reload SELECT
+    assert statements == ['INSERT', 'UPDATE']
+    data = json.loads(response.data)
+    assert response.headers['Location'] == f"/api/projects/{data['id']}"
+    assert data == json.loads(client.get(f"/api/projects/{data['id']}").data)
+
+
+@pytest.mark.integration
+def test_update_is_one_update(client, statement_recorder):
+    """Test PATCH writes with UPDATE ... RETURNING plus the generation bump, nothing else."""
+    project_id = json.loads(client.post('/api/projects', json={'name': 'Old'}).data)['id']
+
+    response, statements = _statements(statement_recorder, client, 'PATCH',
+                                       f'/api/projects/{project_id}',
+                                       {'name': 'Renamed', 'path': '/renamed'})
+
+    assert response.status_code == 200
+    # Previously: load, duplicate-path SELECT, UPDATE, generation bump, reload SELECT
+    assert statements == ['UPDATE', 'UPDATE']
+    assert json.loads(response.data)['name'] == 'Renamed'
+    assert response.headers['ETag'] == '"2"'
+
+
+@pytest.mark.integration
+def test_duplicate_path_rejected_by_unique_index(client, statement_recorder):
+    """Test duplicate paths on create and update are 409s without a lookup."""
+    client.post('/api/projects', json={'name': 'First', 'path': '/taken'})
+    other = json.loads(client.post('/api/projects', json={'name': 'Other'}).data)['id']
+
+    created, statements = _statements(statement_recorder, client, 'POST', '/api/projects',
+                                      {'name': 'Second', 'path': '/taken'})
+    updated = client.patch(f'/api/projects/{other}', json={'path': '/taken'})
+
+    assert statements == ['INSERT']
+    for response in (created, updated):
+        assert response.status_code == 409
+        assert json.loads(response.data)['error'] == 'Project with this path already exists'
+    assert json.loads(client.get(f'/api/projects/{other}').data)['path'] is None
+
+
+@pytest.mark.integration
+def test_update_missing_project(client, statement_recorder):
+    """Test PATCH of an unknown id is a 404 from the UPDATE alone."""
+    response, statements = _statements(statement_recorder, client, 'PATCH', '/api/projects/999',
+                                       {'name': 'Ghost'})
+
+    assert response.status_code == 404
+    assert statements == ['UPDATE']
+
+
+@pytest.mark.integration
+def test_concurrent_creates_with_same_path(file_app):
+    """Test concurrent POSTs for one path create exactly one project; the rest get 409."""
+    workers = 8
+    barrier = threading.Barrier(workers)
+    responses = []
+
+    def create(i):
+        client = file_app.test_client()
+        barrier.wait()
+        response = client.post('/api/projects', json={'name': f'Racer {i}', 'path': '/race'})
+        responses.append((response.status_code, json.loads(response.data)))
+
+    threads = [threading.Thread(target=create, args=(i,)) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    statuses = sorted(status for status, _ in responses)
+    assert statuses == [201] + [409] * (workers - 1)
+    assert all(body['error'] == 'Project with this path already exists'
+               for status, body in responses if status == 409)
+    assert db.session.query(Project).filter_by(path='/race').count() == 1
@@ -0,0 +1,136 @@
+"""
+Integration tests for gzip/deflate request bodies.
+
+Tests the request decompression middleware installed by create_app against the
+import and create endpoints.
+"""
+
+import pytest
+import gzip
+import json
+import zlib
+from app.models.project import Project
+
+
+def _projects(count):
+    """Build an import payload with count projects."""
+    return {'projects': [{'name': f'Project {i}', 'path': f'/p/{i}'} for i in range(count)]}
+
+
+def _post(client, url, body, encoding, content_type='application/json'):
+    """POST a compressed body with the given Content-Encoding."""
+    return client.post(url, data=body, content_type=content_type,
+                       headers={'Content-Encoding': encoding})
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('encoding, compress', [
+    ('gzip', gzip.compress),
+    ('x-gzip', gzip.compress),
+    ('deflate', zlib.compress),
+])
+def test_import_compressed_json(client, encoding, compress):
+    """Test a compressed JSON import is inflated before the view reads it."""
+    body = compress(json.dumps(_projects(50)).encode())
+
+    response = _post(client, '/api/projects/import', body, encoding)
+
+    assert response.status_code == 201
+    assert json.loads(response.data)['imported'] == 50
+    assert Project.query.count() == 50
+
+
+@pytest.mark.integration
+def test_import_concatenated_gzip_members(client):
+    """Test a body made of several gzip members is read as one stream."""
+    text = json.dumps(_projects(3)).encode()
+    body = gzip.compress(text[:10]) + gzip.compress(text[10:])
+
+    response = _post(client, '/api/projects/import', body, 'gzip')
+
+    assert response.status_code == 201
+    assert Project.query.count() == 3
+
+
+@pytest.mark.integration
+def test_import_compressed_ndjson(client):
+    """Test a gzipped NDJSON import streams through the decompressor."""
+    lines = ''.join(json.dumps({'name': f'P{i}'}) + '\n' for i in range(10))
+
+    response = _post(client, '/api/projects/import', gzip.compress(lines.encode()), 'gzip',
+                     content_type='application/x-ndjson')
+
+    summary = json.loads(response.get_data(as_text=True).splitlines()[-1])
+    assert summary['imported'] == 10
+    assert 'error' not in summary
+
+
+@pytest.mark.integration
+def test_create_project_compressed(client):
+    """Test single-project create also accepts a compressed body."""
+    body = gzip.compress(json.dumps({'name': 'Zipped'}).encode())
+
+    response = _post(client, '/api/projects', body, 'gzip')
+
+    assert response.status_code == 201
+    assert json.loads(response.data)['name'] == 'Zipped'
+
+
+@pytest.mark.integration
+def test_decompressed_size_limit(client, app):
+    """Test a body that inflates past the limit is rejected with 413."""
+    app.config['MAX_DECOMPRESSED_REQUEST_SIZE'] = 1024
+    body = gzip.compress(json.dumps(_projects(100)).encode())
+    assert len(body) < 1024
+
+    response = _post(client, '/api/projects/import', body, 'gzip')
+
+    assert response.status_code == 413
+    assert 'exceeds 1024 bytes' in json.loads(response.data)['error']
+    assert Project.query.count() == 0
+
+
+@pytest.mark.integration
+def test_decompressed_size_limit_ndjson(client, app):
+    """Test an oversized NDJSON upload ends the report with an error line."""
+    app.config['MAX_DECOMPRESSED_REQUEST_SIZE'] = 200 * 1024
+    app.config['IMPORT_BATCH_SIZE'] = 100
+    lines = ''.join(json.dumps({'name': f'P{i}', 'description': 'x' * 100}) + '\n'
+                    for i in range(5000))
+
+    response = _post(client, '/api/projects/import', gzip.compress(lines.encode()), 'gzip',
+                     content_type='application/x-ndjson')
+
+    summary = json.loads(response.get_data(as_text=True).splitlines()[-1])
+    assert summary['done'] is True
+    assert 'exceeds' in summary['error']
+    assert 0 < summary['imported'] < 5000
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('body', [
+    b'not gzip at all',
+    gzip.compress(b'{"projects": []}')[:-12],
+])
+def test_import_corrupt_compressed_body(client, body):
+    """Test invalid or truncated compressed bodies are rejected with 400."""
+    response = _post(client, '/api/projects/import', body, 'gzip')
+
+    assert response.status_code == 400
+
+
+@pytest.mark.integration
+def test_unsupported_content_encoding(client):
+    """Test an unknown Content-Encoding is rejected with 415 before the view runs."""
+    response = _post(client, '/api/projects/import', b'...', 'br')
+
+    assert response.status_code == 415
+    assert Project.query.count() == 0
+
+
+@pytest.mark.integration
+def test_identity_content_encoding(client):
+    """Test Content-Encoding: identity passes the body through unchanged."""
+    response = _post(client, '/api/projects/import', json.dumps(_projects(1)), 'identity')
+
+    assert response.status_code == 201
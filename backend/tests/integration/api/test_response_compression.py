@@ -0,0 +1,124 @@
+"""
+Integration tests for negotiated response compression.
+
+Tests the after_request hook from app.compression against GET /api/projects.
+"""
+
+import pytest
+import gzip
+import json
+from app import db, compression
+from app.models.project import Project
+
+
+@pytest.fixture
+def many_projects(app):
+    """Create enough projects for the list response to pass COMPRESS_MIN_SIZE."""
+    with app.app_context():
+        db.session.add_all([
+            Project(name=f'Project {i}', description='Dashboard row ' * 5) for i in range(50)
+        ])
+        db.session.commit()
+
+
+@pytest.fixture
+def gzip_only(monkeypatch):
+    """Pretend no zstd module is installed."""
+    monkeypatch.setattr(compression, '_zstd', None)
+
+
+@pytest.mark.integration
+def test_list_gzip_compressed(client, many_projects, gzip_only):
+    """Test a large list is gzip-encoded when the client accepts gzip."""
+    plain = client.get('/api/projects')
+    response = client.get('/api/projects', headers={'Accept-Encoding': 'gzip'})
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert int(response.headers['Content-Length']) == len(response.data)
+    assert len(response.data) < len(plain.data)
+    assert json.loads(gzip.decompress(response.data)) == json.loads(plain.data)
+
+
+@pytest.mark.integration
+def test_list_not_compressed_without_accept_encoding(client, many_projects):
+    """Test clients that do not accept an encoding get the identity body."""
+    response = client.get('/api/projects')
+
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert len(json.loads(response.data)) == 50
+
+
+@pytest.mark.integration
+def test_small_response_not_compressed(client):
+    """Test responses under COMPRESS_MIN_SIZE are sent as-is."""
+    response = client.get('/api/projects', headers={'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in response.headers
+    assert json.loads(response.data) == []
+
+
+@pytest.mark.integration
+def test_gzip_refused_by_quality(client, many_projects, gzip_only):
+    """Test gzip;q=0 disables compression."""
+    response = client.get('/api/projects', headers={'Accept-Encoding': 'gzip;q=0, br'})
+
+    assert 'Content-Encoding' not in response.headers
+
+
+@pytest.mark.integration
+def test_streamed_list_not_compressed(client, many_projects):
+    """Test streamed responses pass through the hook untouched."""
+    response = client.get('/api/projects?stream=true', headers={'Accept-Encoding': 'gzip'})
+
+    assert 'Content-Encoding' not in response.headers
+    assert len(json.loads(response.data)) == 50
+
+
+@pytest.mark.integration
+def test_compressed_body_cache(client, app, many_projects, gzip_only):
+    """Test repeated identical lists reuse the cached body and changes miss it."""
+    cache = app.extensions['response_compression']
+    headers = {'Accept-Encoding': 'gzip'}
+
+    first = client.get('/api/projects', headers=headers)
+    second = client.get('/api/projects', headers=headers)
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert first.data == second.data
+
+    client.post('/api/projects', json={'name': 'New one'})
+    third = client.get('/api/projects', headers=headers)
+    assert cache.misses == 2
+    assert len(json.loads(gzip.decompress(third.data))) == 51
+
+
+@pytest.mark.integration
+def test_compressed_body_cache_is_bounded(client, app, many_projects, gzip_only):
+    """Test the cache evicts least recently used bodies past COMPRESS_CACHE_SIZE."""
+    cache = app.extensions['response_compression']
+    cache.max_entries = 2
+
+    for status in ('active', 'paused', 'completed', ''):
+        client.get(f'/api/projects?status={status}', headers={'Accept-Encoding': 'gzip'})
+
+    assert len(cache) <= 2
+
+
+@pytest.mark.integration
+def test_zstd_preferred_when_available(client, many_projects, monkeypatch):
+    """Test zstd wins over gzip at equal quality when a zstd module is present."""
+    class FakeZstd:
+        @staticmethod
+        def compress(data, level):
+            return b'zstd:' + data
+
+    monkeypatch.setattr(compression, '_zstd', FakeZstd)
+
+    response = client.get('/api/projects', headers={'Accept-Encoding': 'gzip, zstd'})
+    assert response.headers['Content-Encoding'] == 'zstd'
+    assert response.data.startswith(b'zstd:')
+
+    response = client.get('/api/projects',
+                          headers={'Accept-Encoding': 'gzip, zstd;q=0.5'})
+    assert response.headers['Content-Encoding'] == 'gzip'
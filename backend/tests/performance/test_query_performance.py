@@ -209,3 +209,41 @@ def test_combined_filters_performance(app):
         assert elapsed < 0.1  # Should be < 100ms
         print(f"\nCombined filters query: {elapsed*1000:.2f}ms for {len(result)} projects")
 
+
+@pytest.mark.performance
+def test_bitmap_index_filter_performance(app, client, statement_recorder):
+    """Test combined filters answered from the bitmap index against SQL on 10,000 projects."""
+    # Otherwise the repeated request would be answered by the result cache
+    app.config['PROJECTS_RESULT_CACHE_SIZE'] = 0
+    client.post('/api/projects/import', json={'projects': [
+        {
+            'name': f"Project {i}",
+            'status': ['active', 'paused', 'completed', 'cancelled'][i % 4],
+            'organization': f"org-{i % 20}",
+            'classification': ['primary', 'secondary'][i % 2],
+        }
+        for i in range(10000)
+    ]})
+    url = '/api/projects?status=active&organization=org-4&classification=primary'
+
+    start = time.time()
+    expected = client.get(url).get_json()
+    sql_elapsed = time.time() - start
+
+    app.config['PROJECTS_BITMAP_INDEX'] = True
+    start = time.time()
+    client.get('/api/projects').close()  # Cold: answered by SQL, builds the index on close
+    build_elapsed = time.time() - start
+
+    with statement_recorder:
+        start = time.time()
+        result = client.get(url).get_json()
+        index_elapsed = time.time() - start
+
+    assert statement_recorder.verbs(table='projects') == []  # Answered by the index
+    assert result == expected
+    assert len(result) == 500
+    assert index_elapsed < sql_elapsed
+    print(f"\nCombined filter via SQL: {sql_elapsed*1000:.2f}ms, "
+          f"via bitmap index: {index_elapsed*1000:.2f}ms "
+          f"(cold list + index build: {build_elapsed*1000:.2f}ms)")
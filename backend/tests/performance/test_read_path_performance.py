@@ -0,0 +1,98 @@
+"""
+Performance tests for the ORM-free project read path.
+
+Compares hydrating Project instances and calling to_dict() against selecting
+plain rows and serializing them with row_serializer(), at 10k and 100k rows,
+and list responses assembled from cached fragments against encoding every row.
+"""
+
+import pytest
+import time
+from datetime import datetime
+from app.models.project import Project, row_serializer, serialized_columns
+from app import db
+
+
+def _insert_projects(count):
+    """Bulk insert count projects with a Core executemany."""
+    now = datetime(2024, 1, 1)
+    db.session.execute(Project.__table__.insert(), [
+        {
+            'name': f'Project {i}',
+            'path': f'/test/path/{i}',
+            'description': f'Description for project {i}',
+            'status': 'active' if i % 2 == 0 else 'paused',
+            'organization': 'work' if i % 3 == 0 else 'personal',
+            'classification': 'primary' if i % 4 == 0 else 'secondary',
+            'created_at': now,
+            'updated_at': now,
+        }
+        for i in range(count)
+    ])
+    db.session.commit()
+
+
+def _orm_read():
+    projects = Project.query.order_by(Project.id).all()
+    return [project.to_dict() for project in projects]
+
+
+def _core_read():
+    rows = db.session.execute(db.select(*serialized_columns()).order_by(Project.id))
+    serialize = row_serializer()
+    return [serialize(row) for row in rows]
+
+
+def _best_of(read, repeat=3):
+    """Return (fastest elapsed seconds, result) over repeat runs."""
+    best, result = None, None
+    for _ in range(repeat):
+        db.session.expunge_all()  # Each ORM run hydrates fresh instances
+        start = time.perf_counter()
+        result = read()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize('count', [10_000, pytest.param(100_000, marks=pytest.mark.slow)])
+def test_core_read_path_faster_than_orm(app, count):
+    """Test the Core row path serializes the same rows faster than the ORM path."""
+    with app.app_context():
+        _insert_projects(count)
+
+        orm_elapsed, orm_rows = _best_of(_orm_read)
+        core_elapsed, core_rows = _best_of(_core_read)
+
+        assert core_rows == orm_rows
+        assert len(core_rows) == count
+        assert core_elapsed < orm_elapsed
+        print(f"\nRead {count} projects: ORM {orm_elapsed*1000:.0f}ms, "
+              f"Core {core_elapsed*1000:.0f}ms ({orm_elapsed / core_elapsed:.1f}x)")
+
+
+@pytest.mark.performance
+def test_fragment_cache_list_performance(app, client):
+    """Test a warm fragment cache lists 10k unchanged projects faster than encoding them."""
+    with app.app_context():
+        _insert_projects(10_000)
+
+    def timed_list():
+        start = time.perf_counter()
+        response = client.get('/api/projects')
+        return time.perf_counter() - start, response
+
+    app.config['PROJECTS_RESULT_CACHE_SIZE'] = 0  # Time the fragment cache on its own
+    app.config['PROJECTS_FRAGMENT_CACHE_BYTES'] = 0
+    uncached_elapsed, uncached = timed_list()
+
+    app.config['PROJECTS_FRAGMENT_CACHE_BYTES'] = 32 * 1024 * 1024
+    timed_list()  # Fill the cache
+    cached_elapsed, cached = timed_list()
+
+    assert cached.data == uncached.data
+    assert app.extensions['projects_fragments'].hits == 10_000
+    assert cached_elapsed < uncached_elapsed
+    print(f"\nList 10000 projects: uncached {uncached_elapsed*1000:.0f}ms, "
+          f"cached fragments {cached_elapsed*1000:.0f}ms")
@@ -0,0 +1,128 @@
+"""
+Unit tests for the list result cache.
+
+Tests ListResultCache generation handling, TTL expiry, the LRU bound and
+single-flight builds.
+"""
+
+import threading
+import time
+
+from app.services.result_cache import ListResultCache
+
+
+def test_result_cache_ttl_and_bound():
+    """Test entries expire after the TTL and the LRU bound holds."""
+    now = [0.0]
+    cache = ListResultCache(max_entries=2, ttl=10, clock=lambda: now[0])
+
+    cache.put(1, 'a', 'A')
+    cache.put(1, 'b', 'B')
+    cache.put(1, 'c', 'C')
+    assert (cache.get(1, 'a'), cache.get(1, 'c')) == (None, 'C')
+
+    now[0] = 11
+    assert cache.get(1, 'c') is None
+
+    cache.put(1, 'd', 'D')
+    assert cache.get(2, 'd') is None  # A newer generation drops everything
+    assert len(cache) == 0
+    cache.put(1, 'e', 'E')  # Built at an older generation: not stored
+    assert len(cache) == 0
+
+
+def _concurrently(count, target):
+    """Run target in count threads and return their results."""
+    results = [None] * count
+
+    def run(index):
+        results[index] = target()
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results
+
+
+def test_concurrent_misses_share_one_build():
+    """Test concurrent identical misses run a single build and share its value."""
+    cache = ListResultCache(max_entries=4, ttl=60)
+    builds = []
+    release = threading.Event()
+
+    def build():
+        builds.append(1)
+        release.wait(5)
+        return 'leader response', b'body'
+
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+    results = _concurrently(8, lambda: cache.get_or_build(1, 'key', build, wait_timeout=5))
+
+    assert len(builds) == 1
+    assert {value for _, value in results} == {b'body'}
+    assert [result for result, _ in results].count('leader response') == 1
+    assert cache.coalesced + cache.hits == 7
+    assert cache.get(1, 'key') == b'body'
+
+
+def test_waiters_build_when_leader_fails():
+    """Test waiters fall back to their own build when the leader raises."""
+    cache = ListResultCache(max_entries=4, ttl=60)
+    calls = []
+    started = threading.Event()
+
+    def failing_build():
+        calls.append('leader')
+        started.set()
+        time.sleep(0.2)
+        raise RuntimeError('database went away')
+
+    def build():
+        calls.append('waiter')
+        return 'own response', b'body'
+
+    def leader():
+        try:
+            cache.get_or_build(1, 'key', failing_build, wait_timeout=5)
+        except RuntimeError:
+            return 'failed'
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    started.wait(5)
+    result = cache.get_or_build(1, 'key', build, wait_timeout=5)
+    thread.join(timeout=10)
+
+    assert result == ('own response', b'body')
+    assert calls == ['leader', 'waiter']
+    assert cache.coalesced == 0
+
+
+def test_uncacheable_results_are_not_shared():
+    """Test a build without a value (an error response) is not shared or cached."""
+    cache = ListResultCache(max_entries=4, ttl=60)
+
+    assert cache.get_or_build(1, 'key', lambda: ('400 response', None), 5) == ('400 response', None)
+    assert len(cache) == 0
+
+
+def test_stale_copies_within_window():
+    """Test invalidated entries are offered stale, with one refresh, inside max_stale."""
+    now = [0.0]
+    cache = ListResultCache(max_entries=4, ttl=60, max_stale=10, clock=lambda: now[0])
+    cache.put(1, 'key', 'old')
+
+    now[0] = 3
+    assert cache.get_stale(2, 'key') == ('old', 3, True)
+    assert cache.get_stale(2, 'key') == ('old', 3, False)  # A refresh is already running
+    cache.refresh_done('key')
+
+    now[0] = 14
+    assert cache.get_stale(2, 'key') is None  # Stale since t=3: past the window
+
+    cache.put(2, 'key', 'new')
+    assert cache.get_stale(2, 'key') is None  # Fresh entries are never offered stale
+    assert cache.get(2, 'key') == 'new'
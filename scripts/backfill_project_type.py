@@ -7,6 +7,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
 from app import create_app, db
 from app.models.project import Project
+from app.services.change_counter import bump_projects_generation
 
 
 def classify_project(project):
@@ -58,6 +59,8 @@ def backfill(dry_run=True):
                 project.project_type = new_type
         
         if not dry_run:
+            # Workers' cached lists and bitmap indexes go stale with this write
+            bump_projects_generation()
             db.session.commit()
         
         # Print report